@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserProfile, Offers, OfferDetails, Order, Review
+from .models import UserProfile, Offers, OfferDetails, Order, Review, ImageTask, UserImportJob
 
 
 class UserProfileAdmin(admin.ModelAdmin):
@@ -7,10 +7,19 @@ class UserProfileAdmin(admin.ModelAdmin):
     search_fields = ('user__username', 'type')     
 class OrderAdmin(admin.ModelAdmin):
     list_display = ('id', 'offer', 'business_user')  
+class ImageTaskAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'object_id', 'source', 'staged', 'status', 'attempts', 'updated_at')
+    list_filter = ('status', 'kind')
+class UserImportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'created_by', 'rows', 'status', 'updated_at')
+    list_filter = ('status',)
+    exclude = ('records',)
     
     
 admin.site.register(UserProfile, UserProfileAdmin)
 admin.site.register(Offers)
 admin.site.register(OfferDetails)
 admin.site.register(Order,OrderAdmin)
-admin.site.register(Review)
\ No newline at end of file
+admin.site.register(Review)
+admin.site.register(ImageTask, ImageTaskAdmin)
+admin.site.register(UserImportJob, UserImportJobAdmin)
\ No newline at end of file
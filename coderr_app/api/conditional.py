@@ -0,0 +1,91 @@
+import hashlib
+from operator import attrgetter
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    Mixin für ViewSets/Generic Views, das `list` und `retrieve` um Conditional GET erweitert.
+
+    **Details**:
+    - Detail: Die Validatoren werden vor dem Serialisieren mit einer schlanken Query bestimmt
+      (`last_modified_field` plus `conditional_related_fields`, z. B. die Namen des Besitzers,
+      die in der Antwort eingebettet sind, aber den Zeitstempel des Objekts nicht ändern).
+    - Liste: Das ETag entsteht aus den ohnehin geladenen Zeilen der Seite (`pk`, Zeitstempel,
+      verknüpfte Felder) und den Paginierungsangaben (`count`, `next`, `previous`); es gibt keine
+      zusätzliche Query, gespart wird das Serialisieren und Rendern.
+    - `If-None-Match` bzw. `If-Modified-Since` werden über Djangos
+      `get_conditional_response` ausgewertet und mit `304 Not Modified` beantwortet.
+    - `Last-Modified` wird nur gesetzt, wenn die Antwort allein vom Zeitstempel des Objekts
+      abhängt: nicht bei Listen (gelöschte Einträge verschieben keinen Zeitstempel) und nicht
+      bei `conditional_related_fields` (z. B. hat `User` keinen Zeitstempel).
+    """
+    last_modified_field = 'updated_at'
+    conditional_related_fields = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+
+        parts = [self.row_validator(row) for row in rows]
+        if page is not None:
+            envelope = self.get_paginated_response([]).data
+            parts.append([(key, value) for key, value in envelope.items() if key != 'results'])
+        etag = self.make_etag(request, None, *parts)
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        return self.set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        validators = self.get_queryset().prefetch_related(None).filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        ).values_list(self.last_modified_field, *self.conditional_related_fields).first()
+        if validators is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        last_modified, *related = validators
+        etag = self.make_etag(request, last_modified, *related)
+        timestamp = None if self.conditional_related_fields else int(last_modified.timestamp())
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        return self.set_validators(response, etag, timestamp)
+
+    def row_validator(self, row):
+        """
+        Validator einer geladenen Zeile; verknüpfte Felder werden über die bereits geladenen
+        Objekte (`select_related`) gelesen.
+        """
+        related = [attrgetter(field.replace('__', '.'))(row) for field in self.conditional_related_fields]
+        return (row.pk, getattr(row, self.last_modified_field).isoformat(), *related)
+
+    def make_etag(self, request, last_modified, *parts):
+        """
+        Erzeugt ein schwaches ETag aus Pfad inkl. Query-Parametern, Zeitstempel und weiteren Teilen.
+        """
+        stamp = last_modified.isoformat() if last_modified else ''
+        raw = '|'.join([request.get_full_path(), stamp, *map(str, parts)])
+        return 'W/' + quote_etag(hashlib.md5(raw.encode('utf-8'), usedforsecurity=False).hexdigest())
+
+    def set_validators(self, response, etag, timestamp=None):
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
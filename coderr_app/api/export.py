@@ -0,0 +1,95 @@
+import csv
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON-Encoder für Exporte, der Zeitstempel wie die API ausgibt (ISO 8601 mit Mikrosekunden, `Z`).
+    Decimals werden wie bei DRF als String ausgegeben.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            representation = o.isoformat()
+            if representation.endswith('+00:00'):
+                representation = representation[:-6] + 'Z'
+            return representation
+        return super().default(o)
+
+
+class Echo:
+    """
+    Pseudo-Buffer für `csv.writer`, der jede Zeile direkt zurückgibt statt sie zu puffern.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExportMixin:
+    """
+    Mixin für ViewSets, das eine Streaming-Export-Action bereitstellt.
+
+    **Details**:
+    - Zeilen werden mit `values_list(...).iterator(chunk_size=...)` gelesen (serverseitige
+      Cursor auf PostgreSQL, `fetchmany` auf SQLite) und einzeln als NDJSON oder CSV
+      geschrieben; der Speicherbedarf ist damit unabhängig von der Anzahl der Zeilen.
+    - Das Format wird über `?export_format=ndjson|csv` gewählt (Standard: `ndjson`).
+    - `export_fields` ordnet Ausgabespalten den Modellfeldern zu.
+    """
+    export_fields = {}
+    export_filename = 'export'
+    export_chunk_size = 2000
+    json_encoder = ExportJSONEncoder
+
+    def get_export_queryset(self):
+        raise NotImplementedError
+
+    def export_response(self, request):
+        export_format = request.query_params.get('export_format', 'ndjson')
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({'export_format': f'Must be one of: {", ".join(EXPORT_FORMATS)}.'})
+
+        rows = self.get_export_queryset().order_by('pk').values_list(
+            *self.export_fields.values()
+        ).iterator(chunk_size=self.export_chunk_size)
+        stream = self.stream_csv(rows) if export_format == 'csv' else self.stream_ndjson(rows)
+
+        response = StreamingHttpResponse(stream, content_type=EXPORT_FORMATS[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{self.export_filename}.{export_format}"'
+        return response
+
+    def stream_ndjson(self, rows):
+        columns = list(self.export_fields)
+        encoder = self.json_encoder(separators=(',', ':'))
+        for row in rows:
+            yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+    def stream_csv(self, rows):
+        writer = csv.writer(Echo())
+        encoder = self.json_encoder(separators=(',', ':'))
+        yield writer.writerow(list(self.export_fields))
+        for row in rows:
+            yield writer.writerow([self.csv_value(value, encoder) for value in row])
+
+    def csv_value(self, value, encoder):
+        """
+        JSON-Felder werden als JSON-String, Datumswerte und Decimals wie im NDJSON-Export geschrieben.
+        """
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return encoder.encode(value)
+        try:
+            return encoder.default(value)
+        except TypeError:
+            return value
@@ -0,0 +1,101 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils.http import urlencode
+from rest_framework.response import Response
+
+from ..models import OfferDetails
+from ..search import tokenize
+
+
+def bands(bounds):
+    """
+    Zerlegt aufsteigende Grenzen in Bänder `(untere, obere)`; das erste und letzte Band sind offen (`None`).
+    """
+    edges = [None, *bounds, None]
+    return list(zip(edges, edges[1:]))
+
+
+class OfferFacetsMixin:
+    """
+    Mixin für `OffersViewSet`, das Facetten (Bucket-Zählungen) zu den gefilterten Angeboten liefert.
+
+    **Details**:
+    - Es gelten dieselben Filter wie für die Liste (`OffersFilter`, `?search=`); alle Zählungen
+      entstehen in einer einzigen Aggregat-Query über bedingte `COUNT`s.
+    - `min_price`: Bänder mit `min <= Preis < max` (Grenzen `price_facet_bounds`).
+    - `max_delivery_time`: Bänder mit `min <= Tage <= max` (Grenzen `delivery_facet_bounds`,
+      jeweils obere Grenze wie beim Filter `?max_delivery_time=`).
+    - `offer_type`: Anzahl der Angebote mit einem Detail des jeweiligen Typs.
+    - Angebote ohne Details zählen nur in `count`.
+    - Ergebnisse werden pro normalisierter Filterkombination für `settings.OFFER_FACETS_CACHE_TTL`
+      Sekunden im Cache `settings.RESPONSE_CACHE` gehalten; häufig abgefragte Kombinationen
+      bleiben dadurch im Cache, seltene werden über `MAX_ENTRIES` verdrängt.
+    """
+    price_facet_bounds = (50, 100, 250, 500, 1000)
+    delivery_facet_bounds = (1, 3, 7, 14, 30)
+    facet_query_params = ('creator_id', 'min_price', 'max_delivery_time', 'search')
+
+    def facets_response(self, request):
+        cache = caches[settings.RESPONSE_CACHE]
+        key = self.facets_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = self.get_facets(self.filter_queryset(self.get_queryset()))
+            cache.set(key, data, settings.OFFER_FACETS_CACHE_TTL)
+        return Response(data)
+
+    def facets_cache_key(self, request):
+        """
+        Schlüssel aus den facettenrelevanten Parametern; `page`, `ordering` usw. werden ignoriert und
+        Suchbegriffe auf ihre Tokens reduziert, damit gleichwertige Anfragen denselben Eintrag treffen.
+        """
+        params = {}
+        for name in self.facet_query_params:
+            value = request.query_params.get(name, '').strip()
+            if name == 'search':
+                value = ' '.join(tokenize(value.lower()))
+            if value:
+                params[name] = value
+        digest = hashlib.sha256(urlencode(sorted(params.items())).encode()).hexdigest()
+        return f'coderr:facets:{self.basename}:{digest}'
+
+    def get_facets(self, queryset):
+        price_bands = bands(self.price_facet_bounds)
+        delivery_bands = bands(self.delivery_facet_bounds)
+        offer_types = [value for value, _ in OfferDetails.OFFER_TYPES]
+
+        aggregates = {'count': Count('pk')}
+        for index, (low, high) in enumerate(price_bands):
+            condition = Q()
+            if low is not None:
+                condition &= Q(min_price__gte=low)
+            if high is not None:
+                condition &= Q(min_price__lt=high)
+            aggregates[f'price_{index}'] = Count('pk', filter=condition)
+        for index, (low, high) in enumerate(delivery_bands):
+            condition = Q()
+            if low is not None:
+                condition &= Q(max_delivery_time__gt=low)
+            if high is not None:
+                condition &= Q(max_delivery_time__lte=high)
+            aggregates[f'delivery_{index}'] = Count('pk', filter=condition)
+        for offer_type in offer_types:
+            has_type = Exists(OfferDetails.objects.filter(offer=OuterRef('pk'), offer_type=offer_type))
+            aggregates[f'type_{offer_type}'] = Count('pk', filter=has_type)
+
+        counts = queryset.order_by().aggregate(**aggregates)
+        return {
+            'count': counts['count'],
+            'min_price': [
+                {'min': low, 'max': high, 'count': counts[f'price_{index}']}
+                for index, (low, high) in enumerate(price_bands)
+            ],
+            'max_delivery_time': [
+                {'min': None if low is None else low + 1, 'max': high, 'count': counts[f'delivery_{index}']}
+                for index, (low, high) in enumerate(delivery_bands)
+            ],
+            'offer_type': {offer_type: counts[f'type_{offer_type}'] for offer_type in offer_types},
+        }
@@ -0,0 +1,184 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from ..images import variant_file
+from ..models import BusinessRatingStats
+
+_datetime_field = serializers.DateTimeField()
+_decimal_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class FastReadSerializer(serializers.BaseSerializer):
+    """
+    Basisklasse für schnelle, rein lesende Serializer der Listenansichten.
+
+    **Details**:
+    - Baut die Darstellung direkt als `dict` auf, statt die Feld-Maschinerie von
+      `ModelSerializer` (Feldauflösung, `SerializerMethodField`-Dispatch) pro Objekt zu
+      durchlaufen.
+    - Die Ausgabe muss mit dem jeweiligen `ModelSerializer` byte-identisch sein; Zeitstempel,
+      Decimals und Dateien werden deshalb mit derselben Logik wie in DRF formatiert.
+    - Nur für `GET`-Listen gedacht, Schreibzugriffe werden nicht unterstützt.
+    """
+
+    @cached_property
+    def output_timezone(self):
+        """
+        Zeitzone für Zeitstempel; wird einmal pro Serializer statt pro Feld ermittelt.
+        """
+        return timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def datetime(self, value):
+        if not value:
+            return None
+        if (
+            self.output_timezone is None
+            or timezone.is_naive(value)
+            or api_settings.DATETIME_FORMAT.lower() != ISO_8601
+        ):
+            return _datetime_field.to_representation(value)
+        value = value.astimezone(self.output_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    def decimal(self, value):
+        return None if value is None else _decimal_field.to_representation(value)
+
+    def file(self, value):
+        if not value:
+            return None
+        if not api_settings.UPLOADED_FILES_USE_URL:
+            return value.name
+        try:
+            url = value.url
+        except AttributeError:
+            return None
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
+
+
+class FastOfferListSerializer(FastReadSerializer):
+    """
+    Schnelle Variante von `OfferListSerializer`.
+    """
+
+    def to_representation(self, instance):
+        user = instance.user
+        return {
+            'id': instance.id,
+            'user': instance.user_id,
+            'title': instance.title,
+            'image': self.file(variant_file(instance.image, 'list')),
+            'description': instance.description,
+            'created_at': self.datetime(instance.created_at),
+            'updated_at': self.datetime(instance.updated_at),
+            'details': [
+                {'id': detail.id, 'url': f"/api/offerdetails/{detail.id}/"}
+                for detail in instance.details.all()
+            ],
+            'min_price': self.decimal(instance.min_price),
+            'min_delivery_time': instance.min_delivery_time,
+            'user_details': {
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "username": user.username,
+            },
+        }
+
+
+class FastProfileSerializer(FastReadSerializer):
+    """
+    Gemeinsame Hilfsmethoden für die schnellen Profil-Serializer.
+    """
+
+    def user(self, instance):
+        user = instance.user
+        return {
+            "pk": user.pk,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+        }
+
+
+class FastBusinessProfileSerializer(FastProfileSerializer):
+    """
+    Schnelle Variante von `BusinesProfileSerializer`.
+    """
+
+    def to_representation(self, instance):
+        try:
+            stats = instance.user.rating_stats
+        except BusinessRatingStats.DoesNotExist:
+            stats = None
+        return {
+            'user': self.user(instance),
+            'pk': instance.pk,
+            'file': self.file(variant_file(instance.file, 'thumbnail')),
+            'location': instance.location,
+            'tel': instance.tel,
+            'description': instance.description,
+            'working_hours': instance.working_hours,
+            'type': instance.type,
+            'review_count': stats.review_count if stats else 0,
+            'average_rating': round(stats.average_rating, 1) if stats else 0.0,
+            'rating_histogram': stats.histogram if stats else {str(star): 0 for star in BusinessRatingStats.STAR_FIELDS},
+        }
+
+
+class FastCustomerProfileSerializer(FastProfileSerializer):
+    """
+    Schnelle Variante von `CustomerProfileSerializer`.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'user': self.user(instance),
+            'pk': instance.pk,
+            'file': self.file(variant_file(instance.file, 'thumbnail')),
+            'uploaded_at': self.datetime(instance.created_at),
+            'type': instance.type,
+        }
+
+
+class FastReviewSerializer(FastReadSerializer):
+    """
+    Schnelle Variante von `ReviewSerializer`.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'business_user': instance.business_user_id,
+            'reviewer': instance.customer_user_id,
+            'rating': instance.rating,
+            'description': instance.description,
+            'created_at': self.datetime(instance.created_at),
+            'updated_at': self.datetime(instance.updated_at),
+        }
+
+
+class FastOrderSerializer(FastReadSerializer):
+    """
+    Schnelle Variante von `OrderSerializer`.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'status': instance.status,
+            'business_user': instance.business_user_id,
+            'customer_user': instance.customer_user_id,
+            'title': instance.title,
+            'revisions': instance.revisions,
+            'delivery_time_in_days': instance.delivery_time_in_days,
+            'price': self.decimal(instance.price),
+            'features': instance.features,
+            'offer_type': instance.offer_type,
+            'created_at': self.datetime(instance.created_at),
+            'updated_at': self.datetime(instance.updated_at),
+        }
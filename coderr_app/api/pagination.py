@@ -1,5 +1,252 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset-Paginierung (Cursor) für Querysets, die nach genau einem Feld plus `id` sortiert werden.
+
+    **Details**:
+    - Das Sortierfeld wird wie beim `OrderingFilter` aus `?ordering=` bzw. `view.ordering` bestimmt,
+      `id` dient als stabiler Tiebreaker.
+    - Cursor sind undurchsichtige Base64-Strings mit dem Sortierwert und der `id` des Randelements.
+    - Es wird kein COUNT(*) und kein OFFSET ausgeführt, die Kosten pro Seite sind daher
+      unabhängig von der Tiefe.
+    - `NULL`-Werte im Sortierfeld stehen in Vorwärtsrichtung immer am Ende.
+    - Liefert die View über `get_keyset_branches()` mehrere Teilbedingungen (z. B. die Zweige eines
+      `OR`), wird jede Seite wie ein `UNION` aus je einem per Index sortierten und begrenzten Zweig
+      gelesen (siehe `union_page`).
+    """
+    cursor_query_param = 'cursor'
+    page_size = 6
+    page_size_query_param = None
+    max_page_size = None
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.field, self.descending = self.get_ordering(request, queryset, view)
+        self.nullable = self.is_nullable(queryset.model, self.field)
+
+        cursor = self.decode_cursor(request, queryset)
+        reverse = bool(cursor and cursor['r'])
+
+        queryset = queryset.order_by(*self.order_expressions(reverse))
+        if cursor:
+            queryset = queryset.filter(self.after(cursor['v'], cursor['id'], reverse))
+
+        branches = view.get_keyset_branches() if hasattr(view, 'get_keyset_branches') else None
+        if branches:
+            queryset = self.union_page(queryset, branches, reverse)
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def union_page(self, queryset, branches, reverse):
+        """
+        Liest die Seite aus den Zweigen `queryset.filter(branch)`, die jeweils eigenständig sortiert
+        und auf `page_size + 1` Zeilen begrenzt werden; die äußere Abfrage wählt nur noch per
+        Primärschlüssel aus und sortiert höchstens `len(branches) * (page_size + 1)` Zeilen.
+
+        Ein `OR` über verschiedene Spalten kann keinen Index in Sortierreihenfolge nutzen und
+        sortiert sonst alle passenden Zeilen. Die Zweige stehen in `id IN (...)`-Unterabfragen statt
+        in einem `UNION`, da Django `LIMIT` in den Teilen eines `UNION` auf SQLite nicht erlaubt.
+        Annotationen und `select_related` des Querysets gelten nur innerhalb der Zweige.
+        """
+        limit = self.page_size + 1
+        selected = Q()
+        for branch in branches:
+            selected |= Q(pk__in=queryset.filter(branch).values('pk')[:limit])
+        return queryset.model._default_manager.filter(selected).order_by(*self.order_expressions(reverse))
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Gibt das Sortierfeld und die Richtung zurück (nur das erste Feld wird verwendet).
+        """
+        ordering = OrderingFilter().get_ordering(request, queryset, view) or ['id']
+        term = ordering[0]
+        field = term.lstrip('-')
+        if field == 'pk':
+            field = 'id'
+        return field, term.startswith('-')
+
+    def is_nullable(self, model, field):
+        try:
+            return model._meta.get_field(field).null
+        except FieldDoesNotExist:
+            return True
+
+    def order_expressions(self, reverse):
+        descending = self.descending != reverse
+        nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+        field = F(self.field).desc(**nulls) if descending else F(self.field).asc(**nulls)
+        if self.field == 'id':
+            return [field]
+        return [field, '-id' if descending else 'id']
+
+    def after(self, value, pk, reverse):
+        """
+        Baut die Keyset-Bedingung "liegt in Laufrichtung hinter (value, pk)".
+        """
+        descending = self.descending != reverse
+        nulls_last = not reverse
+        op = 'lt' if descending else 'gt'
+        id_after = Q(**{f'id__{op}': pk})
+
+        if self.field == 'id':
+            return id_after
+
+        is_null = Q(**{f'{self.field}__isnull': True})
+        if value is None:
+            return is_null & id_after if nulls_last else (is_null & id_after) | ~is_null
+
+        # `field <= v AND (field < v OR id > pk)` ergibt eine indexfähige Bereichsgrenze.
+        condition = Q(**{f'{self.field}__{op}e': value}) & (Q(**{f'{self.field}__{op}': value}) | id_after)
+        if nulls_last and self.nullable:
+            condition |= is_null
+        return condition
+
+    def get_ordering_field(self, queryset):
+        """
+        Gibt das Feld (Modellfeld oder `output_field` einer Annotation) zurück, nach dem sortiert wird.
+        """
+        annotation = queryset.query.annotations.get(self.field)
+        if annotation is not None:
+            return annotation.output_field
+        try:
+            return queryset.model._meta.get_field(self.field)
+        except FieldDoesNotExist:
+            return None
+
+    def decode_cursor(self, request, queryset):
+        """
+        Dekodiert den Cursor und wandelt den Sortierwert mit `to_python()` des Sortierfelds um,
+        damit manipulierte Cursor als ungültig (404) statt als Datenbankfehler enden.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            value = cursor['v']
+            field = self.get_ordering_field(queryset)
+            if value is not None and field is not None:
+                value = field.to_python(value)
+            return {'v': value, 'id': int(cursor['id']), 'r': bool(cursor.get('r'))}
+        except (TypeError, ValueError, KeyError, UnicodeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        value = getattr(obj, self.field)
+        if value is not None and not isinstance(value, (int, float, str)):
+            value = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+        payload = json.dumps({'v': value, 'id': obj.pk, 'r': int(reverse)}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
 
 class OffersPagination(PageNumberPagination):
+    """
+    Paginierung für Angebote.
+
+    **Modi**:
+    - Standard: Seitenbasierte Paginierung (`?page=`, `?page_size=`).
+    - Cursor (opt-in über `?pagination=cursor` oder `?cursor=`): Keyset-Paginierung über
+      `KeysetCursorPagination` mit konstanten Kosten pro Seite, z. B. für Infinite Scroll.
+    """
     page_size_query_param = 'page_size'  # Ermöglicht Anpassung der Seitengröße per Query-Parameter
-    page_size = 6 
\ No newline at end of file
+    page_size = 6
+    mode_query_param = 'pagination'
+    cursor_pagination_class = KeysetCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            self.cursor_paginator.page_size = self.get_page_size(request)
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+
+class OrdersPagination(KeysetCursorPagination):
+    """
+    Cursor-Paginierung für Bestellungen auf `(created_at, id)`, neueste zuerst.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ProfilesPagination(OffersPagination):
+    """
+    Paginierung für die Geschäfts- und Kundenprofil-Listen.
+
+    Seitenbasiert (`?page=`, `?page_size=` bis 100) oder Cursor (`?pagination=cursor`),
+    wie bei `OffersPagination`.
+    """
+    page_size = 20
+    max_page_size = 100
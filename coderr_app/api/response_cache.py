@@ -0,0 +1,43 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import urlencode
+from rest_framework.response import Response
+
+from ..models import CacheVersion
+
+
+class VersionedListCacheMixin:
+    """
+    Mixin für ViewSets, das die Daten von `list` unter einem versionierten Schlüssel cached.
+
+    **Details**:
+    - Der Schlüssel besteht aus `basename`, den aktuellen Versionen der Zähler in
+      `cache_versions` (`CacheVersion`, eine Query), Schema und Host (Datei-URLs sind absolut)
+      sowie den sortierten Query-Parametern.
+    - Änderungen erhöhen die Versionen über Signale; betroffene Einträge werden dadurch sofort
+      nicht mehr gelesen und verfallen im Cache `settings.RESPONSE_CACHE` über `MAX_ENTRIES`
+      bzw. `TIMEOUT`, statt per TTL veraltete Daten auszuliefern.
+    - Nur für Listen, deren Ausgabe nicht vom angemeldeten Benutzer abhängt. Gecacht werden
+      nur erfolgreiche Antworten.
+    """
+    cache_versions = ()
+
+    def list(self, request, *args, **kwargs):
+        cache = caches[settings.RESPONSE_CACHE]
+        key = self.list_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data)
+        return response
+
+    def list_cache_key(self, request):
+        versions = '.'.join(str(version) for version in CacheVersion.current(*self.cache_versions))
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        digest = hashlib.sha256(f'{request.scheme}://{request.get_host()}?{query}'.encode()).hexdigest()
+        return f'coderr:list:{self.basename}:{versions}:{digest}'
@@ -1,9 +1,27 @@
 from rest_framework import serializers
-from ..models import UserProfile, Offers, OfferDetails,Order,Review
+from ..models import UserProfile, Offers, OfferDetails,Order,Review,BusinessRatingStats
 from django.conf import settings
+from django.db import transaction
+from ..images import variant_file
 import re
 
 
+class ImageVariantField(serializers.FileField):
+    """
+    `FileField`, der statt des Originals die Bildvariante `variant` ausgibt (siehe `coderr_app.images`).
+
+    Solange die Variante noch nicht erzeugt wurde, wird das Original ausgegeben. Uploads werden
+    wie bei `FileField` angenommen.
+    """
+
+    def __init__(self, variant, **kwargs):
+        self.variant = variant
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return super().to_representation(variant_file(value, self.variant))
+
+
 class UserProfileSerializer(serializers.ModelSerializer):
     """
     Serializer für das UserProfile-Modell.
@@ -44,7 +62,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         representation = super().to_representation(instance)
 
         if instance.file:
-            representation['file'] = instance.file.url
+            representation['file'] = variant_file(instance.file, 'detail').url
 
         return representation
 
@@ -54,6 +72,7 @@ class UserProfileDetailSerializer(serializers.ModelSerializer):
     Serializer für detaillierte Benutzerprofile.
 
     Erweitert das UserProfile um verschachtelte Benutzerinformationen und zusätzliche Profildetails.
+    `file` gibt das Vorschaubild (Variante `thumbnail`) aus.
 
     Meta:
     model: UserProfile
@@ -65,6 +84,7 @@ class UserProfileDetailSerializer(serializers.ModelSerializer):
     """
 
     user = serializers.SerializerMethodField()
+    file = ImageVariantField(variant='thumbnail', max_length=100)
     class Meta:
         model = UserProfile
         fields = [
@@ -120,11 +140,18 @@ class BusinesProfileSerializer(UserProfileDetailSerializer):
 
     Basierend auf dem UserProfileDetailSerializer, aber spezialisiert für Anbieter, mit einer reduzierten Anzahl von Feldern.
     
+    Enthält zusätzlich die denormalisierte Bewertungsübersicht aus `BusinessRatingStats`
+    (`review_count`, `average_rating`, `rating_histogram`), ohne Bewertungen zu aggregieren.
+
     Meta:
     model: UserProfile
-    fields: ['user','pk', 'file','location','tel','description','working_hours', 'type']
+    fields: ['user','pk', 'file','location','tel','description','working_hours', 'type', 'review_count', 'average_rating', 'rating_histogram']
     read_only_fields: ['type']
     """
+    review_count = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
+    rating_histogram = serializers.SerializerMethodField()
+
     class Meta:
         model = UserProfile
         fields = [
@@ -135,9 +162,31 @@ class BusinesProfileSerializer(UserProfileDetailSerializer):
             'tel',
             'description',
             'working_hours', 
-            'type'          
+            'type',
+            'review_count',
+            'average_rating',
+            'rating_histogram',
         ]
         read_only_fields = ['type']
+
+    def get_rating_stats(self, obj):
+        try:
+            return obj.user.rating_stats
+        except BusinessRatingStats.DoesNotExist:
+            return None
+
+    def get_review_count(self, obj):
+        stats = self.get_rating_stats(obj)
+        return stats.review_count if stats else 0
+
+    def get_average_rating(self, obj):
+        stats = self.get_rating_stats(obj)
+        return round(stats.average_rating, 1) if stats else 0.0
+
+    def get_rating_histogram(self, obj):
+        stats = self.get_rating_stats(obj)
+        return stats.histogram if stats else {str(star): 0 for star in BusinessRatingStats.STAR_FIELDS}
+
     def validate_tel(self, value):
         """
         Validiert das Telefonformat.
@@ -177,8 +226,10 @@ class OfferDetailsSerializer(serializers.ModelSerializer):
     
 class OfferListSerializer(serializers.ModelSerializer):
     """
-    Serializer für die Listenansicht von Angeboten, zeigt URLs der Angebotsdetails.
+    Serializer für die Listenansicht von Angeboten, zeigt URLs der Angebotsdetails
+    und die Listen-Variante des Bildes.
     """
+    image = ImageVariantField(variant='list', read_only=True)
     details = serializers.SerializerMethodField()
     user_details = serializers.SerializerMethodField()
     min_price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
@@ -222,8 +273,9 @@ class OfferListSerializer(serializers.ModelSerializer):
         }   
 class OfferDetailSerializer(serializers.ModelSerializer):
     """
-    Serializer für die Detailansicht der Angebote.
+    Serializer für die Detailansicht der Angebote (mit der Detail-Variante des Bildes).
     """
+    image = ImageVariantField(variant='detail', read_only=True)
     details = OfferDetailsSerializer(many=True)
     min_price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -271,37 +323,78 @@ class OffersSerializer(serializers.ModelSerializer):
             'details',
         ]
 
+    def validate_details(self, value):
+        """
+        Stellt sicher, dass jedes Detail einen `offer_type` hat und jeder höchstens einmal vorkommt,
+        da Details beim Aktualisieren über den `offer_type` zugeordnet werden (auch bei PATCH).
+        """
+        offer_types = [detail.get('offer_type') for detail in value]
+        if None in offer_types:
+            raise serializers.ValidationError("Each detail requires an offer_type.")
+        if len(offer_types) != len(set(offer_types)):
+            raise serializers.ValidationError("Each offer_type may only appear once.")
+        return value
+
     def create(self, validated_data):
         """
-        Erstellt ein neues Angebot und die zugehörigen Details.
+        Erstellt ein neues Angebot und die zugehörigen Details (Details per Bulk-Insert).
         """
         details_data = validated_data.pop('details', [])
         validated_data['user'] = self.context['request'].user
-        offer = Offers.objects.create(**validated_data)
 
-        for detail in details_data:
-            OfferDetails.objects.create(offer=offer, **detail)
+        with transaction.atomic():
+            offer = Offers.objects.create(**validated_data)
+            OfferDetails.objects.bulk_create([OfferDetails(offer=offer, **detail) for detail in details_data])
+            Offers.objects.filter(pk=offer.pk).refresh_summary()
 
         return offer
 
     def update(self, instance, validated_data):
         """
-        Aktualisiert ein Angebot und die zugehörigen Details.
+        Aktualisiert ein Angebot und gleicht die Details über `offer_type` ab.
+
+        - Vorhandene Details werden in-place aktualisiert (IDs und Bestellungen bleiben erhalten).
+        - Neue `offer_type`s werden per Bulk-Insert angelegt.
+        - Nicht mehr übergebene `offer_type`s werden nur bei vollständigen Updates (PUT) gelöscht.
         """
         details_data = validated_data.pop('details', None)
         instance.title = validated_data.get('title', instance.title)
         instance.image = validated_data.get('image', instance.image)
         instance.description = validated_data.get('description', instance.description)
-        instance.save()
 
-        if details_data:
-            # Alte Details löschen und neue erstellen
-            instance.details.all().delete()
-            for detail in details_data:
-                OfferDetails.objects.create(offer=instance, **detail)
+        with transaction.atomic():
+            instance.save()
+            if details_data:
+                self.sync_details(instance, details_data)
+                Offers.objects.filter(pk=instance.pk).refresh_summary()
 
         return instance
 
+    def sync_details(self, instance, details_data):
+        """
+        Schreibt die Details mit einer festen Anzahl an Statements (Bulk-Update, Bulk-Insert, Delete).
+        """
+        existing = {detail.offer_type: detail for detail in instance.details.all()}
+        to_update, to_create, update_fields = [], [], set()
+
+        for data in details_data:
+            detail = existing.pop(data['offer_type'], None)
+            if detail is None:
+                to_create.append(OfferDetails(offer=instance, **data))
+                continue
+            for field, value in data.items():
+                setattr(detail, field, value)
+            update_fields.update(data)
+            to_update.append(detail)
+
+        update_fields.discard('offer_type')
+        if to_update and update_fields:
+            OfferDetails.objects.bulk_update(to_update, sorted(update_fields))
+        if to_create:
+            OfferDetails.objects.bulk_create(to_create)
+        if existing and not self.partial:
+            OfferDetails.objects.filter(pk__in=[detail.pk for detail in existing.values()]).delete()
+
 class OrderSerializer(serializers.ModelSerializer):
     """
     Serializer für das Order-Modell.
@@ -402,6 +495,14 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ['id', 'business_user', 'reviewer', 'rating', 'description', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at', 'customer_user']
 
+    def validate_rating(self, value):
+        """
+        Bewertungen müssen zwischen 1 und 5 Sternen liegen.
+        """
+        if not 1 <= value <= 5:
+            raise serializers.ValidationError("Rating must be between 1 and 5.")
+        return value
+
     def create(self, validated_data):
         """
         Erstellt eine neue Bewertung für einen Business-Benutzer.
@@ -1,6 +1,6 @@
 
 from django.urls import path,include
-from .views import UserProfileDetailView,BusinessProfilesViewSet,BaseInfoView, CustomerProfilesViewSet,OffersViewSet,CompletedOrderCountView,OfferDetailsView,OrderViewSet,OrderCountView,ReviewViewSet
+from .views import UserProfileDetailView,BusinessProfilesViewSet,BaseInfoView, CustomerProfilesViewSet,OffersViewSet,CompletedOrderCountView,OfferDetailsView,OrderViewSet,OrderCountView,ReviewViewSet,BusinessOrderCountsView,MetricsView
 from rest_framework.routers import DefaultRouter
 
 router = DefaultRouter()
@@ -17,5 +17,7 @@ urlpatterns = [
     path('profile/<int:pk>/', UserProfileDetailView.as_view(), name='user_profile_detail'),
     path('order-count/<int:business_user_id>/', OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name='completed,order-count'),
-    path('base-info/', BaseInfoView.as_view(), name='base-info')
+    path('order-counts/', BusinessOrderCountsView.as_view(), name='order-counts'),
+    path('base-info/', BaseInfoView.as_view(), name='base-info'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
@@ -1,20 +1,52 @@
 from rest_framework import permissions,status,viewsets
+from rest_framework.decorators import action
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework.response import Response
 from rest_framework.filters import OrderingFilter,SearchFilter
 from django_filters import rest_framework as filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.generics import RetrieveUpdateAPIView
 from .serializer import OfferDetailSerializer, OfferListSerializer, UserProfileSerializer,ReviewSerializer,OffersSerializer,OfferDetailsSerializer, OrderSerializer,CustomerProfileSerializer,BusinesProfileSerializer
-from ..models import UserProfile, Offers,OfferDetails,Order,Review
-from django.db.models import Min, Max, Avg
+from ..models import UserProfile, Offers,OfferDetails,Order,Review,PlatformStats
+from django.db.models import F, Prefetch, Q
+from django.db.models.functions import Coalesce
 from .permissions import IsOwnerOrAdmin,IsCustomer,IsBusinessUser,IsReviewerOrAdmin
-from .pagination import OffersPagination
+from .pagination import OffersPagination, OrdersPagination, ProfilesPagination
+from .conditional import ConditionalGetMixin
+from .fast_serializer import FastBusinessProfileSerializer, FastCustomerProfileSerializer, FastOfferListSerializer, FastOrderSerializer, FastReviewSerializer
+from .export import ExportMixin
+from .facets import OfferFacetsMixin
+from .response_cache import VersionedListCacheMixin
+from ..search import get_offer_search, tokenize
+from ..metrics import view_metrics
+from ..replicas import ReplicaReadMixin
+from django.http import HttpResponse
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
-from django.db.models import Subquery, OuterRef, Min, Max
 
 
-class UserProfileDetailView(RetrieveUpdateAPIView):
+class FastListMixin:
+    """
+    Wählt für `GET`-Listen automatisch den schnellen, rein lesenden Serializer
+    (`fast_list_serializer_class`), der dieselbe JSON-Ausgabe wie `serializer_class` erzeugt.
+    """
+    fast_list_serializer_class = None
+
+    def use_fast_list(self):
+        return (
+            self.fast_list_serializer_class is not None
+            and self.action == 'list'
+            and self.request.method == 'GET'
+        )
+
+    def get_serializer_class(self):
+        if self.use_fast_list():
+            return self.fast_list_serializer_class
+        return super().get_serializer_class()
+
+
+class UserProfileDetailView(ConditionalGetMixin, RetrieveUpdateAPIView):
     """
     API-Endpunkt für Benutzerprofile.
 
@@ -25,8 +57,10 @@ class UserProfileDetailView(RetrieveUpdateAPIView):
     **Details**:
     - Nur authentifizierte Benutzer können diese View verwenden.
     - Benutzer können nur ihr eigenes Profil abrufen und bearbeiten.
+    - GET unterstützt Conditional GET (`ETag` aus `updated_at` und den Namen des Benutzers).
     """
     serializer_class = UserProfileSerializer
+    conditional_related_fields = ('user__username', 'user__first_name', 'user__last_name')
     permission_classes = [permissions.IsAuthenticated] 
     queryset = UserProfile.objects.all()
     
@@ -49,12 +83,56 @@ class UserProfileDetailView(RetrieveUpdateAPIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class BusinessProfilesViewSet(viewsets.ModelViewSet):
+class ProfilesFilter(filters.FilterSet):
+    """
+    FilterSet für die Profillisten.
+
+    **Felder**:
+    - **location**: Exakter Standort (nutzt den Index auf `type` und `location`).
+    """
+    location = filters.CharFilter(field_name='location', lookup_expr='exact')
+
+    class Meta:
+        model = UserProfile
+        fields = ['location']
+
+
+class BusinessProfilesFilter(ProfilesFilter):
+    """
+    FilterSet für Geschäftsnutzer-Profile.
+
+    **Felder**:
+    - **location**: Exakter Standort.
+    - **min_rating**: Mindestdurchschnitt der Bewertungen.
+    - **min_reviews**: Mindestanzahl an Bewertungen.
+
+    Die Bewertungsfilter greifen direkt auf die indizierten Spalten von `BusinessRatingStats`;
+    Werte ≤ 0 filtern nicht, damit Anbieter ohne Bewertungen (0 / 0.0) enthalten bleiben.
+    """
+    min_rating = filters.NumberFilter(method='filter_min_stat')
+    min_reviews = filters.NumberFilter(method='filter_min_stat')
+
+    STAT_FIELDS = {
+        'min_rating': 'user__rating_stats__average_rating',
+        'min_reviews': 'user__rating_stats__review_count',
+    }
+
+    class Meta:
+        model = UserProfile
+        fields = ['location', 'min_rating', 'min_reviews']
+
+    def filter_min_stat(self, queryset, name, value):
+        if value is None or value <= 0:
+            return queryset
+        return queryset.filter(**{f'{self.STAT_FIELDS[name]}__gte': value})
+
+
+class BusinessProfilesViewSet(ReplicaReadMixin, VersionedListCacheMixin, FastListMixin, viewsets.ModelViewSet):
     """
     API-Endpunkt für Geschäftsnutzer-Profile.
 
     **Methoden**:
-    - GET: Gibt eine Liste aller Geschäftsnutzer zurück.
+    - GET: Gibt eine paginierte Liste der Geschäftsnutzer zurück.
     - POST: Erstellt ein neues Geschäftsnutzer-Profil.
     - PUT: Aktualisiert ein Geschäftsnutzer-Profil vollständig.
     - PATCH: Aktualisiert ein Geschäftsnutzer-Profil teilweise.
@@ -63,19 +141,38 @@ class BusinessProfilesViewSet(viewsets.ModelViewSet):
     **Details**:
     - Nur authentifizierte Benutzer können diese View verwenden.
     - Zeigt ausschließlich Profile mit `type='business'`.
+    - Paginiert über `ProfilesPagination` (Seiten oder `?pagination=cursor`), standardmäßig
+      nach Benutzernamen sortiert.
+    - Filterbar nach `location`, `min_rating` und `min_reviews` (`BusinessProfilesFilter`).
+    - Sortierbar nach `average_rating` und `review_count` (z. B. `?ordering=-average_rating`
+      für "Top bewertet") über die denormalisierte Bewertungsübersicht.
+    - Benutzer und Bewertungsübersicht werden in derselben Query geladen.
+    - Die Liste wird pro Query-Parametern gecacht und bei Änderungen an Profilen, Namen oder
+      Bewertungen invalidiert (`VersionedListCacheMixin`).
     """
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     serializer_class = BusinesProfileSerializer
+    fast_list_serializer_class = FastBusinessProfileSerializer
+    cache_versions = ('profiles', 'ratings')
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = BusinessProfilesFilter
+    ordering_fields = ['username', 'average_rating', 'review_count']
+    ordering = ['username']
+    pagination_class = ProfilesPagination
     
     def get_queryset(self):
-        return UserProfile.objects.filter(type='business')
+        return UserProfile.objects.filter(type='business').select_related('user__rating_stats').annotate(
+            username=F('user__username'),
+            average_rating=Coalesce(F('user__rating_stats__average_rating'), 0.0),
+            review_count=Coalesce(F('user__rating_stats__review_count'), 0),
+        )
     
-class CustomerProfilesViewSet(viewsets.ModelViewSet):
+class CustomerProfilesViewSet(ReplicaReadMixin, VersionedListCacheMixin, FastListMixin, viewsets.ModelViewSet):
     """
     API-Endpunkt für Kundennutzer-Profile.
 
     **Methoden**:
-    - GET: Gibt eine Liste aller Kundennutzer zurück.
+    - GET: Gibt eine paginierte Liste der Kundennutzer zurück.
     - POST: Erstellt ein neues Kundennutzer-Profil.
     - PUT: Aktualisiert ein Kundennutzer-Profil vollständig.
     - PATCH: Aktualisiert ein Kundennutzer-Profil teilweise.
@@ -84,13 +181,36 @@ class CustomerProfilesViewSet(viewsets.ModelViewSet):
     **Details**:
     - Nur authentifizierte Benutzer können diese View verwenden.
     - Zeigt ausschließlich Profile mit `type='customer'`.
+    - Paginiert über `ProfilesPagination` (Seiten oder `?pagination=cursor`), nach
+      Benutzernamen sortiert und nach `location` filterbar.
+    - Der Benutzer wird per `select_related` in derselben Query geladen.
+    - Die Liste wird pro Query-Parametern gecacht und bei Änderungen an Profilen oder Namen
+      invalidiert (`VersionedListCacheMixin`).
     """
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     serializer_class = CustomerProfileSerializer
+    fast_list_serializer_class = FastCustomerProfileSerializer
+    cache_versions = ('profiles',)
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = ProfilesFilter
+    ordering_fields = ['username']
+    ordering = ['username']
+    pagination_class = ProfilesPagination
+
     def get_queryset(self):
-        return UserProfile.objects.filter(type='customer')
+        return UserProfile.objects.filter(type='customer').select_related('user').annotate(
+            username=F('user__username'),
+        )
     
 class OffersFilter(filters.FilterSet):
+    """
+    FilterSet zum Filtern von Angeboten.
+
+    **Felder**:
+    - **creator_id**: ID des Erstellers.
+    - **min_price**: Mindestpreis (filtert auf das indizierte Feld `Offers.min_price`).
+    - **max_delivery_time**: Maximale Lieferzeit (filtert auf das indizierte Feld `Offers.max_delivery_time`).
+    """
     creator_id = filters.NumberFilter(field_name="user_id", lookup_expr='exact')  
     min_price = filters.NumberFilter(field_name="min_price", lookup_expr='gte') 
     max_delivery_time = filters.NumberFilter(field_name="max_delivery_time", lookup_expr='lte') 
@@ -99,7 +219,30 @@ class OffersFilter(filters.FilterSet):
         model = Offers
         fields = ['creator_id', 'min_price', 'max_delivery_time']
 
-class OffersViewSet(viewsets.ModelViewSet):
+class OfferSearchFilter(SearchFilter):
+    """
+    Volltextsuche für Angebote über `?search=`.
+
+    **Details**:
+    - Delegiert an das Suchbackend der Datenbank (`coderr_app.search.get_offer_search`):
+      PostgreSQL `tsvector` + GIN, SQLite FTS5 oder `icontains` als Fallback.
+    - Ohne expliziten `?ordering=` werden Treffer nach Relevanz sortiert.
+    - Filter und Paginierung bleiben wie gewohnt kombinierbar.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '')
+        if not tokenize(term):
+            return queryset
+
+        backend = get_offer_search(queryset.db)
+        queryset = backend.search(queryset, term)
+        if not request.query_params.get(OrderingFilter.ordering_param):
+            queryset = queryset.order_by(backend.rank_ordering, *queryset.query.order_by)
+        return queryset
+
+
+class OffersViewSet(ReplicaReadMixin, ConditionalGetMixin, OfferFacetsMixin, FastListMixin, viewsets.ModelViewSet):
     """
     API-Endpunkt für Angebote (Offers).
 
@@ -113,10 +256,14 @@ class OffersViewSet(viewsets.ModelViewSet):
     **Details**:
     - Nur authentifizierte Benutzer mit Berechtigungen (z. B. `IsBusinessUser`, `IsOwnerOrAdmin`) können diese View verwenden.
     - Unterstützt Filter, Suche und Sortierung.
+    - Liste und Detail unterstützen Conditional GET (`304 Not Modified`).
+    - `GET /offers/facets/` liefert Bucket-Zählungen für dieselben Filter (`OfferFacetsMixin`).
     """
     permission_classes = [permissions.IsAuthenticated,IsBusinessUser,IsOwnerOrAdmin]
     serializer_class = OffersSerializer
-    filter_backends = [DjangoFilterBackend, OrderingFilter,SearchFilter]
+    fast_list_serializer_class = FastOfferListSerializer
+    conditional_related_fields = ('user__username', 'user__first_name', 'user__last_name')
+    filter_backends = [DjangoFilterBackend, OrderingFilter,OfferSearchFilter]
     filterset_class = OffersFilter 
     ordering_fields = ['updated_at', 'min_price']
     ordering = ['updated_at'] 
@@ -126,36 +273,40 @@ class OffersViewSet(viewsets.ModelViewSet):
    
     def get_queryset(self):
         """
-        Annotiert Angebote mit zusätzlichen Feldern.
+        Gibt alle Angebote zurück. `min_price`, `min_delivery_time` und `max_delivery_time`
+        sind denormalisierte, indizierte Felder auf `Offers` und müssen nicht mehr annotiert werden.
+
+        Für `list` und `retrieve` werden Ersteller und Details vorab geladen, sodass die Anzahl
+        der Queries unabhängig von der Seitengröße konstant bleibt.
         """
-        return Offers.objects.annotate(
-            min_price=Subquery(
-                OfferDetails.objects.filter(offer=OuterRef('pk')).values('offer').annotate(
-                    min_price=Min('price')
-                ).values('min_price')
-            ),
-            min_delivery_time=Subquery(
-                OfferDetails.objects.filter(offer=OuterRef('pk')).values('offer').annotate(
-                    min_delivery_time=Min('delivery_time_in_days')
-                ).values('min_delivery_time')
-            ),
-            max_delivery_time=Subquery(
-                OfferDetails.objects.filter(offer=OuterRef('pk')).values('offer').annotate(
-                    max_delivery_time=Max('delivery_time_in_days')
-                ).values('max_delivery_time')
+        queryset = Offers.objects.all()
+        if self.action == 'list':
+            return queryset.select_related('user').prefetch_related(
+                Prefetch('details', queryset=OfferDetails.objects.only('id', 'offer_id'))
             )
-        )
+        if self.action == 'retrieve':
+            return queryset.select_related('user').prefetch_related('details')
+        return queryset
+
     def get_serializer_class(self):
         """
         Wählt den passenden Serializer basierend auf der Aktion aus.
         """
-        if self.action == 'list':  # Für GET /offers/
+        if self.use_fast_list():  # Für GET /offers/
+            return self.fast_list_serializer_class
+        if self.action == 'list':
             return OfferListSerializer
         if self.action == 'retrieve':  # Für GET /offers/<id>/
             return OfferDetailSerializer
         return OffersSerializer
 
-    
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        Gibt die Anzahl der gefilterten Angebote pro Preis-, Lieferzeit-Band und Angebotstyp zurück.
+        """
+        return self.facets_response(request)
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.delete()
@@ -185,7 +336,30 @@ class OfferDetailsView(viewsets.ModelViewSet):
 
     
     
-class OrderViewSet(viewsets.ModelViewSet):
+class OrdersFilter(filters.FilterSet):
+    """
+    FilterSet zum Filtern von Bestellungen.
+
+    **Felder**:
+    - **status**: Status der Bestellung (`in_progress`, `completed`, `cancelled`).
+    - **role**: Rolle des angemeldeten Benutzers, `buyer` (Kunde) oder `seller` (Anbieter).
+
+    **Verwendete Modelle**: Order
+    """
+    ROLE_FIELDS = {'buyer': 'customer_user', 'seller': 'business_user'}
+
+    status = filters.ChoiceFilter(choices=Order.status_choices)
+    role = filters.ChoiceFilter(choices=[('buyer', 'Buyer'), ('seller', 'Seller')], method='filter_role')
+
+    class Meta:
+        model = Order
+        fields = ['status', 'role']
+
+    def filter_role(self, queryset, name, value):
+        return queryset.filter(**{self.ROLE_FIELDS[value]: self.request.user})
+
+
+class OrderViewSet(ExportMixin, FastListMixin, viewsets.ModelViewSet):
     """
     API-Endpunkt für Bestellungen (Orders).
 
@@ -198,19 +372,71 @@ class OrderViewSet(viewsets.ModelViewSet):
 
     **Details**:
     - Nur authentifizierte Benutzer mit entsprechenden Berechtigungen können diese View verwenden.
+    - Die Liste ist per Cursor auf `(created_at, id)` paginiert (neueste zuerst) und nach
+      `status` sowie `role` (`buyer`/`seller`) filterbar.
+    - `GET /orders/export/?export_format=ndjson|csv` streamt alle eigenen Bestellungen.
     """
     serializer_class = OrderSerializer
+    fast_list_serializer_class = FastOrderSerializer
     queryset = Order.objects.all()
     permission_classes = [permissions.IsAuthenticated,IsCustomer]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrdersFilter
+    ordering = ['-created_at']
+    ordering_fields = ['created_at']
+    pagination_class = OrdersPagination
+    export_filename = 'orders'
+    export_fields = {
+        'id': 'id',
+        'status': 'status',
+        'business_user': 'business_user_id',
+        'customer_user': 'customer_user_id',
+        'title': 'title',
+        'revisions': 'revisions',
+        'delivery_time_in_days': 'delivery_time_in_days',
+        'price': 'price',
+        'features': 'features',
+        'offer_type': 'offer_type',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
 
       
     def get_queryset(self):
+        """
+        Gibt die Bestellungen zurück, an denen der Benutzer als Kunde oder Anbieter beteiligt ist.
+
+        Mit `role` schränkt `OrdersFilter` auf eine Spalte ein, sodass der zusammengesetzte Index
+        inklusive `created_at` greift; ohne `role` liest die Paginierung die beiden Seiten des `OR`
+        getrennt (siehe `get_keyset_branches`).
+        """
         user = self.request.user
         
         if user.is_staff:
             return Order.objects.all()
         
-        return Order.objects.filter(customer_user=user) | Order.objects.filter(business_user=user)
+        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+
+    def get_keyset_branches(self):
+        """
+        Zweige der Liste ohne `role` für `KeysetCursorPagination.union_page`: Bestellungen als Kunde
+        und als Anbieter, jeweils über `(customer_user|business_user, [status,] created_at)` sortiert.
+        """
+        user = self.request.user
+        if user.is_staff or self.request.query_params.get('role') in OrdersFilter.ROLE_FIELDS:
+            return None
+        return [Q(customer_user=user), Q(business_user=user)]
+
+    def get_export_queryset(self):
+        user = self.request.user
+        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def export(self, request):
+        """
+        Streamt alle Bestellungen des Benutzers (als Kunde oder Anbieter) als NDJSON oder CSV.
+        """
+        return self.export_response(request)
     
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -246,7 +472,30 @@ class OrderViewSet(viewsets.ModelViewSet):
         context['request'] = self.request
         return context
 
-class OrderCountView(APIView):
+class BusinessOrderCountMixin:
+    """
+    Gemeinsame Logik für die Bestellzähler eines Geschäftsnutzers.
+
+    Liest Profiltyp und Zähler aus `BusinessOrderStats` in einer einzigen Query
+    (LEFT JOIN über das Profil), statt `Order`-Zeilen zu zählen.
+    """
+    count_field = None
+    response_key = None
+
+    def get(self, request, business_user_id):
+        profile = UserProfile.objects.filter(user_id=business_user_id).values(
+            'type', f'user__order_stats__{self.count_field}'
+        ).first()
+        if profile is None:
+            return Response({"detail": "Business user not found."}, status=404)
+        if profile['type'] != 'business':
+            return Response({"detail": "User is not a business user."}, status=403)
+
+        count = profile[f'user__order_stats__{self.count_field}'] or 0
+        return Response({self.response_key: count})
+
+
+class OrderCountView(ReplicaReadMixin, BusinessOrderCountMixin, APIView):
     """
     Gibt die Anzahl der Bestellungen mit dem Status `in_progress` für einen Geschäftsnutzer zurück.
 
@@ -261,20 +510,12 @@ class OrderCountView(APIView):
     - 403 Forbidden: Wenn der Benutzer kein Geschäftsnutzer ist.
     - 404 Not Found: Wenn der Geschäftsnutzer nicht existiert.
     """
-    
     permission_classes = [permissions.IsAuthenticated]
-    def get(self, request, business_user_id):
-        try:
-            user_profile = UserProfile.objects.get(user__id=business_user_id)
-            if user_profile.type != 'business':
-                return Response({"detail": "User is not a business user."}, status=403)
-        except UserProfile.DoesNotExist:
-            return Response({"detail": "Business user not found."}, status=404)
+    count_field = 'in_progress_count'
+    response_key = 'order_count'
 
-        count = Order.objects.filter(business_user_id=business_user_id, status='in_progress').count()
-        return Response({"order_count": count})
 
-class CompletedOrderCountView(APIView):
+class CompletedOrderCountView(ReplicaReadMixin, BusinessOrderCountMixin, APIView):
     """
     Gibt die Anzahl der abgeschlossenen Bestellungen (`completed`) für einen Geschäftsnutzer zurück.
 
@@ -290,18 +531,56 @@ class CompletedOrderCountView(APIView):
     - 404 Not Found: Wenn der Geschäftsnutzer nicht existiert.
     """
     permission_classes = [permissions.IsAuthenticated]
+    count_field = 'completed_count'
+    response_key = 'completed_order_count'
 
-    def get(self, request, business_user_id):
+
+class BusinessOrderCountsView(ReplicaReadMixin, APIView):
+    """
+    Gibt die Bestellzähler mehrerer Geschäftsnutzer in einem Aufruf zurück.
+
+    **Methoden**:
+    - GET: Liefert `in_progress`, `completed` und `cancelled` je Geschäftsnutzer.
+
+    **Parameter**:
+    - `business_user_ids`: Kommagetrennte IDs der Geschäftsnutzer (max. `max_ids`).
+
+    **Antwort**:
+    - 200 OK: `{"results": [{"business_user_id": ..., "in_progress": ..., "completed": ..., "cancelled": ...}]}`.
+      IDs, die keinem Geschäftsnutzer gehören, werden ausgelassen.
+    - 400 Bad Request: Wenn die IDs fehlen, ungültig sind oder zu viele angegeben wurden.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_ids = 100
+
+    def get(self, request):
+        raw_ids = request.query_params.get('business_user_ids', '')
         try:
-            user_profile = UserProfile.objects.get(user__id=business_user_id)
-            if user_profile.type != 'business':
-                return Response({"detail": "User is not a business user."}, status=403)
-        except UserProfile.DoesNotExist:
-            return Response({"detail": "Business user not found."}, status=404)
+            ids = list(dict.fromkeys(int(value) for value in raw_ids.split(',') if value.strip()))
+        except ValueError:
+            return Response({"detail": "business_user_ids must be a comma separated list of integers."}, status=400)
+        if not ids:
+            return Response({"detail": "business_user_ids is required."}, status=400)
+        if len(ids) > self.max_ids:
+            return Response({"detail": f"At most {self.max_ids} business_user_ids are allowed."}, status=400)
+
+        rows = UserProfile.objects.filter(user_id__in=ids, type='business').order_by().values(
+            'user_id',
+            'user__order_stats__in_progress_count',
+            'user__order_stats__completed_count',
+            'user__order_stats__cancelled_count',
+        )
+        counts = {
+            row['user_id']: {
+                "business_user_id": row['user_id'],
+                "in_progress": row['user__order_stats__in_progress_count'] or 0,
+                "completed": row['user__order_stats__completed_count'] or 0,
+                "cancelled": row['user__order_stats__cancelled_count'] or 0,
+            }
+            for row in rows
+        }
+        return Response({"results": [counts[pk] for pk in ids if pk in counts]})
 
-        count = Order.objects.filter(business_user_id=business_user_id, status='completed').count()
-        return Response({"completed_order_count": count})
-    
 class ReviewsFilter(filters.FilterSet):
     """
     FilterSet zum Filtern von Bewertungen.
@@ -319,18 +598,43 @@ class ReviewsFilter(filters.FilterSet):
         model = Review
         fields = ['business_user_id', 'reviewer_id']
         
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(ReplicaReadMixin, ConditionalGetMixin, ExportMixin, FastListMixin, viewsets.ModelViewSet):
     """
     API-Endpunkt für Reviews (Listenansicht und Erstellung).
+
+    Liste und Detail unterstützen Conditional GET (`304 Not Modified`).
+    `GET /reviews/export/?export_format=ndjson|csv` streamt alle eigenen Bewertungen.
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
+    fast_list_serializer_class = FastReviewSerializer
     permission_classes = [IsReviewerOrAdmin] 
 
     filter_backends = [DjangoFilterBackend,OrderingFilter]
     filterset_class = ReviewsFilter
     ordering_fields = ['rating', 'updated_at']
+    export_filename = 'reviews'
+    export_fields = {
+        'id': 'id',
+        'business_user': 'business_user_id',
+        'reviewer': 'customer_user_id',
+        'rating': 'rating',
+        'description': 'description',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
     
+    def get_export_queryset(self):
+        user = self.request.user
+        return Review.objects.filter(Q(business_user=user) | Q(customer_user=user))
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def export(self, request):
+        """
+        Streamt alle Bewertungen des Benutzers (erhalten oder abgegeben) als NDJSON oder CSV.
+        """
+        return self.export_response(request)
+
     def perform_create(self, serializer):
         serializer.save(customer_user=self.request.user)
 
@@ -339,7 +643,10 @@ class ReviewViewSet(viewsets.ModelViewSet):
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
     
-class BaseInfoView(APIView):
+BASE_INFO_CACHE_KEY = 'coderr:base-info'
+
+
+class BaseInfoView(ReplicaReadMixin, APIView):
     """
     API-Endpunkt für allgemeine Basisinformationen.
 
@@ -348,21 +655,37 @@ class BaseInfoView(APIView):
 
     **Details**:
     - Keine Authentifizierung erforderlich.
+    - Liest die inkrementell gepflegte Zeile `PlatformStats` statt vier Aggregaten über die
+      Quelltabellen und cached das Ergebnis für höchstens `settings.BASE_INFO_MAX_AGE` Sekunden.
     """
     def get(self, request, format=None):
-        review_count = Review.objects.count()
-        
-        average_rating = Review.objects.aggregate(avg_rating=Avg('rating'))['avg_rating'] or 0.0
-        average_rating = round(average_rating, 1)
-        
-        business_profile_count = UserProfile.objects.filter(type='business').count()
-        offer_count = Offers.objects.count()
-
-        data = {
-            "review_count": review_count,
-            "average_rating": average_rating,
-            "business_profile_count": business_profile_count,
-            "offer_count": offer_count,
-        }
+        data = cache.get(BASE_INFO_CACHE_KEY)
+        if data is None:
+            stats = PlatformStats.load()
+            data = {
+                "review_count": stats.review_count,
+                "average_rating": stats.average_rating,
+                "business_profile_count": stats.business_profile_count,
+                "offer_count": stats.offer_count,
+            }
+            cache.set(BASE_INFO_CACHE_KEY, data, settings.BASE_INFO_MAX_AGE)
+
+        return Response(data, status=status.HTTP_200_OK)
 
-        return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+
+class MetricsView(APIView):
+    """
+    API-Endpunkt für Laufzeitmetriken der Views im Prometheus-Textformat.
+
+    **Methoden**:
+    - GET: Gibt Request-Anzahl nach Status sowie Histogramme für Latenz, SQL-Queries, SQL-Zeit
+      und Antwortgröße pro URL-Name zurück.
+
+    **Details**:
+    - Nur für Staff-Benutzer (`is_staff`).
+    - Die Werte werden von `coderr_app.metrics.ViewMetricsMiddleware` prozesslokal gesammelt.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, format=None):
+        return HttpResponse(view_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
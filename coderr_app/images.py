@@ -0,0 +1,266 @@
+import io
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db.models import Exists, F, Q
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+
+from .models import CacheVersion, ImageTask, Offers, UserProfile
+
+# Bildfelder mit Varianten: `kind` -> (Modell, Feldname); Varianten liegen in `<feldname>_variants`.
+IMAGE_FIELDS = {
+    'offer': (Offers, 'image'),
+    'profile': (UserProfile, 'file'),
+}
+
+VARIANT_EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg', 'PNG': 'png'}
+
+
+# Pillow wird erst in den Funktionen des Workers importiert: Web-Worker brauchen über Signale und
+# Serializer nur `enqueue_image_task` und `variant_file` und sparen sich den Import beim Start.
+
+
+def permanent_errors():
+    """
+    Fehler, bei denen ein erneuter Versuch nichts ändert (keine oder zu große Bilddatei).
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    return (UnidentifiedImageError, Image.DecompressionBombError)
+
+
+def variants_attname(field_name):
+    return f'{field_name}_variants'
+
+
+def variant_file(file, variant):
+    """
+    Gibt die Variante `variant` eines Bildes als `FieldFile` zurück.
+
+    Solange keine zum aktuellen Original passende Variante existiert (Auftrag noch offen,
+    Bild ersetzt oder Verarbeitung fehlgeschlagen), wird das Original zurückgegeben.
+    """
+    if not file:
+        return file
+    variants = getattr(file.instance, variants_attname(file.field.name), None) or {}
+    name = variants.get(variant)
+    if name is None or variants.get('source') != file.name:
+        return file
+    return FieldFile(file.instance, file.field, name)
+
+
+def staging_storage():
+    """
+    Lokaler Storage für zwischengelagerte Uploads (`settings.IMAGE_STAGING_ROOT`).
+    """
+    return FileSystemStorage(location=settings.IMAGE_STAGING_ROOT)
+
+
+def stage_upload(kind, instance, update_fields=None):
+    """
+    Legt ein neu hochgeladenes Bild von `instance` im lokalen Staging-Verzeichnis ab, statt es
+    beim Speichern in den Media-Storage (z. B. Cloudinary) zu schreiben, und setzt das Feld bis
+    zur Übertragung durch den Worker auf das vorherige Bild zurück.
+
+    Nur mit `settings.IMAGE_STAGE_UPLOADS`; den Auftrag legt `enqueue_image_task` nach dem
+    Speichern an.
+    """
+    _, field_name = IMAGE_FIELDS[kind]
+    file = getattr(instance, field_name)
+    if not settings.IMAGE_STAGE_UPLOADS or not file or file._committed:
+        return
+    if update_fields is not None and field_name not in update_fields:
+        return
+
+    instance._staged_upload = staging_storage().save(f'{kind}/{os.path.basename(file.name)}', file)
+    if instance._state.adding:
+        previous = file.field.get_default()
+    else:
+        previous = type(instance)._default_manager.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+    setattr(instance, field_name, previous)
+
+
+def newer_uploads(task):
+    """
+    Zwischengelagerte Uploads für dasselbe Objekt, die nach `task` hochgeladen wurden.
+    """
+    return ImageTask.objects.filter(kind=task.kind, object_id=task.object_id, pk__gt=task.pk).exclude(staged='')
+
+
+def discard_staged(task):
+    """
+    Löscht den zwischengelagerten Upload eines Auftrags, sobald er nicht mehr gebraucht wird.
+    """
+    if task.staged:
+        staging_storage().delete(task.staged)
+
+
+def enqueue_image_task(kind, instance):
+    """
+    Legt einen `ImageTask` an, wenn das Bild von `instance` neu ist bzw. ersetzt wurde, und gibt
+    ihn zurück.
+
+    Pro hochgeladener Datei gibt es höchstens einen Auftrag; fehlgeschlagene Aufträge werden
+    nicht bei jedem Speichern neu angelegt. Kostet keine Query, solange die gespeicherten
+    Varianten zum aktuellen Original gehören. Zwischengelagerte Uploads (`stage_upload`)
+    erhalten immer einen eigenen Auftrag.
+    """
+    staged = instance.__dict__.pop('_staged_upload', None)
+    if staged:
+        return ImageTask.objects.create(kind=kind, object_id=instance.pk, staged=staged)
+
+    _, field_name = IMAGE_FIELDS[kind]
+    file = getattr(instance, field_name)
+    variants = getattr(instance, variants_attname(field_name)) or {}
+    if not file or variants.get('source') == file.name:
+        return None
+    task, created = ImageTask.objects.get_or_create(kind=kind, object_id=instance.pk, source=file.name)
+    return task if created else None
+
+
+def enqueue_missing():
+    """
+    Legt Aufträge für alle vorhandenen Bilder ohne passende Varianten an (z. B. nach dem Deployment).
+    """
+    created = 0
+    for kind, (model, field_name) in IMAGE_FIELDS.items():
+        attname = variants_attname(field_name)
+        instances = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+        for instance in instances.only('pk', field_name, attname).iterator():
+            task = enqueue_image_task(kind, instance)
+            created += task is not None
+    return created
+
+
+def claim_tasks(limit):
+    """
+    Beansprucht bis zu `limit` offene oder hängengebliebene Aufträge (älter als
+    `settings.IMAGE_TASK_TIMEOUT`) für den aufrufenden Worker.
+
+    Jeder Auftrag wird über ein bedingtes UPDATE auf den zuvor gelesenen Stand übernommen;
+    parallel laufende Worker erhalten dadurch nie denselben Auftrag.
+    """
+    stale = timezone.now() - timedelta(seconds=settings.IMAGE_TASK_TIMEOUT)
+    candidates = ImageTask.objects.filter(
+        Q(status='pending') | Q(status='processing', updated_at__lt=stale)
+    ).order_by('id').values_list('pk', 'status', 'updated_at')[:limit]
+
+    claimed = [
+        pk for pk, status, updated_at in candidates
+        if ImageTask.objects.filter(pk=pk, status=status, updated_at=updated_at).update(
+            status='processing', attempts=F('attempts') + 1, updated_at=timezone.now()
+        )
+    ]
+    return list(ImageTask.objects.filter(pk__in=claimed))
+
+
+def run_task(task):
+    """
+    Bearbeitet einen beanspruchten Auftrag und speichert das Ergebnis im Auftrag.
+
+    Vorübergehende Fehler (z. B. Storage nicht erreichbar) werden bis zu
+    `settings.IMAGE_TASK_MAX_ATTEMPTS` Mal wiederholt, ungültige Bilder sofort als `failed` markiert.
+    """
+    try:
+        process_task(task)
+    except permanent_errors() as exc:
+        task.status, task.error = 'failed', f'{type(exc).__name__}: {exc}'
+    except Exception as exc:
+        retry = task.attempts < settings.IMAGE_TASK_MAX_ATTEMPTS
+        task.status, task.error = 'pending' if retry else 'failed', f'{type(exc).__name__}: {exc}'
+    else:
+        task.status, task.error = 'done', ''
+    if task.status == 'failed':
+        discard_staged(task)
+    task.save(update_fields=['source', 'status', 'error', 'updated_at'])
+    return task
+
+
+def process_task(task):
+    """
+    Erzeugt alle Varianten des Originals `task.source` und hängt sie an das Objekt.
+
+    Zwischengelagerte Uploads (`task.staged`) werden aus dem Staging-Verzeichnis gerendert, erst
+    hier in den Media-Storage geschrieben und zusammen mit den Varianten am Objekt gesetzt.
+
+    Wurde das Bild inzwischen ersetzt oder das Objekt gelöscht, ist der Auftrag erledigt, ohne
+    etwas zu erzeugen. Das Speichern der Varianten setzt `updated_at` (bei Profilen zusätzlich
+    die `CacheVersion` `profiles`), damit Conditional GET und Caches die neuen URLs sehen.
+    """
+    model, field_name = IMAGE_FIELDS[task.kind]
+    attname = variants_attname(field_name)
+    instance = model.objects.filter(pk=task.object_id).only('pk', field_name, attname).first()
+    if instance is None or (task.staged and newer_uploads(task).exists()):
+        discard_staged(task)
+        return
+    file = getattr(instance, field_name)
+    if task.staged:
+        original, current = staging_storage().open(task.staged), ~Exists(newer_uploads(task))
+    elif file and file.name == task.source:
+        original, current = file, Q(**{field_name: task.source})
+    else:
+        return
+
+    storage = file.storage
+    rendered = render_variants(original)
+    values = {}
+    if task.staged:
+        with original.open('rb'):
+            task.source = storage.save(file.field.generate_filename(instance, os.path.basename(task.staged)), original)
+        values[field_name] = task.source
+    names = {
+        variant: storage.save(variant_path(task.source, variant), ContentFile(content))
+        for variant, content in rendered.items()
+    }
+    updated = model.objects.filter(current, pk=instance.pk).update(
+        **values, **{attname: {'source': task.source, **names}, 'updated_at': timezone.now()}
+    )
+    if updated and model is UserProfile:
+        CacheVersion.bump('profiles')
+
+    # Ersetzte Varianten löschen; wurde das Bild währenddessen ersetzt, die gerade erzeugten
+    # (bei zwischengelagerten Uploads samt übertragenem Original).
+    previous = getattr(instance, attname) or {}
+    obsolete = [*names.values(), *values.values()] if not updated else [
+        name for variant, name in previous.items() if variant != 'source' and name not in names.values()
+    ]
+    for name in obsolete:
+        storage.delete(name)
+    discard_staged(task)
+
+
+def render_variants(file):
+    """
+    Skaliert das Bild auf alle Größen aus `settings.IMAGE_VARIANTS` (Seitenverhältnis bleibt
+    erhalten, kleinere Bilder werden nicht vergrößert) und gibt die kodierten Dateien zurück.
+
+    Die Varianten werden von groß nach klein jeweils aus der vorherigen berechnet.
+    """
+    from PIL import Image, ImageOps
+
+    with file.open('rb'):
+        image = ImageOps.exif_transpose(Image.open(file))
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha and settings.IMAGE_VARIANT_FORMAT != 'JPEG' else 'RGB')
+
+    rendered = {}
+    by_size = sorted(settings.IMAGE_VARIANTS.items(), key=lambda item: item[1][0] * item[1][1], reverse=True)
+    for variant, size in by_size:
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format=settings.IMAGE_VARIANT_FORMAT, quality=settings.IMAGE_VARIANT_QUALITY)
+        rendered[variant] = buffer.getvalue()
+    return rendered
+
+
+def variant_path(name, variant):
+    """
+    Dateiname einer Variante, z. B. `profile_img/a.png` -> `variants/profile_img/a_thumbnail.webp`.
+    """
+    stem, _ = os.path.splitext(name)
+    extension = VARIANT_EXTENSIONS.get(settings.IMAGE_VARIANT_FORMAT, settings.IMAGE_VARIANT_FORMAT.lower())
+    return f'variants/{stem}_{variant}.{extension}'
@@ -0,0 +1,313 @@
+import json
+import math
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries, transaction
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from coderr_app.api import urls as api_urls
+from coderr_app.models import BusinessOrderStats, OfferDetails, Offers, Order, Review
+from user_auth_app.api.authentication import CachedTokenAuthentication
+
+Scenario = namedtuple('Scenario', 'name route method path role data heavy max_queries', defaults=[None])
+
+# `heavy` kennzeichnet unpaginierte Listen, die auf großen Datenmengen nur mit
+# `--heavy-iterations` Durchläufen gemessen werden. `max_queries` ist das Query-Budget pro
+# Request (inkl. Response-Cache-Miss, bei aufgewärmtem Auth-Cache); ein Überschreiten lässt den
+# Lauf fehlschlagen.
+SCENARIOS = [
+    Scenario('api root', 'api-root', 'get', '/api/', 'customer', None, False),
+    Scenario('base info', 'base-info', 'get', '/api/base-info/', None, None, False),
+    Scenario('profile detail', 'user_profile_detail', 'get', '/api/profile/{business}/', 'customer', None, False),
+    Scenario('profile patch', 'user_profile_detail', 'patch', '/api/profile/{business}/', 'business',
+             {'location': 'Berlin'}, False),
+    Scenario('business profiles', 'business-profiles-list', 'get', '/api/profiles/business/', None, None, False, 3),
+    Scenario('business profiles top rated', 'business-profiles-list', 'get',
+             '/api/profiles/business/?ordering=-average_rating', None, None, False, 3),
+    Scenario('business profiles filtered', 'business-profiles-list', 'get',
+             '/api/profiles/business/?location=Berlin&min_rating=3.5&min_reviews=10', None, None, False, 3),
+    Scenario('business profiles cursor', 'business-profiles-list', 'get',
+             '/api/profiles/business/?pagination=cursor&ordering=-average_rating', None, None, False, 2),
+    Scenario('business profile detail', 'business-profiles-detail', 'get',
+             '/api/profiles/business/{business_profile}/', None, None, False),
+    Scenario('customer profiles', 'customer-profiles-list', 'get', '/api/profiles/customer/', None, None, False, 3),
+    Scenario('customer profiles cursor', 'customer-profiles-list', 'get',
+             '/api/profiles/customer/?pagination=cursor&page_size=100', None, None, False, 2),
+    Scenario('customer profile detail', 'customer-profiles-detail', 'get',
+             '/api/profiles/customer/{customer_profile}/', None, None, False),
+    Scenario('offers', 'offers-list', 'get', '/api/offers/', 'customer', None, False, 3),
+    Scenario('offers page of 100', 'offers-list', 'get', '/api/offers/?page_size=100', 'customer', None, False, 3),
+    Scenario('offers filtered', 'offers-list', 'get', '/api/offers/?min_price=50&max_delivery_time=7&ordering=min_price',
+             'customer', None, False, 3),
+    Scenario('offers search', 'offers-list', 'get', '/api/offers/?search=design', 'customer', None, False, 4),
+    Scenario('offers by creator', 'offers-list', 'get', '/api/offers/?creator_id={business}', 'customer', None, False, 3),
+    Scenario('offers cursor', 'offers-list', 'get', '/api/offers/?pagination=cursor', 'customer', None, False, 2),
+    Scenario('offer facets', 'offers-facets', 'get', '/api/offers/facets/', 'customer', None, False, 1),
+    Scenario('offer facets filtered', 'offers-facets', 'get',
+             '/api/offers/facets/?min_price=100&max_delivery_time=7&search=design', 'customer', None, False, 2),
+    Scenario('offer create', 'offers-list', 'post', '/api/offers/', 'business', 'offer', False),
+    Scenario('offer detail', 'offers-detail', 'get', '/api/offers/{offer}/', 'customer', None, False, 3),
+    Scenario('offer patch', 'offers-detail', 'patch', '/api/offers/{offer}/', 'business', {'title': 'Updated'}, False),
+    Scenario('offer details list', 'offer-detail-list', 'get', '/api/offerdetails/', 'customer', None, True),
+    Scenario('offer details detail', 'offer-detail-detail', 'get', '/api/offerdetails/{detail}/', 'customer', None, False),
+    Scenario('orders (customer)', 'oders-list', 'get', '/api/orders/', 'customer', None, False),
+    Scenario('orders (seller)', 'oders-list', 'get', '/api/orders/?role=seller', 'business', None, False),
+    Scenario('orders (seller, completed)', 'oders-list', 'get', '/api/orders/?role=seller&status=completed',
+             'business', None, False),
+    Scenario('order create', 'oders-list', 'post', '/api/orders/', 'customer', {'offer_detail_id': '{detail}'}, False),
+    Scenario('order detail', 'oders-detail', 'get', '/api/orders/{order}/', 'business', None, False),
+    Scenario('order patch', 'oders-detail', 'patch', '/api/orders/{order}/', 'business', {'status': 'completed'}, False),
+    Scenario('order export', 'oders-export', 'get', '/api/orders/export/', 'business', None, False),
+    Scenario('order count', 'order-count', 'get', '/api/order-count/{business}/', 'customer', None, False),
+    Scenario('completed order count', 'completed,order-count', 'get', '/api/completed-order-count/{business}/',
+             'customer', None, False),
+    Scenario('order counts', 'order-counts', 'get', '/api/order-counts/?business_user_ids={business_ids}',
+             'customer', None, False),
+    Scenario('reviews', 'reviews-list', 'get', '/api/reviews/', 'customer', None, True),
+    Scenario('reviews by business', 'reviews-list', 'get', '/api/reviews/?business_user_id={business}&ordering=-updated_at',
+             'customer', None, False),
+    Scenario('review create', 'reviews-list', 'post', '/api/reviews/', 'customer',
+             {'business_user': '{business}', 'rating': 4, 'description': 'Gut'}, False),
+    Scenario('review detail', 'reviews-detail', 'get', '/api/reviews/{review}/', 'customer', None, False),
+    Scenario('review patch', 'reviews-detail', 'patch', '/api/reviews/{review}/', 'customer', {'rating': 5}, False),
+    Scenario('review export', 'reviews-export', 'get', '/api/reviews/export/', 'business', None, False),
+    Scenario('metrics', 'metrics', 'get', '/api/metrics/', 'staff', None, False),
+]
+
+OFFER_PAYLOAD = {
+    'title': 'Benchmark Paket',
+    'description': 'Angebot aus dem Benchmark.',
+    'details': [
+        {'title': offer_type, 'revisions': 2, 'delivery_time_in_days': days, 'price': price,
+         'features': ['Logo Design'], 'offer_type': offer_type}
+        for offer_type, days, price in [('basic', 3, 100), ('standard', 5, 200), ('premium', 7, 400)]
+    ],
+}
+
+
+def percentile(sorted_values, percent):
+    """
+    Perzentil nach der Nearest-Rank-Methode.
+    """
+    index = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def api_route_names(patterns=None):
+    """
+    Alle benannten Routen aus `coderr_app/api/urls.py` (inkl. der Router-Routen).
+    """
+    names = set()
+    for pattern in api_urls.urlpatterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            names |= api_route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+class Command(BaseCommand):
+    """
+    Misst alle Routen aus `coderr_app/api/urls.py` in-process über den Django-Test-Client
+    (inkl. Middleware und Token-Authentifizierung) auf einem mit `seed_data` befüllten Datenbestand.
+
+    **Details**:
+    - Pro Szenario werden p50/p95/p99-Latenz, Queries pro Request und der Durchsatz
+      (Requests/s, ein Thread) ausgegeben.
+    - Schreibende Szenarien laufen in einer Transaktion, die nach jedem Request zurückgerollt wird.
+    - `--save-baseline` schreibt die Ergebnisse als JSON, `--baseline` vergleicht damit;
+      mit `--max-regression` schlägt der Lauf fehl, wenn p95 oder die Query-Anzahl steigt.
+    - Szenarien mit `max_queries` schlagen fehl, sobald ein Request mehr Queries braucht.
+      Der Response-Cache wird vor jedem Szenario geleert, damit auch der Cache-Miss zählt.
+    """
+    help = 'Benchmark every API route in-process (p50/p95/p99, queries, throughput) and compare with a baseline file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30)
+        parser.add_argument('--heavy-iterations', type=int, default=3,
+                            help='Iterations for unpaginated full-table lists.')
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--only', action='append', default=[],
+                            help='Only run scenarios whose name contains this text (repeatable).')
+        parser.add_argument('--baseline', help='Compare with a baseline JSON file.')
+        parser.add_argument('--save-baseline', help='Write the results to a baseline JSON file.')
+        parser.add_argument('--max-regression', type=float,
+                            help='Fail if p95 grows by more than this fraction (e.g. 0.2) or queries per request increase.')
+
+    def handle(self, *args, **options):
+        context = self.build_context()
+        clients = self.build_clients(context)
+        scenarios = [
+            scenario for scenario in SCENARIOS
+            if not options['only'] or any(text in scenario.name for text in options['only'])
+        ]
+        baseline = self.load_baseline(options['baseline'])
+
+        uncovered = api_route_names() - {scenario.route for scenario in SCENARIOS}
+        if uncovered:
+            self.stdout.write(self.style.WARNING(f'Routes without scenario: {", ".join(sorted(uncovered))}'))
+
+        self.stdout.write(
+            f'{"scenario":<30} {"n":>4} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"queries":>8} {"req/s":>8}'
+            + ('  vs. baseline' if baseline else '')
+        )
+        results, regressions = {}, []
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for scenario in scenarios:
+                iterations = options['heavy_iterations'] if scenario.heavy else options['iterations']
+                result = self.run_scenario(scenario, clients, context, iterations, options['warmup'])
+                results[scenario.name] = result
+                comparison = self.compare(result, baseline.get(scenario.name), options['max_regression'])
+                if comparison.startswith('REGRESSION'):
+                    regressions.append(scenario.name)
+                if scenario.max_queries is not None and result['max_queries'] > scenario.max_queries:
+                    comparison = f'OVER QUERY BUDGET ({result["max_queries"]} > {scenario.max_queries}) {comparison}'
+                    regressions.append(scenario.name)
+                self.stdout.write(
+                    f'{scenario.name:<30} {result["n"]:>4} {result["p50_ms"]:>9.1f} {result["p95_ms"]:>9.1f} '
+                    f'{result["p99_ms"]:>9.1f} {result["queries"]:>8.1f} {result["rps"]:>8.1f}  {comparison}'
+                )
+
+        if options['save_baseline']:
+            with open(options['save_baseline'], 'w', encoding='utf-8') as baseline_file:
+                json.dump({'dataset': self.dataset_size(), 'results': results}, baseline_file, indent=2)
+            self.stdout.write(f'Baseline written to {options["save_baseline"]}')
+        if regressions:
+            raise CommandError(f'Regressions in: {", ".join(regressions)}')
+
+    def build_context(self):
+        """
+        Wählt die IDs für die URL-Platzhalter: den Anbieter mit den meisten Bestellungen und
+        einen seiner Kunden, jeweils mit Angebot, Bestellung und Bewertung.
+        """
+        stats = BusinessOrderStats.objects.annotate(
+            total=F('in_progress_count') + F('completed_count') + F('cancelled_count')
+        ).order_by('-total').first()
+        if stats is None:
+            raise CommandError('No orders found; run "manage.py seed_data" first.')
+
+        business = stats.business_user
+        order = Order.objects.filter(business_user=business).order_by('-id').first()
+        customer = order.customer_user
+        review = Review.objects.filter(customer_user=customer).order_by('-id').first()
+        if review is None:
+            review = Review.objects.create(business_user=business, customer_user=customer, rating=4,
+                                           description='Benchmark')
+        offer = Offers.objects.filter(user=business).order_by('-id').first()
+        business_ids = BusinessOrderStats.objects.order_by('business_user_id').values_list('business_user_id', flat=True)
+        return {
+            'business': business.id,
+            'customer': customer.id,
+            'business_profile': business.user_profile.id,
+            'customer_profile': customer.user_profile.id,
+            'business_ids': ','.join(map(str, business_ids[:100])),
+            'offer': offer.id,
+            'detail': OfferDetails.objects.filter(offer=offer).values_list('id', flat=True).first(),
+            'order': order.id,
+            'review': review.id,
+            'users': {'business': business, 'customer': customer},
+        }
+
+    def build_clients(self, context):
+        clients = {None: APIClient()}
+        for role, user in context['users'].items():
+            token, _ = Token.objects.get_or_create(user=user)
+            CachedTokenAuthentication().authenticate_credentials(token.key)  # Auth-Cache aufwärmen
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+            clients[role] = client
+        clients['staff'] = APIClient()
+        clients['staff'].force_authenticate(User(username='benchmark-staff', is_staff=True))
+        return clients
+
+    def run_scenario(self, scenario, clients, context, iterations, warmup):
+        client = clients[scenario.role]
+        path = scenario.path.format(**context)
+        data = OFFER_PAYLOAD if scenario.data == 'offer' else self.format_data(scenario.data, context)
+        timings, queries, max_queries, status_code = [], 0, 0, None
+        caches[settings.RESPONSE_CACHE].clear()
+        for iteration in range(warmup + iterations):
+            reset_queries()  # queries_log ist begrenzt, ohne Reset zählt CaptureQueriesContext nicht mehr
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                status_code = self.request(client, scenario.method, path, data)
+                elapsed = time.perf_counter() - started
+            max_queries = max(max_queries, len(captured))
+            if iteration >= warmup:
+                timings.append(elapsed)
+                queries += len(captured)
+        timings.sort()
+        return {
+            'n': len(timings),
+            'status': status_code,
+            'p50_ms': percentile(timings, 50) * 1000,
+            'p95_ms': percentile(timings, 95) * 1000,
+            'p99_ms': percentile(timings, 99) * 1000,
+            'queries': queries / len(timings),
+            'max_queries': max_queries,
+            'rps': len(timings) / sum(timings),
+        }
+
+    def request(self, client, method, path, data):
+        if method == 'get':
+            return self.consume(client.get(path))
+        with transaction.atomic():
+            status_code = self.consume(getattr(client, method)(path, data, format='json'))
+            transaction.set_rollback(True)
+        return status_code
+
+    def consume(self, response):
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        if response.status_code >= 400:
+            raise CommandError(f'{response.request["REQUEST_METHOD"]} {response.request["PATH_INFO"]} '
+                               f'returned {response.status_code}: {response.content[:200]!r}')
+        return response.status_code
+
+    def format_data(self, data, context):
+        if data is None:
+            return None
+        return {
+            key: int(value.format(**context)) if isinstance(value, str) and value.startswith('{') else value
+            for key, value in data.items()
+        }
+
+    def dataset_size(self):
+        return {
+            'users': User.objects.count(),
+            'offers': Offers.objects.count(),
+            'orders': Order.objects.count(),
+            'reviews': Review.objects.count(),
+        }
+
+    def load_baseline(self, path):
+        if not path:
+            return {}
+        try:
+            with open(path, encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Cannot read baseline {path}: {exc}')
+        if baseline.get('dataset') != self.dataset_size():
+            self.stdout.write(self.style.WARNING('Baseline was recorded on a different dataset size.'))
+        return baseline.get('results', {})
+
+    def compare(self, result, previous, max_regression):
+        if not previous:
+            return ''
+        p95_change = result['p95_ms'] / previous['p95_ms'] - 1 if previous['p95_ms'] else 0
+        query_change = result['queries'] - previous['queries']
+        text = f'p95 {p95_change:+.0%}, queries {query_change:+.1f}'
+        if max_regression is not None and (p95_change > max_regression or query_change > 0.5):
+            return f'REGRESSION ({text})'
+        return text
@@ -0,0 +1,153 @@
+import datetime
+import decimal
+import io
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from coderr_app.api import renderers
+from coderr_app.api.renderers import FastJSONParser, FastJSONRenderer
+
+PARITY_CASES = [
+    None,
+    {},
+    [],
+    {'price': '100.00', 'features': ['Logo Design', 'Visitenkarte'], 'revisions': -1},
+    {'decimal': decimal.Decimal('12.50'), 'float': 4.7, 'int': 2 ** 53, 'big': 2 ** 70},
+    {'aware': timezone.make_aware(datetime.datetime(2024, 11, 5, 12, 30, 15, 123456), datetime.timezone.utc),
+     'naive': datetime.datetime(2024, 11, 5, 12, 30), 'date': datetime.date(2024, 11, 5),
+     'time': datetime.time(8, 15, 30, 250), 'delta': datetime.timedelta(days=1, seconds=3)},
+    {'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'), 'lazy': gettext_lazy('Not found.'),
+     'error': [ErrorDetail('This field is required.', code='required')], 'tuple': (1, 2), 'set': {3}},
+    {1: 'int key', 'unicode': 'Größe ✓ 日本語    ', 'escape': '"\\\n\t\x00'},
+    {'nested': [{'level': [{'deep': [1, [2, [3]]]}]}], 'bool': [True, False, None]},
+    {'floats': [0.0, -0.0, 1e-4, 0.1, 1 / 3, 9999999999999998.0, 1e16, -1e22, 1e-5, 5e-324, 1.7976931348623157e308]},
+    {'rating': 4.5, 'nested': [{'tiny': 1e-7}]},
+    {'nan': float('nan')},
+    {'infinity': [float('inf')]},
+]
+
+PARSER_CASES = [
+    b'{"title":"Grafikdesign-Paket","details":[{"price":100.5,"features":["Logo"]}]}',
+    '{"unicode":"Größe ✓ 日本語","escaped":"\\u00e4\\ud83d\\ude00"}'.encode(),
+    b'[1, 2.5, -3e10, true, false, null, 123456789012345678901234567890]',
+    b'{"a": 1, "a": 2}',
+    b'{"bad": NaN}',
+    b'{"trailing": 1,}',
+    b'\xef\xbb\xbf{"bom": 1}',
+    b'\xff\xfe',
+    b'',
+]
+
+
+class Command(BaseCommand):
+    """
+    Prüft, dass `FastJSONRenderer`/`FastJSONParser` dieselben Ergebnisse wie die DRF-Klassen
+    liefern (Randfälle und ein typischer Listen-Payload), und vergleicht die Laufzeiten.
+
+    Mit `--without-orjson` wird zusätzlich der Fallback ohne `orjson` geprüft.
+    """
+    help = 'Check FastJSONRenderer/FastJSONParser parity with the DRF JSON classes and benchmark them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--objects', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--without-orjson', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['without_orjson']:
+            renderers.orjson = None
+        elif renderers.orjson is None:
+            self.stdout.write('orjson is not installed; checking the stdlib fallback.')
+
+        payload = self.build_payload(options['objects'])
+        self.check_renderer(payload)
+        self.check_parser(JSONRenderer().render(payload))
+        self.stdout.write(f'parity: {len(PARITY_CASES) + 2} render cases, {len(PARSER_CASES) + 1} parse cases identical')
+
+        body = JSONRenderer().render(payload)
+        for label, slow, fast in [
+            ('render', lambda: JSONRenderer().render(payload), lambda: FastJSONRenderer().render(payload)),
+            ('parse', lambda: JSONParser().parse(io.BytesIO(body)), lambda: FastJSONParser().parse(io.BytesIO(body))),
+        ]:
+            slow_time = self.measure(slow, options['repeat'])
+            fast_time = self.measure(fast, options['repeat'])
+            self.stdout.write(
+                f'{label:<7} {len(body) / 1024:8.0f} KiB  drf={slow_time * 1000:8.1f} ms  '
+                f'fast={fast_time * 1000:8.1f} ms  speedup={slow_time / fast_time:4.1f}x'
+            )
+
+    def build_payload(self, count):
+        """
+        Entspricht einer Seite von `/api/offers/` bzw. `/api/orders/` mit `details` und `features`.
+        """
+        rng = random.Random(7)
+        now = timezone.now()
+        return {
+            'count': count,
+            'next': None,
+            'previous': None,
+            'results': [
+                {
+                    'id': i,
+                    'user': rng.randint(1, 500),
+                    'title': f'Grafikdesign-Paket {i}',
+                    'image': None,
+                    'description': 'Ein umfassendes Grafikdesign-Paket für Unternehmen.',
+                    'created_at': now - datetime.timedelta(minutes=i),
+                    'updated_at': now,
+                    'details': [{'id': i * 3 + n, 'url': f'/api/offerdetails/{i * 3 + n}/'} for n in range(3)],
+                    'min_price': decimal.Decimal(rng.randint(500, 50_000)) / 100,
+                    'min_delivery_time': rng.randint(1, 14),
+                    'features': ['Logo Design', 'Visitenkarte', 'Briefpapier'][:rng.randint(1, 3)],
+                    'user_details': {'first_name': 'Max', 'last_name': 'Müller', 'username': f'max{i}'},
+                }
+                for i in range(count)
+            ],
+        }
+
+    def check_renderer(self, payload):
+        cases = [(case, None, None) for case in PARITY_CASES] + [
+            (payload, None, None),
+            (payload['results'][:2], 'application/json; indent=4', None),
+        ]
+        for data, media_type, context in cases:
+            expected = self.render(JSONRenderer(), data, media_type, context)
+            actual = self.render(FastJSONRenderer(), data, media_type, context)
+            if actual != expected:
+                raise CommandError(f'Renderer output differs for {data!r:.200}:\n{expected!r:.300}\n{actual!r:.300}')
+
+    def render(self, renderer, data, media_type, context):
+        try:
+            return renderer.render(data, media_type, context)
+        except ValueError as exc:
+            return ('ValueError', str(exc))
+
+    def check_parser(self, rendered_payload):
+        for body in PARSER_CASES + [rendered_payload]:
+            expected = self.parse(JSONParser(), body)
+            actual = self.parse(FastJSONParser(), body)
+            if actual != expected:
+                raise CommandError(f'Parser result differs for {body!r:.200}:\n{expected!r:.300}\n{actual!r:.300}')
+
+    def parse(self, parser, body):
+        try:
+            return parser.parse(io.BytesIO(body))
+        except ParseError as exc:
+            return ('ParseError', str(exc.detail))
+
+    def measure(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
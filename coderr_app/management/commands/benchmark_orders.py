@@ -0,0 +1,129 @@
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from coderr_app.api.serializer import OrderSerializer
+from coderr_app.models import OfferDetails, Offers, Order, UserProfile
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Vergleicht die Bestellliste eines vielbeschäftigten Anbieters: die frühere Abfrage
+    (zwei Querysets per `|`, sortiert nach `title`, komplett serialisiert) mit der
+    paginierten Cursor-Liste von `/api/orders/`.
+
+    Die Testdaten werden per Bulk-Insert in einer Transaktion angelegt und anschließend
+    zurückgerollt.
+    """
+    help = 'Benchmark order listing for a busy seller on a seeded dataset (rolled back afterwards).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=1_000)
+        parser.add_argument('--seller-share', type=float, default=0.05,
+                            help='Share of all orders that belong to the measured seller.')
+        parser.add_argument('--pages', type=int, default=50, help='Number of cursor pages to walk.')
+        parser.add_argument('--batch-size', type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                seller = self.seed(options)
+                self.measure(seller, options['pages'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def seed(self, options):
+        started = time.perf_counter()
+        users = User.objects.bulk_create(
+            [User(username=f'benchmark-orders-{i}') for i in range(options['users'])]
+        )
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, type='business' if i % 2 else 'customer')
+            for i, user in enumerate(users)
+        ])
+        seller = users[1]
+        offers = Offers.objects.bulk_create([Offers(user=user, title='Benchmark', description='') for user in users[1::2]])
+        details = OfferDetails.objects.bulk_create([
+            OfferDetails(offer=offer, price=10, delivery_time_in_days=3, features=[], offer_type='basic')
+            for offer in offers
+        ])
+        seller_detail = details[0]
+
+        rng = random.Random(42)
+        statuses = ['in_progress', 'completed', 'completed', 'cancelled']
+        customers = users[0::2]
+        batch = []
+        for i in range(options['orders']):
+            detail = seller_detail if rng.random() < options['seller_share'] else rng.choice(details)
+            batch.append(Order(
+                customer_user=rng.choice(customers),
+                business_user_id=detail.offer.user_id,
+                offer_id=detail.offer_id,
+                offer_detail=detail,
+                status=rng.choice(statuses),
+                title=f'Order {rng.randrange(10**6)}',
+                delivery_time_in_days=3,
+                price=10,
+                features=[],
+                offer_type='basic',
+            ))
+            if len(batch) >= options['batch_size']:
+                Order.objects.bulk_create(batch)
+                batch = []
+        Order.objects.bulk_create(batch)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        seller_orders = Order.objects.filter(business_user=seller).count()
+        self.stdout.write(
+            f'Seeded {options["orders"]} orders ({seller_orders} for the seller) '
+            f'in {time.perf_counter() - started:.1f}s'
+        )
+        return seller
+
+    def measure(self, seller, pages):
+        legacy = Order.objects.filter(customer_user=seller) | Order.objects.filter(business_user=seller)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            rows = len(OrderSerializer(legacy.order_by('title'), many=True).data)
+            elapsed = time.perf_counter() - started
+        self.report('legacy full list', elapsed, len(queries), rows)
+
+        client = APIClient()
+        client.force_authenticate(seller)
+        for label, url in [
+            ('cursor page 1', '/api/orders/'),
+            ('cursor page 1 (seller)', '/api/orders/?role=seller'),
+            ('cursor page 1 (seller, completed)', '/api/orders/?role=seller&status=completed'),
+        ]:
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get(url)
+                elapsed = time.perf_counter() - started
+            self.report(label, elapsed, len(queries), len(response.data['results']))
+
+        for label, url in [('', '/api/orders/'), (' (seller)', '/api/orders/?role=seller')]:
+            timings = []
+            for _ in range(pages):
+                started = time.perf_counter()
+                response = client.get(url)
+                timings.append(time.perf_counter() - started)
+                url = response.data['next']
+                if not url:
+                    break
+            self.report(f'cursor page {len(timings)}{label}', timings[-1], None, len(response.data['results']))
+
+    def report(self, label, elapsed, queries, rows):
+        queries = '-' if queries is None else queries
+        self.stdout.write(f'{label:<36} {elapsed * 1000:9.1f} ms  queries={queries:<3} rows={rows}')
@@ -0,0 +1,137 @@
+import random
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from coderr_app.api.fast_serializer import (
+    FastBusinessProfileSerializer,
+    FastCustomerProfileSerializer,
+    FastOfferListSerializer,
+    FastOrderSerializer,
+    FastReviewSerializer,
+)
+from coderr_app.api.serializer import (
+    BusinesProfileSerializer,
+    CustomerProfileSerializer,
+    OfferListSerializer,
+    OrderSerializer,
+    ReviewSerializer,
+)
+from coderr_app.images import variant_path, variants_attname
+from coderr_app.models import BusinessRatingStats, OfferDetails, Offers, Order, Review, UserProfile
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Vergleicht die `ModelSerializer` der Listenansichten mit ihren schnellen Varianten aus
+    `coderr_app.api.fast_serializer` (Laufzeit inkl. JSON-Rendering) und prüft, dass beide
+    byte-identisches JSON erzeugen.
+
+    Die Testdaten werden in einer Transaktion angelegt und anschließend zurückgerollt.
+    """
+    help = 'Benchmark list serializers against their plain-dict fast path and check byte-identical output.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--objects', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.seed(options['objects'])
+                self.compare_all(options['repeat'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def image_fields(self, field_name, name, i):
+        """
+        Bildfelder im Wechsel: kein Bild, nur Original (Varianten ausstehend), Varianten fertig.
+        """
+        if i % 3 == 0:
+            return {}
+        variants = {} if i % 3 == 1 else {
+            'source': name, **{variant: variant_path(name, variant) for variant in settings.IMAGE_VARIANTS}
+        }
+        return {field_name: name, variants_attname(field_name): variants}
+
+    def seed(self, count):
+        rng = random.Random(7)
+        users = User.objects.bulk_create([
+            User(username=f'benchmark-serializer-{i}', first_name='Max', last_name='Muster')
+            for i in range(count)
+        ])
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, type='business' if i % 2 else 'customer', location='Berlin',
+                        tel='+49 123 456789', description='Beschreibung', working_hours='9-17',
+                        **self.image_fields('file', f'profile_img/benchmark-{i}.png', i))
+            for i, user in enumerate(users)
+        ])
+        BusinessRatingStats.objects.bulk_create([
+            BusinessRatingStats(business_user=user, review_count=2, rating_sum=7, average_rating=3.5, stars_3=1, stars_4=1)
+            for user in users[1::4]
+        ])
+        offers = Offers.objects.bulk_create([
+            Offers(user=users[i], title=f'Offer {i}', description='Beschreibung',
+                   min_price=None if i % 10 == 0 else rng.randint(5, 500), min_delivery_time=3,
+                   **self.image_fields('image', f'offers/benchmark-{i}.jpg', i))
+            for i in range(count)
+        ])
+        details = OfferDetails.objects.bulk_create([
+            OfferDetails(offer=offer, price=rng.randint(5, 500), features=['Logo', 'Flyer'], offer_type=offer_type)
+            for offer in offers for offer_type in ['basic', 'standard', 'premium']
+        ])
+        Order.objects.bulk_create([
+            Order(customer_user=users[i], business_user=detail.offer.user, offer=detail.offer, offer_detail=detail,
+                  title='Order', delivery_time_in_days=3, price=detail.price, features=detail.features,
+                  offer_type=detail.offer_type)
+            for i, detail in enumerate(details[:count])
+        ])
+        Review.objects.bulk_create([
+            Review(business_user=users[i], customer_user=users[-i - 1], rating=rng.randint(1, 5), description='Gut')
+            for i in range(count)
+        ])
+
+    def compare_all(self, repeat):
+        request = Request(APIRequestFactory().get('/'))
+        profiles = UserProfile.objects.select_related('user__rating_stats')
+        cases = [
+            ('offers', OfferListSerializer, FastOfferListSerializer,
+             Offers.objects.select_related('user').prefetch_related(
+                 Prefetch('details', queryset=OfferDetails.objects.only('id', 'offer_id')))),
+            ('business profiles', BusinesProfileSerializer, FastBusinessProfileSerializer, profiles.filter(type='business')),
+            ('customer profiles', CustomerProfileSerializer, FastCustomerProfileSerializer, profiles.filter(type='customer')),
+            ('reviews', ReviewSerializer, FastReviewSerializer, Review.objects.all()),
+            ('orders', OrderSerializer, FastOrderSerializer, Order.objects.all()),
+        ]
+        for label, serializer_class, fast_serializer_class, queryset in cases:
+            objects = list(queryset)
+            slow, slow_json = self.measure(serializer_class, objects, request, repeat)
+            fast, fast_json = self.measure(fast_serializer_class, objects, request, repeat)
+            if slow_json != fast_json:
+                raise CommandError(f'{label}: fast serializer output differs from {serializer_class.__name__}')
+            self.stdout.write(
+                f'{label:<18} n={len(objects):<6} serializer={slow * 1000:8.1f} ms  '
+                f'fast={fast * 1000:8.1f} ms  speedup={slow / fast:4.1f}x  identical=yes'
+            )
+
+    def measure(self, serializer_class, objects, request, repeat):
+        renderer = JSONRenderer()
+        best, rendered = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rendered = renderer.render(serializer_class(objects, many=True, context={'request': request}).data)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, rendered
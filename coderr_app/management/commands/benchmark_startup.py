@@ -0,0 +1,155 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from .import_times import ENTRY_POINTS
+
+# Läuft in einem frischen Interpreter: importiert den Entry Point (inkl. `django.setup()`) und
+# schickt einen ersten Request durch die Anwendung, wie ein neu gestarteter Worker.
+STARTUP_SCRIPT = '''
+import asyncio, importlib, json, resource, sys, time
+started = time.perf_counter()
+entry = importlib.import_module(sys.argv[1])
+ready = time.perf_counter()
+path, host, status = sys.argv[3], sys.argv[4], None
+
+if sys.argv[2] == 'wsgi':
+    from wsgiref.util import setup_testing_defaults
+    environ = {'PATH_INFO': path, 'HTTP_HOST': host, 'SERVER_NAME': host}
+    setup_testing_defaults(environ)
+    def start_response(status_line, headers, exc_info=None):
+        global status
+        status = int(status_line.split()[0])
+    response = entry.application(environ, start_response)
+    b''.join(response)
+    response.close()
+else:
+    async def request():
+        global status
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+            'headers': [(b'host', host.encode())], 'client': ('127.0.0.1', 0), 'server': (host, 80),
+        }
+        messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+        async def receive():
+            if messages:
+                return messages.pop()
+            await asyncio.Event().wait()  # kein Disconnect, bis die Antwort gesendet ist
+        async def send(message):
+            global status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+        await entry.application(scope, receive, send)
+    asyncio.run(request())
+
+served = time.perf_counter()
+print(json.dumps({
+    'ready_ms': (ready - started) * 1000,
+    'first_request_ms': (served - ready) * 1000,
+    'status': status,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+'''
+
+METRICS = ['process_ms', 'ready_ms', 'first_request_ms', 'rss_mb']
+
+
+class Command(BaseCommand):
+    """
+    Misst den Kaltstart der Entry Points `wsgi.py` und `asgi.py` in jeweils frischen Prozessen.
+
+    **Details**:
+    - `process_ms`: Prozessstart bis zur ersten Antwort (Interpreter, Imports, `django.setup()`,
+      URLconf und erster Request), gemessen vom aufrufenden Prozess.
+    - `ready_ms`: Import des Entry Points bis `application` bereitsteht, also die Zeit, die jeder
+      Gunicorn-/Uvicorn-Worker vor dem ersten Request braucht.
+    - `first_request_ms`: Erster Request an `--path` (lädt URLconf, Views und Serializer).
+    - `rss_mb`: Maximaler Speicherverbrauch des Prozesses.
+    - Ausgegeben wird der Median über `--runs` Prozesse. `--save-baseline` und `--baseline`
+      funktionieren wie bei `benchmark_endpoints`; mit `--max-regression` schlägt der Lauf fehl,
+      wenn `process_ms` oder `ready_ms` um mehr als den Anteil steigt.
+    """
+    help = 'Benchmark the cold start (process, setup, first request, memory) of the WSGI and ASGI entry points.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=10)
+        parser.add_argument('--entry', action='append', choices=sorted(ENTRY_POINTS),
+                            help='Entry point to measure (repeatable; default: wsgi and asgi).')
+        parser.add_argument('--path', default='/api/base-info/', help='Path of the first request.')
+        parser.add_argument('--host', default='localhost', help='Host header (must be in ALLOWED_HOSTS).')
+        parser.add_argument('--baseline', help='Compare with a baseline JSON file.')
+        parser.add_argument('--save-baseline', help='Write the results to a baseline JSON file.')
+        parser.add_argument('--max-regression', type=float,
+                            help='Fail if process_ms or ready_ms grows by more than this fraction (e.g. 0.2).')
+
+    def handle(self, *args, **options):
+        baseline = self.load_baseline(options['baseline'])
+        self.stdout.write(
+            f'{"entry":<6} {"runs":>4} {"process ms":>11} {"ready ms":>9} {"1st req ms":>11} {"rss MB":>7} {"status":>6}'
+            + ('  vs. baseline' if baseline else '')
+        )
+
+        results, regressions = {}, []
+        for entry in options['entry'] or sorted(ENTRY_POINTS):
+            runs = [self.run_once(entry, options['path'], options['host']) for _ in range(options['runs'])]
+            result = {metric: statistics.median(run[metric] for run in runs) for metric in METRICS}
+            result['runs'] = len(runs)
+            results[entry] = result
+
+            statuses = sorted({run['status'] for run in runs}, key=str)
+            comparison = self.compare(result, baseline.get(entry), options['max_regression'])
+            if comparison.startswith('REGRESSION'):
+                regressions.append(entry)
+            self.stdout.write(
+                f'{entry:<6} {result["runs"]:>4} {result["process_ms"]:>11.1f} {result["ready_ms"]:>9.1f} '
+                f'{result["first_request_ms"]:>11.1f} {result["rss_mb"]:>7.1f} {"/".join(map(str, statuses)):>6}'
+                f'  {comparison}'
+            )
+
+        if options['save_baseline']:
+            with open(options['save_baseline'], 'w', encoding='utf-8') as baseline_file:
+                json.dump({'results': results}, baseline_file, indent=2)
+            self.stdout.write(f'Baseline written to {options["save_baseline"]}')
+        if regressions:
+            raise CommandError(f'Regressions in: {", ".join(regressions)}')
+
+    def run_once(self, entry, path, host):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT, ENTRY_POINTS[entry], entry, path, host],
+            cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+        )
+        elapsed = time.perf_counter() - started
+        if result.returncode:
+            raise CommandError(f'Starting {entry} failed:\n{result.stderr[-2000:]}')
+        run = json.loads(result.stdout.strip().splitlines()[-1])
+        run['process_ms'] = elapsed * 1000
+        return run
+
+    def load_baseline(self, path):
+        if not path:
+            return {}
+        try:
+            with open(path, encoding='utf-8') as baseline_file:
+                return json.load(baseline_file).get('results', {})
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Cannot read baseline {path}: {exc}')
+
+    def compare(self, result, previous, max_regression):
+        if not previous:
+            return ''
+        changes = {
+            metric: result[metric] / previous[metric] - 1 if previous[metric] else 0
+            for metric in ('process_ms', 'ready_ms')
+        }
+        text = ', '.join(f'{metric.removesuffix("_ms")} {change:+.0%}' for metric, change in changes.items())
+        if max_regression is not None and any(change > max_regression for change in changes.values()):
+            return f'REGRESSION ({text})'
+        return text
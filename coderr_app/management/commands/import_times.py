@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+ENTRY_POINTS = {
+    'wsgi': 'coderr_project.wsgi',
+    'asgi': 'coderr_project.asgi',
+}
+
+ImportTime = namedtuple('ImportTime', 'module self_us cumulative_us depth')
+
+
+def measure_import_times(module):
+    """
+    Importiert `module` in einem frischen Interpreter mit `-X importtime` und gibt die
+    gemessenen Module in Importreihenfolge zurück.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise CommandError(f'Importing {module} failed:\n{result.stderr[-2000:]}')
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        indent = len(name) - len(name.lstrip())
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), indent // 2))
+    return times
+
+
+class Command(BaseCommand):
+    """
+    Zeigt, welche Module beim Start eines Workers (`wsgi.py`/`asgi.py` inkl. `django.setup()`)
+    wie viel Importzeit kosten.
+
+    **Optionen**:
+    - `--entry`: `wsgi` (Standard) oder `asgi`.
+    - `--limit`: Anzahl der ausgegebenen Zeilen.
+    - `--packages`: Summiert die Eigenzeit pro Top-Level-Paket statt einzelne Module zu zeigen.
+    - `--sort`: Sortierung nach `cumulative` (inkl. Unterimporte, Standard) oder `self`.
+
+    **Details**:
+    - Gemessen wird in einem eigenen Interpreter, damit bereits geladene Module des
+      `manage.py`-Prozesses das Ergebnis nicht verfälschen.
+    - Die Zeiten stammen von `python -X importtime` und enthalten dessen Messaufwand; sie eignen
+      sich zum Vergleichen, die absolute Startzeit misst `benchmark_startup`.
+    """
+    help = 'Report the import-time cost per module (or package) of the WSGI/ASGI entry point.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entry', choices=sorted(ENTRY_POINTS), default='wsgi')
+        parser.add_argument('--limit', type=int, default=30)
+        parser.add_argument('--packages', action='store_true', help='Aggregate self time per top-level package.')
+        parser.add_argument('--sort', choices=['cumulative', 'self'], default='cumulative')
+
+    def handle(self, *args, **options):
+        module = ENTRY_POINTS[options['entry']]
+        times = measure_import_times(module)
+        total_us = sum(entry.self_us for entry in times)
+
+        if options['packages']:
+            self_by_package, count_by_package = defaultdict(int), defaultdict(int)
+            for entry in times:
+                package = entry.module.split('.')[0]
+                self_by_package[package] += entry.self_us
+                count_by_package[package] += 1
+            rows = sorted(self_by_package.items(), key=lambda item: item[1], reverse=True)
+            self.stdout.write(f'{"package":<40} {"modules":>8} {"self ms":>9} {"share":>7}')
+            for package, self_us in rows[:options['limit']]:
+                self.stdout.write(
+                    f'{package:<40} {count_by_package[package]:>8} {self_us / 1000:>9.1f} {self_us / total_us:>7.1%}'
+                )
+        else:
+            key = 'self_us' if options['sort'] == 'self' else 'cumulative_us'
+            rows = sorted(times, key=lambda entry: getattr(entry, key), reverse=True)
+            self.stdout.write(f'{"module":<50} {"depth":>5} {"self ms":>9} {"cumulative ms":>14}')
+            for entry in rows[:options['limit']]:
+                self.stdout.write(
+                    f'{entry.module:<50} {entry.depth:>5} {entry.self_us / 1000:>9.1f} {entry.cumulative_us / 1000:>14.1f}'
+                )
+
+        self.stdout.write(f'{len(times)} modules, {total_us / 1000:.1f} ms total import time for {module}.')
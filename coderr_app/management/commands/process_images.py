@@ -0,0 +1,65 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from coderr_app.images import claim_tasks, enqueue_missing, run_task
+
+
+class Command(BaseCommand):
+    """
+    Hintergrund-Worker, der die Varianten (`thumbnail`, `list`, `detail`) hochgeladener
+    Angebots- und Profilbilder erzeugt.
+
+    **Optionen**:
+    - `--once`: Arbeitet die Warteschlange ab und beendet sich, statt auf neue Aufträge zu warten.
+    - `--backfill`: Legt vorher Aufträge für alle vorhandenen Bilder ohne Varianten an.
+    - `--batch-size`: Anzahl der Aufträge, die pro Runde beansprucht werden.
+    - `--poll-interval`: Wartezeit in Sekunden, wenn keine Aufträge offen sind.
+
+    **Details**:
+    - Mehrere Worker können parallel laufen (siehe `coderr_app.images.claim_tasks`).
+    - Beendet sich nach SIGTERM/SIGINT, sobald die laufende Runde abgeschlossen ist.
+    """
+    help = 'Render list/detail/thumbnail variants of uploaded offer and profile images.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty.')
+        parser.add_argument('--backfill', action='store_true', help='Queue all existing images without variants first.')
+        parser.add_argument('--batch-size', type=int, default=10)
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            self.stdout.write(f'Queued {enqueue_missing()} image(s).')
+
+        self.stopping = False
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+
+        counts = {'done': 0, 'pending': 0, 'failed': 0}
+        while not self.stopping:
+            close_old_connections()
+            tasks = claim_tasks(options['batch_size'])
+            if not tasks:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+            for task in tasks:
+                started = time.perf_counter()
+                run_task(task)
+                counts[task.status] += 1
+                if options['verbosity'] >= 2 or task.status == 'failed':
+                    self.stdout.write(
+                        f'{task} in {(time.perf_counter() - started) * 1000:.0f} ms'
+                        + (f': {task.error}' if task.error else '')
+                    )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {counts["done"]} image(s), {counts["pending"]} retried, {counts["failed"]} failed.'
+        ))
+
+    def stop(self, signum, frame):
+        self.stopping = True
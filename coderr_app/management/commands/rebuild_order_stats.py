@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from coderr_app.models import BusinessOrderStats
+
+
+class Command(BaseCommand):
+    """
+    Berechnet die Bestellzähler pro Geschäftsnutzer (`BusinessOrderStats`) neu.
+
+    **Optionen**:
+    - `--business-user-id`: Nur die Zähler der angegebenen Geschäftsnutzer neu berechnen (mehrfach möglich).
+    """
+    help = 'Rebuild the per-business order counters used by the order count endpoints.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--business-user-id', type=int, action='append', dest='business_user_ids')
+
+    def handle(self, *args, **options):
+        rebuilt = BusinessOrderStats.rebuild(options['business_user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt order counters for {rebuilt} business user(s).'))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from coderr_app.models import PlatformStats
+
+
+class Command(BaseCommand):
+    """
+    Berechnet die inkrementell gepflegten Plattform-Statistiken (`PlatformStats`) neu,
+    z. B. nach Bulk-Importen, die keine Signale auslösen, oder bei festgestellter Drift.
+    """
+    help = 'Rebuild the incrementally maintained platform statistics used by /api/base-info/.'
+
+    def handle(self, *args, **options):
+        before = PlatformStats.objects.filter(pk=PlatformStats.SINGLETON_PK).values(
+            'review_count', 'rating_sum', 'business_profile_count', 'offer_count'
+        ).first()
+        stats = PlatformStats.rebuild()
+        after = {
+            'review_count': stats.review_count,
+            'rating_sum': stats.rating_sum,
+            'business_profile_count': stats.business_profile_count,
+            'offer_count': stats.offer_count,
+        }
+        for field, value in after.items():
+            old = before[field] if before else None
+            marker = '' if old == value else f' (was {old})'
+            self.stdout.write(f'{field}: {value}{marker}')
+        self.stdout.write(self.style.SUCCESS('Platform stats rebuilt.'))
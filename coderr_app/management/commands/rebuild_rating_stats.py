@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from coderr_app.models import BusinessRatingStats
+
+
+class Command(BaseCommand):
+    """
+    Berechnet die Bewertungsübersicht pro Geschäftsnutzer (`BusinessRatingStats`) neu.
+    """
+    help = 'Rebuild the per-business rating summaries (count, sum, average, star histogram).'
+
+    def handle(self, *args, **options):
+        rebuilt = BusinessRatingStats.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt rating stats for {rebuilt} business user(s).'))
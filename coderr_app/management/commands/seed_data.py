@@ -0,0 +1,189 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from coderr_app.models import (
+    BusinessOrderStats,
+    BusinessRatingStats,
+    CacheVersion,
+    OfferDetails,
+    Offers,
+    Order,
+    PlatformStats,
+    Review,
+    UserProfile,
+)
+
+CATEGORIES = ['Grafikdesign', 'Webentwicklung', 'Übersetzung', 'Fotografie', 'Videoschnitt',
+              'Texterstellung', 'Buchhaltung', 'Social Media', 'Logo Design', 'App Entwicklung']
+ADJECTIVES = ['Professionelles', 'Schnelles', 'Kreatives', 'Umfassendes', 'Günstiges', 'Individuelles']
+FEATURES = ['Logo Design', 'Visitenkarte', 'Briefpapier', 'Quelldateien', 'Responsive Design',
+            'SEO', 'Korrekturlauf', 'Kommerzielle Nutzung', 'Express-Lieferung', 'Support']
+LOCATIONS = ['Berlin', 'Hamburg', 'München', 'Köln', 'Frankfurt', 'Stuttgart', 'Leipzig', 'Wien', 'Zürich']
+OFFER_TYPES = [('basic', 1, 1), ('standard', 2, 3), ('premium', 4, 6)]
+ORDER_STATUSES = ['in_progress'] * 2 + ['completed'] * 7 + ['cancelled']
+RATINGS = [1, 2, 3, 3, 4, 4, 4, 5, 5, 5]
+
+
+class Command(BaseCommand):
+    """
+    Legt realistische Testdaten in konfigurierbarer Größe per Bulk-Insert an (z. B. für
+    `benchmark_endpoints`).
+
+    **Details**:
+    - Benutzer heißen `<prefix>-business-<n>` bzw. `<prefix>-customer-<n>` und können sich
+      mit `--password` anmelden (der Hash wird nur einmal berechnet).
+    - Jedes Angebot erhält `basic`, `standard` und `premium` als `OfferDetails`.
+    - Bulk-Inserts lösen keine Signale aus; Angebotsübersicht, Plattform-, Bestell- und
+      Bewertungsstatistiken werden deshalb am Ende einmal neu berechnet.
+    - Die Daten bleiben erhalten; ein erneuter Lauf braucht ein anderes `--prefix`.
+    """
+    help = 'Seed businesses, customers, offers, orders and reviews at a configurable scale using bulk inserts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--businesses', type=int, default=10_000)
+        parser.add_argument('--customers', type=int, default=50_000)
+        parser.add_argument('--offers', type=int, default=100_000)
+        parser.add_argument('--orders', type=int, default=1_000_000)
+        parser.add_argument('--reviews', type=int, default=500_000)
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--password', default='seed-password')
+        parser.add_argument('--random-seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if options['businesses'] < 1 or options['customers'] < 1:
+            raise CommandError('At least one business and one customer are required.')
+        if User.objects.filter(username__startswith=f'{options["prefix"]}-').exists():
+            raise CommandError(f'Users with prefix "{options["prefix"]}-" already exist; choose another --prefix.')
+
+        self.rng = random.Random(options['random_seed'])
+        self.batch_size = options['batch_size']
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            businesses = self.seed_users(options, 'business', options['businesses'])
+            customers = self.seed_users(options, 'customer', options['customers'])
+            details = self.seed_offers(businesses, options['offers'])
+            self.seed_orders(customers, details, options['orders'])
+            self.seed_reviews(businesses, customers, options['reviews'])
+            self.rebuild_summaries(options['prefix'])
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        self.stdout.write(self.style.SUCCESS(f'Seeding finished in {time.perf_counter() - started:.1f}s.'))
+
+    def seed_users(self, options, user_type, count):
+        password = make_password(options['password'])
+        user_ids = []
+        for start in range(0, count, self.batch_size):
+            users = User.objects.bulk_create([
+                User(
+                    username=f'{options["prefix"]}-{user_type}-{n}',
+                    email=f'{options["prefix"]}-{user_type}-{n}@example.com',
+                    first_name=self.rng.choice(['Anna', 'Ben', 'Clara', 'David', 'Eva', 'Felix']),
+                    last_name=self.rng.choice(['Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber']),
+                    password=password,
+                )
+                for n in range(start, min(start + self.batch_size, count))
+            ])
+            UserProfile.objects.bulk_create([
+                UserProfile(
+                    user=user,
+                    type=user_type,
+                    email=user.email,
+                    location=self.rng.choice(LOCATIONS),
+                    tel='+49 123 456789',
+                    description=f'{user_type.title()} profile of {user.first_name} {user.last_name}.',
+                    working_hours='9-17' if user_type == 'business' else '',
+                )
+                for user in users
+            ])
+            user_ids.extend(user.id for user in users)
+        self.stdout.write(f'  {count} {user_type} users')
+        return user_ids
+
+    def seed_offers(self, businesses, count):
+        """
+        Gibt die angelegten Details als Tupel `(id, offer_id, business_user_id, price, offer_type, delivery_time)` zurück.
+        """
+        details = []
+        for start in range(0, count, self.batch_size):
+            offers = Offers.objects.bulk_create([
+                Offers(
+                    user_id=self.rng.choice(businesses),
+                    title=f'{self.rng.choice(ADJECTIVES)} {self.rng.choice(CATEGORIES)} Paket',
+                    description=f'{self.rng.choice(CATEGORIES)} und {self.rng.choice(CATEGORIES)} aus einer Hand.',
+                )
+                for _ in range(start, min(start + self.batch_size, count))
+            ])
+            batch = []
+            for offer in offers:
+                base_price = self.rng.randint(20, 300)
+                for offer_type, factor, features in OFFER_TYPES:
+                    batch.append(OfferDetails(
+                        offer=offer,
+                        title=f'{offer_type.title()} {offer.title}',
+                        price=Decimal(base_price * factor),
+                        delivery_time_in_days=self.rng.randint(1, 7) * factor,
+                        revisions=-1 if offer_type == 'premium' else factor,
+                        features=self.rng.sample(FEATURES, features),
+                        offer_type=offer_type,
+                    ))
+            OfferDetails.objects.bulk_create(batch)
+            details.extend(
+                (detail.id, detail.offer.id, detail.offer.user_id, detail.price, detail.offer_type,
+                 detail.delivery_time_in_days)
+                for detail in batch
+            )
+        self.stdout.write(f'  {count} offers with {len(details)} details')
+        return details
+
+    def seed_orders(self, customers, details, count):
+        if not details:
+            return
+        for start in range(0, count, self.batch_size):
+            batch = []
+            for _ in range(start, min(start + self.batch_size, count)):
+                detail_id, offer_id, business_user_id, price, offer_type, delivery_time = self.rng.choice(details)
+                batch.append(Order(
+                    customer_user_id=self.rng.choice(customers),
+                    business_user_id=business_user_id,
+                    offer_id=offer_id,
+                    offer_detail_id=detail_id,
+                    status=self.rng.choice(ORDER_STATUSES),
+                    title=f'Order for offer {offer_id}',
+                    delivery_time_in_days=delivery_time,
+                    price=price,
+                    features=self.rng.sample(FEATURES, 2),
+                    offer_type=offer_type,
+                ))
+            Order.objects.bulk_create(batch)
+        self.stdout.write(f'  {count} orders')
+
+    def seed_reviews(self, businesses, customers, count):
+        for start in range(0, count, self.batch_size):
+            Review.objects.bulk_create([
+                Review(
+                    business_user_id=self.rng.choice(businesses),
+                    customer_user_id=self.rng.choice(customers),
+                    rating=self.rng.choice(RATINGS),
+                    description='Sehr zufrieden, gerne wieder.',
+                )
+                for _ in range(start, min(start + self.batch_size, count))
+            ])
+        self.stdout.write(f'  {count} reviews')
+
+    def rebuild_summaries(self, prefix):
+        businesses = User.objects.filter(username__startswith=f'{prefix}-business-').values('id')
+        Offers.objects.filter(user_id__in=businesses).refresh_summary()
+        BusinessOrderStats.rebuild(businesses)
+        BusinessRatingStats.rebuild()
+        PlatformStats.rebuild()
+        CacheVersion.bump('profiles')
+        self.stdout.write('  rebuilt offer summaries and statistics')
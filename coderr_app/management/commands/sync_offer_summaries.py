@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max, Min, OuterRef, Q, Subquery
+
+from coderr_app.models import OfferDetails, Offers
+
+
+class Command(BaseCommand):
+    """
+    Befüllt bzw. gleicht die denormalisierten Zusammenfassungsfelder der Angebote
+    (`min_price`, `min_delivery_time`, `max_delivery_time`) mit den `OfferDetails` ab.
+
+    **Optionen**:
+    - `--check`: Meldet nur die Anzahl abweichender Angebote, ohne zu schreiben.
+    """
+    help = 'Backfill/reconcile the min_price, min_delivery_time and max_delivery_time columns on offers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report offers whose summary columns are out of sync.',
+        )
+
+    def handle(self, *args, **options):
+        drifted = self.drifted_offers()
+        count = drifted.count()
+
+        if options['check']:
+            self.stdout.write(f'{count} offer(s) out of sync.')
+            return
+
+        with transaction.atomic():
+            updated = Offers.objects.filter(pk__in=drifted.values('pk')).refresh_summary()
+        self.stdout.write(self.style.SUCCESS(f'Reconciled {updated} offer(s).'))
+
+    def drifted_offers(self):
+        """
+        Gibt alle Angebote zurück, deren gespeicherte Werte von den aktuellen Aggregaten abweichen.
+        """
+        details = OfferDetails.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+        offers = Offers.objects.order_by().annotate(
+            actual_min_price=Subquery(details.annotate(value=Min('price')).values('value')),
+            actual_min_delivery_time=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+            actual_max_delivery_time=Subquery(details.annotate(value=Max('delivery_time_in_days')).values('value')),
+        )
+        mismatch = Q()
+        for field in ['min_price', 'min_delivery_time', 'max_delivery_time']:
+            actual = f'actual_{field}'
+            mismatch |= (
+                Q(**{f'{field}__isnull': True, f'{actual}__isnull': False})
+                | Q(**{f'{field}__isnull': False, f'{actual}__isnull': True})
+                | (Q(**{f'{field}__isnull': False, f'{actual}__isnull': False}) & ~Q(**{field: F(actual)}))
+            )
+        return offers.filter(mismatch)
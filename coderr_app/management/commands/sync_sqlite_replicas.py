@@ -0,0 +1,62 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+SQLITE_ENGINE = 'django.db.backends.sqlite3'
+
+
+class Command(BaseCommand):
+    """
+    Simuliert die Replikation lokal: kopiert die SQLite-Primärdatenbank in alle SQLite-Replikate
+    aus `DATABASE_REPLICA_URLS`.
+
+    **Optionen**:
+    - `--interval`: Wiederholt die Kopie alle N Sekunden, bis der Befehl beendet wird; N entspricht
+      dann der maximalen Replikationsverzögerung.
+
+    **Details**:
+    - Nutzt die Backup-API von SQLite, die Kopie ist also auch bei laufendem Server konsistent.
+    - Replikate werden nicht migriert (siehe `ReplicaRouter.allow_migrate`); Schema und Daten
+      kommen ausschließlich über diese Kopie.
+    """
+    help = 'Copy the SQLite primary database into the SQLite read replicas (local replication for testing).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='Repeat every N seconds until interrupted.')
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if primary['ENGINE'] != SQLITE_ENGINE:
+            raise CommandError('The primary database is not SQLite.')
+        replicas = [
+            alias for alias in settings.DATABASE_REPLICAS
+            if settings.DATABASES[alias]['ENGINE'] == SQLITE_ENGINE
+        ]
+        if not replicas:
+            raise CommandError('No SQLite replicas configured (DATABASE_REPLICA_URLS).')
+
+        while True:
+            started = time.perf_counter()
+            for alias in replicas:
+                self.copy(primary['NAME'], settings.DATABASES[alias]['NAME'])
+            self.stdout.write(
+                f'Copied {primary["NAME"]} to {len(replicas)} replica(s) in {(time.perf_counter() - started) * 1000:.0f} ms.'
+            )
+            if not options['interval']:
+                break
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                break
+
+    def copy(self, source_name, target_name):
+        source = sqlite3.connect(source_name)
+        target = sqlite3.connect(target_name)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
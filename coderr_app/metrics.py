@@ -0,0 +1,207 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from functools import partial
+
+from django.db import connections
+
+from .streaming import around_chunks
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+KNOWN_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+UNRESOLVED_VIEW = 'unresolved'
+
+
+class Histogram:
+    """
+    Histogramm mit festen Bucket-Grenzen (Zählung nicht kumulativ, kumuliert wird erst beim Export).
+    """
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class ViewStats:
+    """
+    Messwerte einer View (URL-Name) und HTTP-Methode.
+    """
+    __slots__ = ('latency', 'queries', 'db_time', 'size')
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.db_time = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+
+
+class ViewMetrics:
+    """
+    Prozesslokale Aggregation der Request-Metriken pro View.
+
+    **Details**:
+    - Schlüssel ist der aufgelöste URL-Name (`offers-list`, `order-count`, `base-info`, …), nicht
+      der Pfad; die Anzahl der Zeitreihen bleibt dadurch begrenzt.
+    - Jeder Gunicorn-Worker hat eigene Zähler; Prometheus fasst die Worker beim Abfragen zusammen.
+    """
+    HISTOGRAMS = [
+        ('coderr_http_request_duration_seconds', 'latency', 'Request latency in seconds.'),
+        ('coderr_http_request_db_queries', 'queries', 'SQL queries per request.'),
+        ('coderr_http_request_db_duration_seconds', 'db_time', 'SQL time per request in seconds.'),
+        ('coderr_http_response_size_bytes', 'size', 'Response body size in bytes.'),
+    ]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._requests = defaultdict(int)
+            self._views = defaultdict(ViewStats)
+
+    def record(self, view, method, status, duration, queries, db_time, size):
+        with self._lock:
+            self._requests[view, method, status] += 1
+            stats = self._views[view, method]
+            stats.latency.observe(duration)
+            stats.queries.observe(queries)
+            stats.db_time.observe(db_time)
+            if size is not None:
+                stats.size.observe(size)
+
+    def render(self):
+        """
+        Gibt alle Metriken im Prometheus-Textformat (Version 0.0.4) aus.
+        """
+        with self._lock:
+            requests = sorted(self._requests.items())
+            views = sorted(
+                (key, {attr: self.copy(getattr(stats, attr)) for _, attr, _ in self.HISTOGRAMS})
+                for key, stats in self._views.items()
+            )
+
+        lines = [
+            '# HELP coderr_http_requests_total Requests by view, method and status.',
+            '# TYPE coderr_http_requests_total counter',
+        ]
+        for (view, method, status), count in requests:
+            lines.append(f'coderr_http_requests_total{labels(view=view, method=method, status=status)} {count}')
+
+        for name, attr, description in self.HISTOGRAMS:
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+            for (view, method), histograms in views:
+                histogram = histograms[attr]
+                cumulative = 0
+                for bound, count in zip([*histogram.bounds, '+Inf'], histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{labels(view=view, method=method, le=bound)} {cumulative}')
+                lines.append(f'{name}_sum{labels(view=view, method=method)} {histogram.sum}')
+                lines.append(f'{name}_count{labels(view=view, method=method)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def copy(self, histogram):
+        snapshot = Histogram(histogram.bounds)
+        snapshot.counts = list(histogram.counts)
+        snapshot.sum = histogram.sum
+        snapshot.count = histogram.count
+        return snapshot
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def labels(**values):
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in values.items()) + '}'
+
+
+view_metrics = ViewMetrics()
+
+
+class QueryTimer:
+    """
+    `execute_wrapper`, der Anzahl und Dauer der SQL-Queries eines Requests zählt (auch ohne `DEBUG`).
+    """
+    __slots__ = ('count', 'duration')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class ViewMetricsMiddleware:
+    """
+    Middleware, die pro Request Latenz, SQL-Queries, SQL-Zeit, Antwortgröße und Statuscode
+    in `view_metrics` erfasst.
+
+    **Details**:
+    - Sollte als erste Middleware eingetragen sein, damit die Latenz den gesamten Stack umfasst.
+    - Bei (synchronen) Streaming-Antworten wie den Exporten wird bis zum Ende des Streams
+      gemessen; die Queries, die beim Lesen der Chunks laufen, werden mitgezählt.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        started = time.perf_counter()
+        with self.timing(timer):
+            response = self.get_response(request)
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.stream(request, response, response.streaming_content, timer, started)
+        else:
+            size = None if response.streaming else len(response.content)
+            self.record(request, response, time.perf_counter() - started, timer, size)
+        return response
+
+    @contextmanager
+    def timing(self, timer):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            yield
+
+    def stream(self, request, response, content, timer, started):
+        size = 0
+        try:
+            for chunk in around_chunks(content, partial(self.timing, timer)):
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.record(request, response, time.perf_counter() - started, timer, size)
+
+    def record(self, request, response, duration, timer, size):
+        match = request.resolver_match
+        method = request.method if request.method in KNOWN_METHODS else 'OTHER'
+        view_metrics.record(
+            match.view_name if match else UNRESOLVED_VIEW,
+            method,
+            response.status_code,
+            duration,
+            timer.count,
+            timer.duration,
+            size,
+        )
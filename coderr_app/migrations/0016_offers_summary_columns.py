@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-18 05:48
+
+from django.db import migrations, models
+from django.db.models import Max, Min, OuterRef, Subquery
+
+
+def backfill_summaries(apps, schema_editor):
+    Offers = apps.get_model('coderr_app', 'Offers')
+    OfferDetails = apps.get_model('coderr_app', 'OfferDetails')
+    details = OfferDetails.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+    Offers.objects.update(
+        min_price=Subquery(details.annotate(value=Min('price')).values('value')),
+        min_delivery_time=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+        max_delivery_time=Subquery(details.annotate(value=Max('delivery_time_in_days')).values('value')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0015_alter_review_business_user_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offers',
+            name='max_delivery_time',
+            field=models.PositiveIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='offers',
+            name='min_delivery_time',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='offers',
+            name='min_price',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
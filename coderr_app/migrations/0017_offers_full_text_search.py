@@ -0,0 +1,92 @@
+from django.db import OperationalError, migrations
+
+# Eingefrorene Kopie des SQL zum Zeitpunkt dieser Migration; `coderr_app.search` kann sich ändern.
+POSTGRES_INSTALL_SQL = [
+    """
+    ALTER TABLE coderr_app_offers ADD COLUMN IF NOT EXISTS search_document tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX IF NOT EXISTS coderr_app_offers_search_document_gin ON coderr_app_offers USING GIN (search_document)',
+]
+
+POSTGRES_UNINSTALL_SQL = [
+    'DROP INDEX IF EXISTS coderr_app_offers_search_document_gin',
+    'ALTER TABLE coderr_app_offers DROP COLUMN IF EXISTS search_document',
+]
+
+SQLITE_INSTALL_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS coderr_app_offers_fts USING fts5(
+        title, description, content='coderr_app_offers', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coderr_app_offers_fts_ai AFTER INSERT ON coderr_app_offers BEGIN
+        INSERT INTO coderr_app_offers_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coderr_app_offers_fts_ad AFTER DELETE ON coderr_app_offers BEGIN
+        INSERT INTO coderr_app_offers_fts(coderr_app_offers_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coderr_app_offers_fts_au AFTER UPDATE OF title, description ON coderr_app_offers BEGIN
+        INSERT INTO coderr_app_offers_fts(coderr_app_offers_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO coderr_app_offers_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO coderr_app_offers_fts(coderr_app_offers_fts) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL_SQL = [
+    'DROP TRIGGER IF EXISTS coderr_app_offers_fts_ai',
+    'DROP TRIGGER IF EXISTS coderr_app_offers_fts_ad',
+    'DROP TRIGGER IF EXISTS coderr_app_offers_fts_au',
+    'DROP TABLE IF EXISTS coderr_app_offers_fts',
+]
+
+
+def execute(schema_editor, statements):
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def install(apps, schema_editor):
+    """
+    PostgreSQL: generierte `tsvector`-Spalte mit GIN-Index. SQLite: externe FTS5-Tabelle mit
+    Triggern; fehlt FTS5 im SQLite-Build, wird nichts angelegt (Suche per `icontains`).
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        execute(schema_editor, POSTGRES_INSTALL_SQL)
+    elif vendor == 'sqlite':
+        try:
+            execute(schema_editor, SQLITE_INSTALL_SQL)
+        except OperationalError:
+            pass
+
+
+def uninstall(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        execute(schema_editor, POSTGRES_UNINSTALL_SQL)
+    elif vendor == 'sqlite':
+        execute(schema_editor, SQLITE_UNINSTALL_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0016_offers_summary_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
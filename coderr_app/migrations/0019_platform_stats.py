@@ -0,0 +1,44 @@
+# Generated by Django 5.1.3 on 2026-10-18 05:51
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_stats(apps, schema_editor):
+    PlatformStats = apps.get_model('coderr_app', 'PlatformStats')
+    Review = apps.get_model('coderr_app', 'Review')
+    UserProfile = apps.get_model('coderr_app', 'UserProfile')
+    Offers = apps.get_model('coderr_app', 'Offers')
+    reviews = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+    PlatformStats.objects.create(
+        pk=1,
+        review_count=reviews['count'],
+        rating_sum=reviews['total'] or 0,
+        business_profile_count=UserProfile.objects.filter(type='business').count(),
+        offer_count=Offers.objects.count(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0018_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('business_profile_count', models.PositiveIntegerField(default=0)),
+                ('offer_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Platform Stats',
+            },
+        ),
+        migrations.RunPython(build_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.3 on 2026-10-18 05:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_stats(apps, schema_editor):
+    BusinessOrderStats = apps.get_model('coderr_app', 'BusinessOrderStats')
+    Order = apps.get_model('coderr_app', 'Order')
+    fields = {'in_progress': 'in_progress_count', 'completed': 'completed_count', 'cancelled': 'cancelled_count'}
+    rows = {}
+    for row in Order.objects.order_by().values('business_user_id', 'status').annotate(count=Count('id')):
+        if row['status'] in fields:
+            rows.setdefault(row['business_user_id'], {})[fields[row['status']]] = row['count']
+    BusinessOrderStats.objects.bulk_create([
+        BusinessOrderStats(business_user_id=business_user_id, **counts)
+        for business_user_id, counts in rows.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('coderr_app', '0019_platform_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderStats',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress_count', models.PositiveIntegerField(default=0)),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('cancelled_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Business Order Stats',
+            },
+        ),
+        migrations.RunPython(build_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-18 07:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0027_primary_pins'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_business_open_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0029_user_import_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagetask',
+            name='staged',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='imagetask',
+            name='source',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import User
-from django.db.models import Min, Max
+from django.db.models import Count, ExpressionWrapper, F, Min, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import timezone
 
 class UserProfile(models.Model):
     """
@@ -11,10 +13,12 @@ class UserProfile(models.Model):
     - `location`: Standort des Benutzers.
     - `email`: E-Mail-Adresse des Benutzers.
     - `file`: Profilbild des Benutzers.
+    - `file_variants`: Verkleinerte Varianten des Profilbilds (siehe `ImageTask`).
     - `description`: Beschreibung des Benutzers.
     - `tel`: Telefonnummer des Benutzers.
     - `working_hours`: Arbeitszeiten des Benutzers.
     - `created_at`: Datum und Uhrzeit der Erstellung des Profils.
+    - `updated_at`: Datum und Uhrzeit der letzten Aktualisierung des Profils.
     - `type`: Benutzerrolle (z. B. Kunde, Geschäftsnutzer, Mitarbeiter).
 
     **Zusätzliche Informationen**:
@@ -30,10 +34,12 @@ class UserProfile(models.Model):
     location = models.CharField(max_length=50)
     email = models.EmailField( max_length=254)
     file = models.FileField( upload_to='profile_img/', max_length=100)
+    file_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=300)
     tel = models.CharField(max_length=20)
     working_hours = models.CharField(max_length=25)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     type = models.CharField(max_length=10, choices=USER_TYPE_CHOICES, default='customer')
     
     def __str__(self):
@@ -42,6 +48,34 @@ class UserProfile(models.Model):
     class Meta:
         ordering = ['user__username']
         verbose_name_plural = 'User Profiles'
+        indexes = [
+            models.Index(fields=['type', 'location'], name='userprofile_type_location_idx'),
+        ]
+
+
+class OffersQuerySet(models.QuerySet):
+    """
+    QuerySet für Angebote mit Hilfsmethoden für die Preis-/Lieferzeit-Zusammenfassung.
+    """
+
+    def refresh_summary(self, touch=False):
+        """
+        Berechnet `min_price`, `min_delivery_time` und `max_delivery_time` aller Angebote
+        im QuerySet in einem einzigen UPDATE aus den zugehörigen `OfferDetails` neu.
+
+        Verwendet `update()`, damit bereits gelöschte Angebote (z. B. während eines
+        Cascade-Deletes) nicht erneut angelegt werden. Mit `touch=True` wird zusätzlich
+        `updated_at` gesetzt, da sich die Darstellung des Angebots geändert hat.
+        """
+        details = OfferDetails.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+        changes = {
+            'min_price': Subquery(details.annotate(value=Min('price')).values('value')),
+            'min_delivery_time': Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+            'max_delivery_time': Subquery(details.annotate(value=Max('delivery_time_in_days')).values('value')),
+        }
+        if touch:
+            changes['updated_at'] = timezone.now()
+        return self.update(**changes)
 
 
 class Offers(models.Model):
@@ -52,26 +86,49 @@ class Offers(models.Model):
     - `user`: Benutzer, der das Angebot erstellt hat.
     - `title`: Titel des Angebots.
     - `image`: Optionales Bild zum Angebot.
+    - `image_variants`: Verkleinerte Varianten des Bildes (siehe `ImageTask`).
     - `description`: Beschreibung des Angebots.
     - `created_at`: Datum und Uhrzeit der Erstellung des Angebots.
     - `updated_at`: Datum und Uhrzeit der letzten Aktualisierung des Angebots.
+    - `min_price`: Niedrigster Preis aller Angebotsdetails (denormalisiert).
+    - `min_delivery_time`: Kürzeste Lieferzeit aller Angebotsdetails (denormalisiert).
+    - `max_delivery_time`: Längste Lieferzeit aller Angebotsdetails (denormalisiert).
 
     **Zusätzliche Informationen**:
     - Angebote werden standardmäßig alphabetisch nach Titel sortiert.
+    - Die Zusammenfassungsfelder werden bei jeder Änderung an `OfferDetails` über
+      `OffersQuerySet.refresh_summary()` aktualisiert und sind indiziert, damit Filter
+      und Sortierung ohne Aggregation auskommen.
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='offers')
     title = models.CharField(max_length=50)
     image = models.FileField(upload_to=None, max_length=100, blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField()
     created_at = models.DateTimeField( auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False, db_index=True)
+    min_delivery_time = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    max_delivery_time = models.PositiveIntegerField(null=True, blank=True, editable=False, db_index=True)
+
+    objects = OffersQuerySet.as_manager()
 
     def __str__(self):
         return self.title
+
+    def refresh_summary(self):
+        """
+        Aktualisiert die Zusammenfassungsfelder dieses Angebots in der Datenbank und auf der Instanz.
+        """
+        Offers.objects.filter(pk=self.pk).refresh_summary()
+        self.refresh_from_db(fields=['min_price', 'min_delivery_time', 'max_delivery_time'])
     
     class Meta:
         ordering = ['title']
         verbose_name_plural = 'Offers'
+        indexes = [
+            models.Index(fields=['user', 'updated_at'], name='offers_user_updated_idx'),
+        ]
 
         
 class OfferDetails(models.Model):
@@ -120,8 +177,13 @@ class Order(models.Model):
         return f'Order by {self.customer_user.username} for {self.title}'
     
     class Meta:
-        ordering = ['title']
+        ordering = ['-created_at', '-id']
         verbose_name_plural = 'Orders'
+        indexes = [
+            models.Index(fields=['business_user', 'status', 'created_at'], name='order_business_status_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+        ]
         
 class Review(models.Model):
     business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="business_reviews", limit_choices_to={'user_profile__type': 'business'})
@@ -133,6 +195,428 @@ class Review(models.Model):
 
     class Meta:
         ordering = ['-updated_at']  
+        indexes = [
+            models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+        ]
+
+    def __str__(self):
+        return f"Review by {self.customer_user} for {self.business_user} (Rating: {self.rating})"
+
+class PlatformStats(models.Model):
+    """
+    Inkrementell gepflegte Plattform-Statistiken (eine einzige Zeile mit `pk=1`).
+
+    **Felder**:
+    - `review_count`: Anzahl aller Bewertungen.
+    - `rating_sum`: Summe aller Bewertungen (für den Durchschnitt).
+    - `business_profile_count`: Anzahl der Geschäftsnutzer-Profile.
+    - `offer_count`: Anzahl aller Angebote.
+    - `updated_at`: Zeitpunkt der letzten Änderung.
+
+    **Zusätzliche Informationen**:
+    - Die Zähler werden über Signale in derselben Transaktion wie die auslösende Änderung
+      per `F()`-Ausdruck angepasst (`bump`).
+    - `rebuild` berechnet alle Werte neu (z. B. nach Bulk-Importen oder bei Drift).
+    """
+    SINGLETON_PK = 1
+
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    business_profile_count = models.PositiveIntegerField(default=0)
+    offer_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Platform Stats'
+
+    def __str__(self):
+        return f'Platform stats ({self.updated_at:%Y-%m-%d %H:%M})'
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @classmethod
+    def load(cls):
+        """
+        Gibt die Statistik-Zeile zurück und legt sie bei Bedarf per `rebuild` an.
+        """
+        stats = cls.objects.filter(pk=cls.SINGLETON_PK).first()
+        return stats if stats is not None else cls.rebuild()
+
+    @classmethod
+    def bump(cls, **deltas):
+        """
+        Addiert die übergebenen Deltas atomar auf die Zähler, z. B. `bump(review_count=1, rating_sum=5)`.
+        """
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        updated = cls.objects.filter(pk=cls.SINGLETON_PK).update(
+            updated_at=timezone.now(),
+            **{field: F(field) + delta for field, delta in deltas.items()},
+        )
+        if not updated:
+            cls.rebuild()
+
+    @classmethod
+    def rebuild(cls):
+        """
+        Berechnet alle Zähler aus den Quelltabellen neu und speichert sie.
+        """
+        reviews = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+        stats, _ = cls.objects.update_or_create(
+            pk=cls.SINGLETON_PK,
+            defaults={
+                'review_count': reviews['count'],
+                'rating_sum': reviews['total'] or 0,
+                'business_profile_count': UserProfile.objects.filter(type='business').count(),
+                'offer_count': Offers.objects.count(),
+            },
+        )
+        return stats
+
+
+class BusinessOrderStats(models.Model):
+    """
+    Inkrementell gepflegte Bestellzähler pro Geschäftsnutzer und Status.
+
+    **Felder**:
+    - `business_user`: Geschäftsnutzer (Primärschlüssel).
+    - `in_progress_count`: Anzahl laufender Bestellungen.
+    - `completed_count`: Anzahl abgeschlossener Bestellungen.
+    - `cancelled_count`: Anzahl stornierter Bestellungen.
+    - `updated_at`: Zeitpunkt der letzten Änderung.
+
+    **Zusätzliche Informationen**:
+    - Die Zähler werden über Signale in derselben Transaktion wie die Bestellung angepasst.
+    - `rebuild` berechnet alle Zähler aus der Tabelle `Order` neu.
+    """
+    STATUS_FIELDS = {
+        'in_progress': 'in_progress_count',
+        'completed': 'completed_count',
+        'cancelled': 'cancelled_count',
+    }
+
+    business_user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='order_stats')
+    in_progress_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    cancelled_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Business Order Stats'
+
+    def __str__(self):
+        return f'Order stats for {self.business_user_id}'
+
+    @classmethod
+    def bump(cls, business_user_id, status, delta):
+        """
+        Passt den Zähler für `status` des Geschäftsnutzers atomar um `delta` an und legt die
+        Zeile bei Bedarf an (nur bei positiven Deltas, damit Cascade-Deletes keine Zeilen
+        für bereits gelöschte Nutzer erzeugen).
+        """
+        field = cls.STATUS_FIELDS.get(status)
+        if field is None or not delta:
+            return
+        changes = {field: F(field) + delta, 'updated_at': timezone.now()}
+        if cls.objects.filter(business_user_id=business_user_id).update(**changes) or delta < 0:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(business_user_id=business_user_id, **{field: delta})
+        except IntegrityError:
+            cls.objects.filter(business_user_id=business_user_id).update(**changes)
+
+    @classmethod
+    def rebuild(cls, business_user_ids=None):
+        """
+        Berechnet die Zähler (optional nur für die angegebenen Geschäftsnutzer) neu.
+        """
+        orders = Order.objects.order_by()
+        stats = cls.objects.all()
+        if business_user_ids is not None:
+            orders = orders.filter(business_user_id__in=business_user_ids)
+            stats = stats.filter(business_user_id__in=business_user_ids)
+
+        rows = {}
+        for row in orders.values('business_user_id', 'status').annotate(count=Count('id')):
+            field = cls.STATUS_FIELDS.get(row['status'])
+            if field:
+                rows.setdefault(row['business_user_id'], {})[field] = row['count']
+
+        with transaction.atomic():
+            stats.delete()
+            cls.objects.bulk_create([
+                cls(business_user_id=business_user_id, **counts)
+                for business_user_id, counts in rows.items()
+            ], batch_size=1000)
+        return len(rows)
+
+
+class BusinessRatingStats(models.Model):
+    """
+    Inkrementell gepflegte Bewertungsübersicht pro Geschäftsnutzer.
+
+    **Felder**:
+    - `business_user`: Geschäftsnutzer (Primärschlüssel).
+    - `review_count`: Anzahl der Bewertungen.
+    - `rating_sum`: Summe aller Bewertungen.
+    - `average_rating`: Durchschnittliche Bewertung (indiziert für "Top bewertet"-Sortierung).
+    - `stars_1` bis `stars_5`: Histogramm der Bewertungen.
+    - `updated_at`: Zeitpunkt der letzten Änderung.
+
+    **Zusätzliche Informationen**:
+    - Wird über Signale bei Erstellen, Ändern und Löschen von `Review` angepasst.
+    - `rebuild` berechnet die Übersicht aus der Tabelle `Review` neu.
+    - Jede Änderung erhöht die `CacheVersion` `ratings`.
+    """
+    STAR_FIELDS = {star: f'stars_{star}' for star in range(1, 6)}
+
+    business_user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='rating_stats')
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    average_rating = models.FloatField(default=0, db_index=True)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Business Rating Stats'
+
+    def __str__(self):
+        return f'Rating stats for {self.business_user_id}'
+
+    @property
+    def histogram(self):
+        return {str(star): getattr(self, field) for star, field in self.STAR_FIELDS.items()}
+
+    @classmethod
+    def apply(cls, business_user_id, rating, sign):
+        """
+        Fügt eine Bewertung hinzu (`sign=1`) oder entfernt sie (`sign=-1`).
+        Zeilen werden nur beim Hinzufügen angelegt, damit Cascade-Deletes keine Zeilen
+        für bereits gelöschte Nutzer erzeugen.
+        """
+        CacheVersion.bump('ratings')
+        count = F('review_count') + sign
+        total = F('rating_sum') + sign * rating
+        changes = {
+            'review_count': count,
+            'rating_sum': total,
+            'average_rating': Coalesce(
+                ExpressionWrapper(total * 1.0 / NullIf(count, 0), output_field=models.FloatField()),
+                0.0,
+            ),
+            'updated_at': timezone.now(),
+        }
+        star_field = cls.STAR_FIELDS.get(rating)
+        if star_field:
+            changes[star_field] = F(star_field) + sign
+
+        if cls.objects.filter(business_user_id=business_user_id).update(**changes) or sign < 0:
+            return
+        initial = {'review_count': 1, 'rating_sum': rating, 'average_rating': float(rating)}
+        if star_field:
+            initial[star_field] = 1
+        try:
+            with transaction.atomic():
+                cls.objects.create(business_user_id=business_user_id, **initial)
+        except IntegrityError:
+            cls.objects.filter(business_user_id=business_user_id).update(**changes)
+
+    @classmethod
+    def rebuild(cls):
+        """
+        Berechnet die Bewertungsübersicht aller Geschäftsnutzer neu.
+        """
+        aggregates = {
+            'review_count': Count('id'),
+            'rating_sum': Sum('rating'),
+            **{field: Count('id', filter=Q(rating=star)) for star, field in cls.STAR_FIELDS.items()},
+        }
+        rows = Review.objects.order_by().values('business_user_id').annotate(**aggregates)
+        with transaction.atomic():
+            CacheVersion.bump('ratings')
+            cls.objects.all().delete()
+            cls.objects.bulk_create([
+                cls(average_rating=row['rating_sum'] / row['review_count'], **row)
+                for row in rows
+            ], batch_size=1000)
+        return len(rows)
+
+
+
+class ImageTask(models.Model):
+    """
+    Auftrag zum Erzeugen der Bildvarianten eines hochgeladenen Bildes (Warteschlange für
+    `manage.py process_images`).
+
+    **Felder**:
+    - `kind`: Art des Bildes (`offer` für `Offers.image`, `profile` für `UserProfile.file`).
+    - `object_id`: Primärschlüssel des Angebots bzw. Profils.
+    - `source`: Dateiname des Originals im Media-Storage (bei zwischengelagerten Uploads erst nach
+      der Übertragung durch den Worker gesetzt).
+    - `staged`: Dateiname des zwischengelagerten Uploads in `settings.IMAGE_STAGING_ROOT`, bis der
+      Worker ihn in den Media-Storage überträgt (siehe `coderr_app.images.stage_upload`).
+    - `status`: Bearbeitungsstand (`pending`, `processing`, `done`, `failed`).
+    - `attempts`: Anzahl der bisherigen Versuche.
+    - `error`: Letzte Fehlermeldung.
+    - `created_at`: Zeitpunkt des Uploads.
+    - `updated_at`: Zeitpunkt der letzten Statusänderung.
+
+    **Zusätzliche Informationen**:
+    - Die Varianten werden als `{'source': <Original>, <Variante>: <Dateiname>, ...}` im Feld
+      `<bildfeld>_variants` des Objekts gespeichert; bis dahin wird das Original ausgeliefert.
+    - Mit `settings.IMAGE_STAGE_UPLOADS` schreibt erst der Worker das Original in den Media-Storage;
+      bis dahin bleibt das vorherige Bild am Objekt.
+    - Worker beanspruchen Aufträge über ein bedingtes UPDATE, ein Auftrag wird dadurch nicht
+      doppelt bearbeitet.
+    """
+    KIND_CHOICES = [
+        ('offer', 'Offer image'),
+        ('profile', 'Profile image'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    source = models.CharField(max_length=100, blank=True)
+    staged = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name_plural = 'Image Tasks'
+        indexes = [
+            models.Index(fields=['status', 'id'], name='imagetask_status_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} #{self.object_id}: {self.source or self.staged} ({self.status})'
+
+
+class UserImportJob(models.Model):
+    """
+    Auftrag für einen Benutzerimport über `POST /api/users/import/` (Warteschlange für
+    `manage.py process_user_imports`).
+
+    **Felder**:
+    - `created_by`: Staff-Benutzer, der die Datei hochgeladen hat.
+    - `records`: Gelesene Datensätze als `[zeilennummer, datensatz]` (siehe `parse_records`).
+    - `rows`: Anzahl der Datensätze.
+    - `status`: Bearbeitungsstand (`pending`, `processing`, `done`, `failed`).
+    - `report`: Ergebnis des Imports (`ProvisioningReport.as_dict`), sobald der Auftrag erledigt ist.
+    - `error`: Fehlermeldung, wenn der Import abgebrochen ist.
+    - `created_at`: Zeitpunkt des Uploads.
+    - `updated_at`: Zeitpunkt der letzten Statusänderung.
+
+    **Zusätzliche Informationen**:
+    - `records` enthält die Passwörter im Klartext und wird geleert, sobald der Auftrag erledigt
+      oder fehlgeschlagen ist.
+    - Worker beanspruchen Aufträge wie bei `ImageTask` über ein bedingtes UPDATE.
+    """
+    STATUS_CHOICES = ImageTask.STATUS_CHOICES
+
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+')
+    records = models.JSONField(default=list)
+    rows = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    report = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name_plural = 'User Import Jobs'
+        indexes = [
+            models.Index(fields=['status', 'id'], name='userimportjob_status_idx'),
+        ]
+
+    def __str__(self):
+        return f'Import #{self.pk}: {self.rows} rows ({self.status})'
+
+
+class CacheVersion(models.Model):
+    """
+    Versionszähler für Response-Caches (siehe `VersionedListCacheMixin`).
+
+    **Felder**:
+    - `name`: Name des Zählers (Primärschlüssel), z. B. `profiles` oder `ratings`.
+    - `version`: Aktuelle Version; fehlt die Zeile, gilt Version 1.
+
+    **Zusätzliche Informationen**:
+    - Gecachte Antworten enthalten die Versionen im Schlüssel. `bump` in derselben Transaktion
+      wie die Änderung macht alle betroffenen Einträge sofort unerreichbar, auch in anderen
+      Prozessen (die Zähler liegen in der Datenbank, nicht im prozesslokalen Cache).
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.PositiveBigIntegerField(default=1)
+
+    class Meta:
+        verbose_name_plural = 'Cache Versions'
+
+    def __str__(self):
+        return f'{self.name} v{self.version}'
+
+    @classmethod
+    def bump(cls, *names):
+        """
+        Erhöht die angegebenen Zähler atomar um 1.
+        """
+        for name in names:
+            if cls.objects.filter(name=name).update(version=F('version') + 1):
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(name=name, version=2)
+            except IntegrityError:
+                cls.objects.filter(name=name).update(version=F('version') + 1)
+
+    @classmethod
+    def current(cls, *names):
+        """
+        Gibt die aktuellen Versionen der angegebenen Zähler (in derselben Reihenfolge) mit einer Query zurück.
+        """
+        versions = dict(cls.objects.filter(name__in=names).values_list('name', 'version'))
+        return [versions.get(name, 1) for name in names]
+
+
+class PrimaryPin(models.Model):
+    """
+    Zeitfenster nach einem Schreibzugriff, in dem die Lesezugriffe eines Benutzers auf der
+    Primärdatenbank bleiben (Read-your-writes, siehe `coderr_app.replicas`).
+
+    **Felder**:
+    - `user_id`: ID des Benutzers (Primärschlüssel, bewusst ohne Fremdschlüssel: Einträge
+      gelöschter Benutzer laufen einfach ab).
+    - `until`: Zeitpunkt, bis zu dem Lesezugriffe nicht an Replikate gehen.
+
+    **Zusätzliche Informationen**:
+    - Liegt in der Datenbank statt im prozesslokalen Cache, damit die Sperre auch gilt, wenn der
+      nächste Request in einem anderen Worker landet.
+    """
+    user_id = models.BigIntegerField(primary_key=True)
+    until = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = 'Primary Pins'
 
     def __str__(self):
-        return f"Review by {self.customer_user} for {self.business_user} (Rating: {self.rating})"
\ No newline at end of file
+        return f'User {self.user_id} until {self.until:%Y-%m-%d %H:%M:%S}'
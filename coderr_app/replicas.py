@@ -0,0 +1,149 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+
+from .models import PrimaryPin
+from .streaming import around_chunks
+
+
+class RoutingState:
+    """
+    Routing-Zustand eines Requests: Datenbank für Lesezugriffe (`None` = Primärdatenbank) und ob
+    der Request geschrieben hat.
+    """
+    __slots__ = ('read_alias', 'wrote')
+
+    def __init__(self):
+        self.read_alias = None
+        self.wrote = False
+
+
+# Über eine ContextVar, damit auch Queries in `sync_to_async`-Threads (ASGI) den Zustand sehen.
+current_routing_state = ContextVar('coderr_routing_state', default=None)
+
+
+class ReplicaRouter:
+    """
+    Datenbank-Router für Lese-Replikate (`settings.DATABASE_REPLICAS`).
+
+    **Details**:
+    - Lesezugriffe gehen nur an ein Replikat, wenn eine View mit `ReplicaReadMixin` es für den
+      laufenden Request ausgewählt hat; alles andere (Management-Commands, Worker, Schreib-Requests)
+      bleibt auf `default`.
+    - Schreibzugriffe gehen immer an `default` und werden im Routing-Zustand vermerkt, damit
+      `ReplicaRoutingMiddleware` den Benutzer danach an die Primärdatenbank bindet.
+    - Migrationen laufen nur auf der Primärdatenbank; Replikate erhalten das Schema über die Replikation.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = current_routing_state.get()
+        return state.read_alias if state is not None else None
+
+    def db_for_write(self, model, **hints):
+        state = current_routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return False if db in settings.DATABASE_REPLICAS else None
+
+
+def is_pinned(user):
+    """
+    Prüft auf der Primärdatenbank, ob `user` nach einem Schreibzugriff noch an sie gebunden ist.
+    """
+    return PrimaryPin.objects.using(DEFAULT_DB_ALIAS).filter(user_id=user.pk, until__gt=timezone.now()).exists()
+
+
+def pin_to_primary(user):
+    """
+    Bindet die Lesezugriffe von `user` für `settings.REPLICA_PIN_SECONDS` an die Primärdatenbank
+    (ein Upsert).
+    """
+    PrimaryPin.objects.using(DEFAULT_DB_ALIAS).bulk_create(
+        [PrimaryPin(user_id=user.pk, until=timezone.now() + timedelta(seconds=settings.REPLICA_PIN_SECONDS))],
+        update_conflicts=True,
+        unique_fields=['user_id'],
+        update_fields=['until'],
+    )
+
+
+def use_replica(request):
+    """
+    Leitet die weiteren Lesezugriffe des Requests an ein zufälliges Replikat, sofern es eine
+    sichere Methode ist und der Benutzer nicht an die Primärdatenbank gebunden ist.
+    """
+    state = current_routing_state.get()
+    if state is None or not settings.DATABASE_REPLICAS or request.method not in SAFE_METHODS:
+        return
+    if request.user.is_authenticated and is_pinned(request.user):
+        return
+    state.read_alias = random.choice(settings.DATABASE_REPLICAS)
+
+
+class ReplicaReadMixin:
+    """
+    Mixin für Views, deren GET-Requests von einem Replikat gelesen werden dürfen.
+
+    Das Replikat wird nach Authentifizierung und Berechtigungsprüfung (`initial`) gewählt; beides
+    läuft also noch gegen die Primärdatenbank.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        use_replica(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Middleware, die pro Request einen `RoutingState` bereitstellt und Benutzer nach einem
+    Schreibzugriff an die Primärdatenbank bindet (Read-your-writes).
+
+    **Details**:
+    - Ohne konfigurierte Replikate (`DATABASE_REPLICA_URLS`) wird sie nicht geladen.
+    - Gebunden werden nur angemeldete Benutzer, da die Sperre an der Benutzer-ID hängt.
+    - Bei Streaming-Antworten (Exporte) gilt der Routing-Zustand auch für die Queries, die erst
+      beim Lesen der Chunks laufen.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState()
+        with self.routing(state):
+            response = self.get_response(request)
+        if self.should_pin(request, state):
+            pin_to_primary(request.user)
+        if response.streaming and not response.is_async:
+            response.streaming_content = around_chunks(response.streaming_content, partial(self.routing, state))
+        return response
+
+    @contextmanager
+    def routing(self, state):
+        token = current_routing_state.set(state)
+        try:
+            yield
+        finally:
+            current_routing_state.reset(token)
+
+    def should_pin(self, request, state):
+        user = getattr(request, 'user', None)
+        return state.wrote and user is not None and user.is_authenticated
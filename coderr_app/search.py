@@ -0,0 +1,175 @@
+import re
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+OFFERS_TABLE = 'coderr_app_offers'
+OFFERS_FTS_TABLE = 'coderr_app_offers_fts'
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(term):
+    """
+    Zerlegt einen Suchbegriff in Wort-Tokens (Satzzeichen und Operatoren werden verworfen).
+    """
+    return TOKEN_RE.findall(term or '')
+
+
+class BaseOfferSearch(ABC):
+    """
+    Basisklasse für Suchbackends der Angebote.
+
+    Ein Backend filtert ein `Offers`-Queryset nach einem Suchbegriff und annotiert es mit
+    `search_rank`. `rank_ordering` gibt an, wie nach Relevanz sortiert wird.
+    """
+    rank_ordering = '-search_rank'
+
+    @abstractmethod
+    def search(self, queryset, term):
+        """
+        Gibt die Treffer für `term` als mit `search_rank` annotiertes Queryset zurück.
+        """
+
+
+class IcontainsOfferSearch(BaseOfferSearch):
+    """
+    Fallback ohne Volltextindex: `icontains` auf Titel und Beschreibung, Titeltreffer zuerst.
+    """
+
+    def search(self, queryset, term):
+        title_hit = Q()
+        for token in tokenize(term):
+            queryset = queryset.filter(Q(title__icontains=token) | Q(description__icontains=token))
+            title_hit &= Q(title__icontains=token)
+        return queryset.annotate(
+            search_rank=Case(When(title_hit, then=Value(1.0)), default=Value(0.0), output_field=FloatField())
+        )
+
+
+class PostgresOfferSearch(BaseOfferSearch):
+    """
+    Volltextsuche über die generierte `tsvector`-Spalte `search_document` (GIN-indiziert).
+
+    Titel sind mit Gewicht A, Beschreibungen mit Gewicht B indiziert; jedes Token wird
+    gestemmt und als Präfix gesucht, damit Suche während der Eingabe funktioniert.
+    """
+    config = 'english'
+
+    def search(self, queryset, term):
+        tokens = tokenize(term)
+        if not tokens:
+            return queryset.none()
+        query = ' & '.join(f'{token}:*' for token in tokens)
+        return queryset.filter(
+            RawSQL(
+                f'{OFFERS_TABLE}.search_document @@ to_tsquery(%s::regconfig, %s)',
+                [self.config, query],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'ts_rank({OFFERS_TABLE}.search_document, to_tsquery(%s::regconfig, %s))',
+                [self.config, query],
+                output_field=FloatField(),
+            )
+        )
+
+
+class SQLiteFTS5OfferSearch(BaseOfferSearch):
+    """
+    Volltextsuche über die FTS5-Tabelle `coderr_app_offers_fts` (Porter-Stemming).
+
+    `bm25()` liefert kleinere Werte für relevantere Treffer, daher wird aufsteigend sortiert.
+    Titel werden zehnfach stärker gewichtet als Beschreibungen.
+    """
+    rank_ordering = 'search_rank'
+
+    def search(self, queryset, term):
+        tokens = tokenize(term)
+        if not tokens:
+            return queryset.none()
+        query = ' '.join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+        return queryset.filter(
+            id__in=RawSQL(
+                f'SELECT rowid FROM {OFFERS_FTS_TABLE} WHERE {OFFERS_FTS_TABLE} MATCH %s',
+                [query],
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT bm25({OFFERS_FTS_TABLE}, 10.0, 1.0) FROM {OFFERS_FTS_TABLE} '
+                f'WHERE {OFFERS_FTS_TABLE} MATCH %s AND rowid = {OFFERS_TABLE}.id',
+                [query],
+                output_field=FloatField(),
+            )
+        )
+
+
+_backends = {}
+
+
+def get_offer_search(using='default'):
+    """
+    Gibt das Suchbackend für die Datenbank `using` zurück.
+
+    Reihenfolge:
+    - `settings.OFFER_SEARCH_BACKEND` (Dotted Path), falls gesetzt.
+    - PostgreSQL: `PostgresOfferSearch`.
+    - SQLite mit vorhandener FTS5-Tabelle: `SQLiteFTS5OfferSearch`.
+    - Sonst: `IcontainsOfferSearch`.
+    """
+    if using not in _backends:
+        backend_path = getattr(settings, 'OFFER_SEARCH_BACKEND', None)
+        connection = connections[using]
+        if backend_path:
+            backend = import_string(backend_path)()
+        elif connection.vendor == 'postgresql':
+            backend = PostgresOfferSearch()
+        elif connection.vendor == 'sqlite' and OFFERS_FTS_TABLE in connection.introspection.table_names():
+            backend = SQLiteFTS5OfferSearch()
+        else:
+            backend = IcontainsOfferSearch()
+        _backends[using] = backend
+    return _backends[using]
+
+
+# Trigger aus Migration 0017; SQLite verwirft sie, wenn eine Migration die Angebotstabelle neu aufbaut.
+SQLITE_TRIGGER_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFERS_FTS_TABLE}_ai AFTER INSERT ON {OFFERS_TABLE} BEGIN
+        INSERT INTO {OFFERS_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFERS_FTS_TABLE}_ad AFTER DELETE ON {OFFERS_TABLE} BEGIN
+        INSERT INTO {OFFERS_FTS_TABLE}({OFFERS_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFERS_FTS_TABLE}_au AFTER UPDATE OF title, description ON {OFFERS_TABLE} BEGIN
+        INSERT INTO {OFFERS_FTS_TABLE}({OFFERS_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {OFFERS_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+
+def ensure_offer_search_triggers(connection):
+    """
+    Stellt die FTS5-Trigger wieder her. SQLite verwirft Trigger, wenn Django eine Tabelle bei
+    einer Migration neu aufbaut; daher wird dies nach jedem `migrate` ausgeführt.
+
+    Setzt außerdem das gewählte Suchbackend der Datenbank zurück, da `migrate` den Index
+    angelegt oder entfernt haben kann.
+    """
+    _backends.pop(connection.alias, None)
+    if connection.vendor == 'sqlite' and OFFERS_FTS_TABLE in connection.introspection.table_names():
+        with connection.cursor() as cursor:
+            for statement in SQLITE_TRIGGER_SQL:
+                cursor.execute(statement)
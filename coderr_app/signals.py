@@ -0,0 +1,181 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import BusinessOrderStats, BusinessRatingStats, CacheVersion, OfferDetails, Offers, Order, PlatformStats, Review, UserProfile
+from .images import enqueue_image_task, stage_upload
+from .search import ensure_offer_search_triggers
+
+
+@receiver(post_save, sender=OfferDetails)
+@receiver(post_delete, sender=OfferDetails)
+def refresh_offer_summary(sender, instance, **kwargs):
+    """
+    Hält die Zusammenfassungsfelder des Angebots (`min_price`, `min_delivery_time`,
+    `max_delivery_time`) nach jeder Änderung an einem `OfferDetails` synchron und setzt
+    `updated_at`, damit Validatoren für Conditional GET die Änderung erkennen.
+    """
+    Offers.objects.filter(pk=instance.offer_id).refresh_summary(touch=True)
+
+
+def restore_offer_search_triggers(sender, using, **kwargs):
+    """
+    Stellt nach `migrate` die FTS5-Trigger der Angebotssuche wieder her (nur SQLite).
+    """
+    ensure_offer_search_triggers(connections[using])
+
+
+def remember_previous_values(instance, fields):
+    """
+    Merkt sich vor dem Speichern die bisherigen Werte der angegebenen Felder aus der Datenbank,
+    damit Zähler bei Updates um die Differenz angepasst werden können.
+    """
+    previous = None
+    if not instance._state.adding and instance.pk is not None:
+        previous = type(instance)._default_manager.filter(pk=instance.pk).values(*fields).first()
+    instance._previous_values = previous
+
+
+@receiver(pre_save, sender=Review)
+def remember_review_rating(sender, instance, **kwargs):
+    remember_previous_values(instance, ['rating', 'business_user_id'])
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender, instance, created, **kwargs):
+    previous = instance._previous_values
+    if created:
+        PlatformStats.bump(review_count=1, rating_sum=instance.rating)
+        BusinessRatingStats.apply(instance.business_user_id, instance.rating, 1)
+    elif previous is not None:
+        PlatformStats.bump(rating_sum=instance.rating - previous['rating'])
+        if (previous['business_user_id'], previous['rating']) != (instance.business_user_id, instance.rating):
+            BusinessRatingStats.apply(previous['business_user_id'], previous['rating'], -1)
+            BusinessRatingStats.apply(instance.business_user_id, instance.rating, 1)
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender, instance, **kwargs):
+    PlatformStats.bump(review_count=-1, rating_sum=-instance.rating)
+    BusinessRatingStats.apply(instance.business_user_id, instance.rating, -1)
+
+
+@receiver(post_save, sender=Offers)
+def count_created_offer(sender, instance, created, **kwargs):
+    if created:
+        PlatformStats.bump(offer_count=1)
+
+
+@receiver(post_delete, sender=Offers)
+def count_deleted_offer(sender, instance, **kwargs):
+    PlatformStats.bump(offer_count=-1)
+
+
+@receiver(pre_save, sender=UserProfile)
+def remember_profile_type(sender, instance, **kwargs):
+    remember_previous_values(instance, ['type'])
+
+
+@receiver(post_save, sender=UserProfile)
+def count_saved_profile(sender, instance, created, **kwargs):
+    is_business = int(instance.type == 'business')
+    if created:
+        PlatformStats.bump(business_profile_count=is_business)
+    elif instance._previous_values is not None:
+        was_business = int(instance._previous_values['type'] == 'business')
+        PlatformStats.bump(business_profile_count=is_business - was_business)
+
+
+@receiver(post_delete, sender=UserProfile)
+def count_deleted_profile(sender, instance, **kwargs):
+    if instance.type == 'business':
+        PlatformStats.bump(business_profile_count=-1)
+
+
+@receiver(pre_save, sender=Order)
+def remember_order_status(sender, instance, **kwargs):
+    remember_previous_values(instance, ['business_user_id', 'status'])
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    previous = instance._previous_values
+    if not created and previous is not None:
+        if (previous['business_user_id'], previous['status']) == (instance.business_user_id, instance.status):
+            return
+        BusinessOrderStats.bump(previous['business_user_id'], previous['status'], -1)
+    if created or previous is not None:
+        BusinessOrderStats.bump(instance.business_user_id, instance.status, 1)
+
+
+@receiver(post_delete, sender=Order)
+def count_deleted_order(sender, instance, **kwargs):
+    BusinessOrderStats.bump(instance.business_user_id, instance.status, -1)
+
+
+@receiver(pre_save, sender=Offers)
+def stage_offer_image(sender, instance, update_fields=None, **kwargs):
+    """
+    Lagert neu hochgeladene Angebotsbilder lokal zwischen, statt sie im Request in den
+    Media-Storage zu schreiben (`settings.IMAGE_STAGE_UPLOADS`).
+    """
+    stage_upload('offer', instance, update_fields)
+
+
+@receiver(pre_save, sender=UserProfile)
+def stage_profile_image(sender, instance, update_fields=None, **kwargs):
+    """
+    Lagert neu hochgeladene Profilbilder lokal zwischen (siehe `stage_offer_image`).
+    """
+    stage_upload('profile', instance, update_fields)
+
+
+@receiver(post_save, sender=Offers)
+def queue_offer_image(sender, instance, **kwargs):
+    """
+    Plant für neu hochgeladene Angebotsbilder das Erzeugen der Varianten ein (`process_images`).
+    """
+    enqueue_image_task('offer', instance)
+
+
+@receiver(post_save, sender=UserProfile)
+def queue_profile_image(sender, instance, **kwargs):
+    """
+    Plant für neu hochgeladene Profilbilder das Erzeugen der Varianten ein (`process_images`).
+    """
+    enqueue_image_task('profile', instance)
+
+
+# Felder von `User`, die in den Profillisten ausgegeben werden.
+PROFILE_USER_FIELDS = ['username', 'first_name', 'last_name']
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def bump_profiles_version(sender, instance, **kwargs):
+    """
+    Invalidiert die gecachten Profillisten (`CacheVersion` `profiles`).
+    """
+    CacheVersion.bump('profiles')
+
+
+@receiver(pre_save, sender=User)
+def remember_user_names(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(PROFILE_USER_FIELDS):
+        instance._previous_values = {field: getattr(instance, field) for field in PROFILE_USER_FIELDS}
+    else:
+        remember_previous_values(instance, PROFILE_USER_FIELDS)
+
+
+@receiver(post_save, sender=User)
+def bump_profiles_version_for_user(sender, instance, created, **kwargs):
+    """
+    Invalidiert die gecachten Profillisten, wenn sich Benutzername oder Name ändern
+    (nicht z. B. bei `last_login`). Neue Benutzer erscheinen erst mit ihrem Profil.
+    """
+    previous = instance._previous_values
+    if created:
+        return
+    if previous is None or any(previous[field] != getattr(instance, field) for field in PROFILE_USER_FIELDS):
+        CacheVersion.bump('profiles')
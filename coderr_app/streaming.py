@@ -0,0 +1,22 @@
+def around_chunks(content, around):
+    """
+    Liefert die Chunks einer Streaming-Antwort und erzeugt jeden davon innerhalb von `around()`
+    (Kontextmanager-Fabrik).
+
+    Der Inhalt einer `StreamingHttpResponse` wird erst gelesen, nachdem die Middleware bereits
+    zurückgekehrt ist; so kann eine Middleware ihren Zustand (Query-Zähler, Datenbank-Routing) für
+    die dabei laufenden Queries wiederherstellen. Der Kontext wird pro Chunk betreten, da der Server
+    die Chunks nicht zwingend im selben Thread oder Kontext abruft.
+    """
+    iterator = iter(content)
+    try:
+        while True:
+            with around():
+                chunk = next(iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
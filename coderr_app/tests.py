@@ -1,3 +1,1579 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import os
+import random
+import shutil
+import sqlite3
+import struct
+import tempfile
+from bisect import bisect_left
+from datetime import timedelta
+from decimal import Decimal
+from unittest import skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .api.fast_serializer import (
+    FastBusinessProfileSerializer,
+    FastCustomerProfileSerializer,
+    FastOfferListSerializer,
+    FastOrderSerializer,
+    FastReviewSerializer,
+)
+from .api.renderers import FastJSONParser, FastJSONRenderer
+from .api.serializer import (
+    BusinesProfileSerializer,
+    CustomerProfileSerializer,
+    OfferListSerializer,
+    OrderSerializer,
+    ReviewSerializer,
+)
+from .images import variant_path, variants_attname
+from .management.commands.benchmark_json import PARITY_CASES, PARSER_CASES
+from .metrics import QUERY_BUCKETS, ViewMetricsMiddleware, view_metrics
+from .models import (
+    BusinessOrderStats,
+    BusinessRatingStats,
+    ImageTask,
+    OfferDetails,
+    Offers,
+    Order,
+    PlatformStats,
+    PrimaryPin,
+    Review,
+    UserProfile,
+)
+from .replicas import ReplicaRoutingMiddleware, current_routing_state
+from .search import (
+    OFFERS_FTS_TABLE,
+    BaseOfferSearch,
+    IcontainsOfferSearch,
+    PostgresOfferSearch,
+    SQLiteFTS5OfferSearch,
+    get_offer_search,
+)
+
+
+def create_user(username, type):
+    user = User.objects.create_user(username, email=f'{username}@example.com', password=None)
+    UserProfile.objects.create(user=user, email=user.email, type=type)
+    return user
+
+
+def create_offer(user, title='Logo design', prices=(100, 200, 500), delivery_times=(7, 5, 2)):
+    offer = Offers.objects.create(user=user, title=title, description='Offer description')
+    for offer_type, price, delivery_time in zip(['basic', 'standard', 'premium'], prices, delivery_times):
+        OfferDetails.objects.create(
+            offer=offer,
+            title=f'{title} {offer_type}',
+            price=Decimal(price),
+            delivery_time_in_days=delivery_time,
+            revisions=3,
+            features=['Logo', 'Visitenkarte'],
+            offer_type=offer_type,
+        )
+    return offer
+
+
+def png_upload(name='photo.png', size=(2000, 1000), mode='RGB', color='red'):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+def use_temporary_media(test):
+    """
+    Leitet Media-Storage und Staging-Verzeichnis für die Dauer des Tests in temporäre Verzeichnisse um.
+    """
+    media_root, staging_root = tempfile.mkdtemp(), tempfile.mkdtemp()
+    for path in (media_root, staging_root):
+        test.addCleanup(shutil.rmtree, path)
+    overrides = test.settings(MEDIA_ROOT=media_root, IMAGE_STAGING_ROOT=staging_root)
+    overrides.enable()
+    test.addCleanup(overrides.disable)
+    return media_root, staging_root
+
+
+def stored_files(root):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), root)
+        for directory, _, names in os.walk(root) for name in names
+    )
+
+
+def resident_memory():
+    """
+    Aktueller Speicherverbrauch (RSS) des Prozesses in Bytes (Linux).
+    """
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+class OrderExportTests(TestCase):
+    """
+    Streaming-Export der Bestellungen (`ExportMixin`): alle Zeilen bei konstantem Speicherbedarf.
+
+    Die Obergrenze gilt für den Zuwachs des RSS während des Exports; würden die 500k Zeilen
+    materialisiert, wären es mehrere hundert MB.
+    """
+    rows = 500_000
+    memory_ceiling = 32 * 1024 * 1024
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('export-business', 'business')
+        customer = create_user('export-customer', 'customer')
+        offer = create_offer(cls.business)
+        detail = offer.details.get(offer_type='basic')
+        template = Order.objects.create(
+            customer_user=customer,
+            business_user=cls.business,
+            offer=offer,
+            offer_detail=detail,
+            title=detail.title,
+            revisions=detail.revisions,
+            delivery_time_in_days=detail.delivery_time_in_days,
+            price=detail.price,
+            features=detail.features,
+            offer_type=detail.offer_type,
+        )
+        # Kopien der Vorlage in einem Statement statt 500k Modellinstanzen.
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(field.column) for field in Order._meta.concrete_fields if not field.primary_key)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote(Order._meta.db_table)} ({columns}) '
+                f'WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s) '
+                f'SELECT {columns} FROM seq, {quote(Order._meta.db_table)} WHERE id = %s',
+                [cls.rows - 1, template.pk],
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    @skipUnless(os.path.exists('/proc/self/statm'), 'Needs /proc to read the resident set size.')
+    def test_ndjson_export_streams_all_rows_under_memory_ceiling(self):
+        view_metrics.reset()
+        baseline = peak = resident_memory()
+        response = self.client.get('/api/orders/export/', {'export_format': 'ndjson'})
+        lines = 0
+        for number, chunk in enumerate(response.streaming_content):
+            lines += chunk.count(b'\n')
+            if number % 1000 == 0:
+                peak = max(peak, resident_memory())
+        response.close()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(lines, self.rows)
+        self.assertLess(peak - baseline, self.memory_ceiling)
+        # Die Queries beim Lesen des Streams zählen zum Request (`ViewMetricsMiddleware`).
+        self.assertGreaterEqual(view_metrics._views['oders-export', 'GET'].queries.sum, 1)
+
+    def test_csv_export_starts_with_header(self):
+        response = self.client.get('/api/orders/export/', {'export_format': 'csv'})
+        chunks = iter(response.streaming_content)
+        header, first_row = next(chunks), next(chunks)
+        response.close()
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertTrue(header.startswith(b'id,'))
+        self.assertIn(b',100.00,', first_row)
+
+    def test_unknown_export_format_is_rejected(self):
+        response = self.client.get('/api/orders/export/', {'export_format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+
+class PlatformStatsTests(TestCase):
+    """
+    `PlatformStats` wird über Signale mitgezählt und stimmt nach jeder Änderung mit `rebuild` überein.
+    """
+
+    def setUp(self):
+        caches['default'].clear()
+        self.business = create_user('stats-business', 'business')
+        self.customer = create_user('stats-customer', 'customer')
+
+    def assertStats(self, **expected):
+        stats = PlatformStats.load()
+        counted = {field: getattr(stats, field) for field in expected}
+        self.assertEqual(counted, expected)
+        rebuilt = PlatformStats.rebuild()
+        self.assertEqual({field: getattr(rebuilt, field) for field in expected}, expected)
+
+    def test_offers_are_counted(self):
+        offer = create_offer(self.business)
+        create_offer(self.business, title='Second')
+        self.assertStats(offer_count=2)
+
+        offer.delete()
+        self.assertStats(offer_count=1)
+
+    def test_reviews_are_counted_with_their_ratings(self):
+        review = Review.objects.create(business_user=self.business, customer_user=self.customer, rating=5, description='')
+        Review.objects.create(business_user=self.business, customer_user=self.customer, rating=2, description='')
+        self.assertStats(review_count=2, rating_sum=7)
+
+        review.rating = 3
+        review.save()
+        self.assertStats(review_count=2, rating_sum=5)
+
+        review.delete()
+        self.assertStats(review_count=1, rating_sum=2)
+
+    def test_business_profiles_are_counted(self):
+        self.assertStats(business_profile_count=1)
+
+        profile = self.customer.user_profile
+        profile.type = 'business'
+        profile.save()
+        self.assertStats(business_profile_count=2)
+
+        self.business.user_profile.delete()
+        self.assertStats(business_profile_count=1)
+
+    def test_deleting_a_user_cascades_into_the_counters(self):
+        create_offer(self.business)
+        Review.objects.create(business_user=self.business, customer_user=self.customer, rating=4, description='')
+
+        self.business.delete()
+        self.assertStats(offer_count=0, review_count=0, rating_sum=0, business_profile_count=0)
+
+    def test_base_info_reads_the_counters(self):
+        create_offer(self.business)
+        Review.objects.create(business_user=self.business, customer_user=self.customer, rating=4, description='')
+        Review.objects.create(business_user=self.business, customer_user=self.customer, rating=5, description='')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/base-info/')
+        self.assertEqual(response.json(), {
+            'review_count': 2, 'average_rating': 4.5, 'business_profile_count': 1, 'offer_count': 1,
+        })
+
+
+class BusinessOrderStatsTests(TestCase):
+    """
+    `BusinessOrderStats` folgt Anlage, Statuswechsel und Löschen von Bestellungen; die
+    Zähler-Endpunkte lesen daraus.
+    """
+
+    def setUp(self):
+        self.business = create_user('order-stats-business', 'business')
+        self.other = create_user('order-stats-other', 'business')
+        self.customer = create_user('order-stats-customer', 'customer')
+        self.detail = create_offer(self.business).details.get(offer_type='basic')
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def create_order(self, status='in_progress'):
+        return Order.objects.create(
+            customer_user=self.customer,
+            business_user=self.business,
+            offer=self.detail.offer,
+            offer_detail=self.detail,
+            title='Order',
+            delivery_time_in_days=3,
+            price=Decimal('100.00'),
+            features=[],
+            offer_type='basic',
+            status=status,
+        )
+
+    def assertCounts(self, in_progress, completed, cancelled):
+        expected = {'in_progress_count': in_progress, 'completed_count': completed, 'cancelled_count': cancelled}
+        stats = BusinessOrderStats.objects.filter(business_user=self.business).values(*expected).first()
+        self.assertEqual(stats, expected)
+        BusinessOrderStats.rebuild([self.business.pk])
+        rebuilt = BusinessOrderStats.objects.filter(business_user=self.business).values(*expected).first()
+        self.assertEqual(rebuilt or dict.fromkeys(expected, 0), expected)
+
+    def test_create_change_status_and_delete(self):
+        first = self.create_order()
+        self.create_order()
+        self.assertCounts(2, 0, 0)
+
+        first.status = 'completed'
+        first.save()
+        self.assertCounts(1, 1, 0)
+
+        first.title = 'Renamed'
+        first.save()
+        self.assertCounts(1, 1, 0)
+
+        first.delete()
+        self.assertCounts(1, 0, 0)
+
+    def test_status_change_through_the_api(self):
+        order = self.create_order()
+        client = APIClient()
+        client.force_authenticate(self.business)
+
+        response = client.patch(f'/api/orders/{order.pk}/', {'status': 'cancelled'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertCounts(0, 0, 1)
+
+    def test_count_endpoints(self):
+        self.create_order()
+        self.create_order()
+        self.create_order(status='completed')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(f'/api/order-count/{self.business.pk}/').json(), {'order_count': 2})
+        self.assertEqual(
+            self.client.get(f'/api/completed-order-count/{self.business.pk}/').json(),
+            {'completed_order_count': 1},
+        )
+        # Geschäftsnutzer ohne Bestellungen haben noch keine Zeile
+        self.assertEqual(self.client.get(f'/api/order-count/{self.other.pk}/').json(), {'order_count': 0})
+
+        response = self.client.get('/api/order-counts/', {'business_user_ids': f'{self.business.pk},{self.other.pk},{self.customer.pk}'})
+        self.assertEqual(response.json()['results'], [
+            {'business_user_id': self.business.pk, 'in_progress': 2, 'completed': 1, 'cancelled': 0},
+            {'business_user_id': self.other.pk, 'in_progress': 0, 'completed': 0, 'cancelled': 0},
+        ])
+
+    def test_count_of_unknown_or_customer_users(self):
+        self.assertEqual(self.client.get('/api/order-count/999999/').status_code, 404)
+        self.assertEqual(self.client.get(f'/api/order-count/{self.customer.pk}/').status_code, 403)
+
+
+class BusinessRatingStatsTests(TestCase):
+    """
+    `BusinessRatingStats` folgt Anlage, Änderung und Löschen von Bewertungen und stimmt mit
+    `rebuild` überein.
+    """
+    FIELDS = ['review_count', 'rating_sum', 'average_rating', *BusinessRatingStats.STAR_FIELDS.values()]
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE].clear()
+        self.business = create_user('rating-business', 'business')
+        self.other = create_user('rating-other', 'business')
+        self.customer = create_user('rating-customer', 'customer')
+
+    def review(self, rating, business=None):
+        return Review.objects.create(
+            business_user=business or self.business, customer_user=self.customer, rating=rating, description='',
+        )
+
+    def stats(self, business):
+        row = BusinessRatingStats.objects.filter(business_user=business).values(*self.FIELDS).first()
+        return row or {field: 0 for field in self.FIELDS}
+
+    def assertStats(self, business, review_count, rating_sum, stars):
+        expected = {
+            'review_count': review_count,
+            'rating_sum': rating_sum,
+            'average_rating': rating_sum / review_count if review_count else 0.0,
+            **{field: stars.get(star, 0) for star, field in BusinessRatingStats.STAR_FIELDS.items()},
+        }
+        self.assertEqual(self.stats(business), expected)
+        BusinessRatingStats.rebuild()
+        self.assertEqual(self.stats(business), expected)
+
+    def test_create_edit_and_delete(self):
+        first = self.review(5)
+        self.review(4)
+        self.review(4)
+        self.assertStats(self.business, 3, 13, {5: 1, 4: 2})
+
+        first.rating = 1
+        first.save()
+        self.assertStats(self.business, 3, 9, {1: 1, 4: 2})
+
+        first.description = 'Edited'
+        first.save()
+        self.assertStats(self.business, 3, 9, {1: 1, 4: 2})
+
+        first.delete()
+        self.assertStats(self.business, 2, 8, {4: 2})
+
+    def test_moving_a_review_to_another_business(self):
+        review = self.review(3)
+        self.review(5, business=self.other)
+
+        review.business_user = self.other
+        review.save()
+        self.assertStats(self.business, 0, 0, {})
+        self.assertStats(self.other, 2, 8, {3: 1, 5: 1})
+
+    def test_business_profile_list_shows_the_current_stats(self):
+        self.client.force_login(self.customer)
+        self.review(5)
+        self.client.get('/api/profiles/business/')
+        self.review(2)
+
+        profiles = {profile['user']['pk']: profile for profile in self.client.get('/api/profiles/business/').json()['results']}
+        self.assertEqual(profiles[self.business.pk]['review_count'], 2)
+        self.assertEqual(profiles[self.business.pk]['average_rating'], 3.5)
+        self.assertEqual(profiles[self.business.pk]['rating_histogram'], {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1})
+        self.assertEqual(profiles[self.other.pk]['review_count'], 0)
+
+
+class ResponseCacheTests(TestCase):
+    """
+    Versionierter Response-Cache der Profillisten (`VersionedListCacheMixin`): Treffer kosten nur
+    die Versionsabfrage, Schreibzugriffe machen die betroffenen Listen sofort ungültig.
+    """
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE].clear()
+        self.business = create_user('cache-business', 'business')
+        self.customer = create_user('cache-customer', 'customer')
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def profiles(self, path, **params):
+        results = self.client.get(path, params).json()['results']
+        return {profile['user']['pk']: profile for profile in results}
+
+    def assertCached(self, path, **params):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(path, params).status_code, 200)
+
+    def test_repeated_list_is_served_from_the_cache(self):
+        for path in ['/api/profiles/business/', '/api/profiles/customer/']:
+            with self.subTest(path=path):
+                self.client.get(path)
+                self.assertCached(path)
+
+    def test_query_parameters_are_part_of_the_key(self):
+        create_user('cache-business-2', 'business')
+        self.assertEqual(len(self.profiles('/api/profiles/business/')), 2)
+        self.assertEqual(len(self.profiles('/api/profiles/business/', page_size=1)), 1)
+
+    def test_profile_patch_invalidates_the_lists(self):
+        self.profiles('/api/profiles/business/')
+
+        response = self.client.patch(f'/api/profile/{self.business.user_profile.pk}/', {'location': 'Hamburg'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.profiles('/api/profiles/business/')[self.business.pk]['location'], 'Hamburg')
+
+    def test_name_change_invalidates_the_lists(self):
+        self.profiles('/api/profiles/customer/')
+
+        self.customer.first_name = 'Erika'
+        self.customer.save()
+        self.assertEqual(self.profiles('/api/profiles/customer/')[self.customer.pk]['user']['first_name'], 'Erika')
+
+    def test_login_keeps_the_lists_cached(self):
+        self.client.get('/api/profiles/customer/')
+
+        self.customer.last_login = self.customer.date_joined
+        self.customer.save(update_fields=['last_login'])
+        self.assertCached('/api/profiles/customer/')
+
+    def test_review_invalidates_only_the_business_list(self):
+        self.client.get('/api/profiles/business/')
+        self.client.get('/api/profiles/customer/')
+
+        Review.objects.create(business_user=self.business, customer_user=self.customer, rating=4, description='')
+        self.assertEqual(self.profiles('/api/profiles/business/')[self.business.pk]['review_count'], 1)
+        self.assertCached('/api/profiles/customer/')
+
+
+class StreamingMiddlewareTests(TestCase):
+    """
+    Middleware-Zustand (Query-Zähler, Datenbank-Routing) gilt auch beim späteren Lesen von Streams.
+    """
+
+    def streaming_view(self, seen):
+        def chunks():
+            seen.append(current_routing_state.get())
+            User.objects.count()
+            yield b'chunk'
+
+        return lambda request: StreamingHttpResponse(chunks())
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_routing_state_is_restored_while_streaming(self):
+        seen = []
+        response = ReplicaRoutingMiddleware(self.streaming_view(seen))(RequestFactory().get('/'))
+        self.assertEqual(seen, [])
+
+        self.assertEqual(b''.join(response.streaming_content), b'chunk')
+        self.assertIsNotNone(seen[0])
+        self.assertIsNone(current_routing_state.get())
+
+    def test_queries_while_streaming_are_counted(self):
+        view_metrics.reset()
+        response = ViewMetricsMiddleware(self.streaming_view([]))(RequestFactory().get('/'))
+        self.assertEqual(view_metrics._views, {})
+
+        b''.join(response.streaming_content)
+        stats = view_metrics._views['unresolved', 'GET']
+        self.assertEqual(stats.queries.sum, 1)
+        self.assertEqual(stats.size.sum, len(b'chunk'))
+        self.assertEqual(connection.execute_wrappers, [])
+
+
+class ViewMetricsTests(TestCase):
+    """
+    Request-Metriken pro View (`ViewMetricsMiddleware`) und ihre Ausgabe unter `/api/metrics/`.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('metrics-business', 'business')
+        cls.staff = User.objects.create_user('metrics-staff', password=None, is_staff=True)
+        create_offer(cls.business)
+
+    def setUp(self):
+        view_metrics.reset()
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def metrics(self):
+        client = APIClient()
+        client.force_authenticate(self.staff)
+        response = client.get('/api/metrics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        return response.content.decode().splitlines()
+
+    def test_requests_are_counted_per_view_method_and_status(self):
+        self.client.get('/api/offers/')
+        self.client.get('/api/offers/')
+        self.client.get('/api/offers/0/')
+        self.client.get('/api/does-not-exist/')
+
+        self.assertEqual(dict(view_metrics._requests), {
+            ('offers-list', 'GET', 200): 2,
+            ('offers-detail', 'GET', 404): 1,
+            ('unresolved', 'GET', 404): 1,
+        })
+
+    def test_query_count_and_size_match_the_request(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/offers/')
+
+        stats = view_metrics._views['offers-list', 'GET']
+        self.assertEqual((stats.queries.count, stats.queries.sum), (1, len(queries)))
+        self.assertEqual(stats.size.sum, len(response.content))
+        self.assertGreater(stats.db_time.sum, 0)
+        self.assertLessEqual(stats.db_time.sum, stats.latency.sum)
+
+    def test_metrics_require_staff(self):
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+        self.assertEqual(APIClient().get('/api/metrics/').status_code, 401)
+
+    def test_prometheus_output(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/offers/')
+        query_count = len(queries)
+        lines = self.metrics()
+
+        self.assertIn('# TYPE coderr_http_requests_total counter', lines)
+        self.assertIn('coderr_http_requests_total{view="offers-list",method="GET",status="200"} 1', lines)
+        self.assertIn('# TYPE coderr_http_request_db_queries histogram', lines)
+        self.assertIn(f'coderr_http_request_db_queries_sum{{view="offers-list",method="GET"}} {query_count}', lines)
+
+        prefix = 'coderr_http_request_db_queries_bucket{view="offers-list",method="GET",'
+        buckets = [line.removeprefix(prefix) for line in lines if line.startswith(prefix)]
+        self.assertEqual(len(buckets), len(QUERY_BUCKETS) + 1)
+        counts = [int(bucket.split()[-1]) for bucket in buckets]
+        self.assertEqual(counts, sorted(counts))
+        self.assertEqual(buckets[-1], 'le="+Inf"} 1')
+        first = bisect_left(QUERY_BUCKETS, query_count)
+        self.assertEqual(counts[first - 1:first + 1], [0, 1])
+
+    def test_label_values_are_escaped(self):
+        view_metrics.record('a"b\\c', 'GET', 200, 0.01, 1, 0.001, 10)
+
+        self.assertIn('coderr_http_requests_total{view="a\\"b\\\\c",method="GET",status="200"} 1', self.metrics())
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Replikat als Kopie der SQLite-Testdatenbank')
+@override_settings(DATABASE_REPLICAS=['replica1'])
+class ReplicaRoutingTests(TestCase):
+    """
+    Routing zwischen zwei SQLite-Datenbanken: `replica1` ist eine Kopie der leeren Testdatenbank,
+    Lesezugriffe auf dem Replikat sehen die Testdaten der Primärdatenbank also nicht.
+
+    Das Replikat wird erst in `setUpClass` registriert, da der Test-Runner nur Datenbanken aus den
+    Settings anlegt und prüft.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.replica_dir = tempfile.mkdtemp()
+        name = os.path.join(cls.replica_dir, 'replica1.sqlite3')
+        connections['default'].ensure_connection()
+        replica = sqlite3.connect(name)
+        try:
+            connections['default'].connection.backup(replica)
+        finally:
+            replica.close()
+        super().setUpClass()
+        default = connections.settings['default']
+        connections.settings['replica1'] = {**default, 'NAME': name, 'TEST': {**default['TEST'], 'NAME': name}}
+        cls.databases = {*cls.databases, 'replica1'}
+
+    @classmethod
+    def tearDownClass(cls):
+        connections['replica1'].close()
+        del connections['replica1']
+        del connections.settings['replica1']
+        del cls.databases
+        shutil.rmtree(cls.replica_dir)
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('replica-business', 'business')
+        cls.customer = create_user('replica-customer', 'customer')
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE].clear()
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def business_profiles(self, client):
+        with CaptureQueriesContext(connections['replica1']) as replica_queries:
+            response = client.get('/api/profiles/business/')
+        self.assertEqual(response.status_code, 200)
+        return [profile['user']['pk'] for profile in response.json()['results']], len(replica_queries)
+
+    def test_safe_reads_go_to_the_replica(self):
+        profiles, replica_queries = self.business_profiles(self.client_for(self.customer))
+        self.assertEqual(profiles, [])
+        self.assertGreater(replica_queries, 0)
+
+    def test_views_without_the_mixin_read_the_primary(self):
+        with CaptureQueriesContext(connections['replica1']) as replica_queries:
+            response = self.client_for(self.customer).get(f'/api/profile/{self.business.user_profile.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(replica_queries), 0)
+
+    def test_code_outside_requests_reads_the_primary(self):
+        self.assertEqual(UserProfile.objects.count(), 2)
+        self.assertEqual(UserProfile.objects.all().db, 'default')
+
+    def test_writer_reads_own_writes_from_the_primary(self):
+        business = self.client_for(self.business)
+        response = business.patch(f'/api/profile/{self.business.user_profile.pk}/', {'location': 'Hamburg'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserProfile.objects.get(user=self.business).location, 'Hamburg')
+        self.assertTrue(PrimaryPin.objects.filter(user_id=self.business.pk).exists())
+
+        self.assertEqual(self.business_profiles(business), ([self.business.pk], 0))
+        # Andere Benutzer lesen weiter vom Replikat
+        self.assertEqual(self.business_profiles(self.client_for(self.customer))[0], [])
+
+    def test_pin_expires(self):
+        business = self.client_for(self.business)
+        business.patch(f'/api/profile/{self.business.user_profile.pk}/', {'location': 'Hamburg'}, format='json')
+        PrimaryPin.objects.filter(user_id=self.business.pk).update(until=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(self.business_profiles(business)[0], [])
+
+
+class ImageVariantTests(TestCase):
+    """
+    Bildvarianten über `manage.py process_images` mit lokalem Media-Storage (ohne Cloudinary).
+    """
+
+    def setUp(self):
+        self.media_root, _ = use_temporary_media(self)
+        self.business = create_user('variants-business', 'business')
+        self.offer = create_offer(self.business)
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def upload(self, upload):
+        self.offer.image = upload
+        self.offer.save()
+        return self.offer.image.name
+
+    def process_images(self, *args):
+        call_command('process_images', '--once', *args, stdout=io.StringIO())
+        self.offer.refresh_from_db()
+
+    def variant_image(self, variant):
+        from PIL import Image
+
+        with Image.open(os.path.join(self.media_root, self.offer.image_variants[variant])) as image:
+            return image.format, image.mode, image.size
+
+    def test_worker_renders_all_variants(self):
+        source = self.upload(png_upload('logo.png', size=(2000, 1000)))
+        self.assertEqual(ImageTask.objects.get().status, 'pending')
+
+        self.process_images()
+
+        self.assertEqual(ImageTask.objects.get().status, 'done')
+        self.assertEqual(self.offer.image_variants, {
+            'source': source, **{variant: variant_path(source, variant) for variant in settings.IMAGE_VARIANTS},
+        })
+        self.assertEqual(self.variant_image('detail'), ('WEBP', 'RGB', (1600, 800)))
+        self.assertEqual(self.variant_image('list'), ('WEBP', 'RGB', (640, 320)))
+        self.assertEqual(self.variant_image('thumbnail'), ('WEBP', 'RGB', (160, 80)))
+
+    def test_small_images_keep_size_and_alpha(self):
+        self.upload(png_upload('icon.png', size=(120, 60), mode='RGBA', color=(255, 0, 0, 128)))
+        self.process_images()
+
+        self.assertEqual(self.variant_image('detail'), ('WEBP', 'RGBA', (120, 60)))
+        self.assertEqual(self.variant_image('thumbnail'), ('WEBP', 'RGBA', (120, 60)))
+
+    def test_api_returns_the_original_until_variants_exist(self):
+        source = self.upload(png_upload('logo.png'))
+        self.assertTrue(self.client.get(f'/api/offers/{self.offer.pk}/').json()['image'].endswith(source))
+
+        self.process_images()
+        self.assertTrue(self.client.get(f'/api/offers/{self.offer.pk}/').json()['image'].endswith('logo_detail.webp'))
+        self.assertTrue(self.client.get('/api/offers/').json()['results'][0]['image'].endswith('logo_list.webp'))
+
+        replaced = self.upload(png_upload('new.png'))
+        self.assertTrue(self.client.get(f'/api/offers/{self.offer.pk}/').json()['image'].endswith(replaced))
+
+    def test_replaced_variants_are_deleted(self):
+        old = self.upload(png_upload('old.png'))
+        self.process_images()
+        new = self.upload(png_upload('new.png'))
+        self.process_images()
+
+        stored = stored_files(self.media_root)
+        self.assertFalse(any(variant_path(old, variant) in stored for variant in settings.IMAGE_VARIANTS))
+        self.assertTrue(all(variant_path(new, variant) in stored for variant in settings.IMAGE_VARIANTS))
+
+    def test_superseded_task_renders_nothing(self):
+        old = self.upload(png_upload('old.png'))
+        new = self.upload(png_upload('new.png'))
+        self.process_images()
+
+        self.assertEqual(self.offer.image_variants['source'], new)
+        self.assertFalse(any(name.startswith('variants/') and 'old_' in name for name in stored_files(self.media_root)))
+        self.assertEqual(list(ImageTask.objects.values_list('source', 'status')), [(old, 'done'), (new, 'done')])
+
+    def test_backfill_queues_images_without_variants(self):
+        self.upload(png_upload('logo.png'))
+        ImageTask.objects.all().delete()
+
+        self.process_images('--backfill')
+        self.assertIn('detail', self.offer.image_variants)
+
+
+@override_settings(IMAGE_STAGE_UPLOADS=True)
+class ImageUploadStagingTests(TestCase):
+    """
+    Zwischengelagerte Uploads (`settings.IMAGE_STAGE_UPLOADS`): der Request schreibt nur ins lokale
+    Staging-Verzeichnis, erst `process_images` überträgt das Original in den Media-Storage.
+    """
+
+    def setUp(self):
+        self.media_root, self.staging_root = use_temporary_media(self)
+        self.business = create_user('staging-business', 'business')
+        self.profile = self.business.user_profile
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def process_images(self):
+        call_command('process_images', '--once', stdout=io.StringIO())
+
+    def test_request_only_writes_the_staging_directory(self):
+        response = self.client.patch(f'/api/profile/{self.profile.pk}/', {'file': png_upload('me.png')}, format='multipart')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()['file'])
+        self.assertEqual(stored_files(self.media_root), [])
+        self.assertEqual(stored_files(self.staging_root), ['profile/me.png'])
+        task = ImageTask.objects.get()
+        self.assertEqual((task.kind, task.object_id, task.source, task.staged), ('profile', self.profile.pk, '', 'profile/me.png'))
+        self.profile.refresh_from_db()
+        self.assertFalse(self.profile.file)
+
+    def test_worker_writes_the_original_and_variants(self):
+        self.client.patch(f'/api/profile/{self.profile.pk}/', {'file': png_upload('me.png')}, format='multipart')
+        self.process_images()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.file.name, 'profile_img/me.png')
+        self.assertEqual(self.profile.file_variants['source'], 'profile_img/me.png')
+        self.assertEqual(stored_files(self.media_root), sorted([
+            'profile_img/me.png',
+            *(variant_path('profile_img/me.png', variant) for variant in settings.IMAGE_VARIANTS),
+        ]))
+        self.assertEqual(stored_files(self.staging_root), [])
+        task = ImageTask.objects.get()
+        self.assertEqual((task.status, task.source), ('done', 'profile_img/me.png'))
+        self.assertTrue(self.client.get(f'/api/profile/{self.profile.pk}/').json()['file'].endswith('me_detail.webp'))
+
+    def test_previous_image_stays_until_the_worker_ran(self):
+        self.client.patch(f'/api/profile/{self.profile.pk}/', {'file': png_upload('old.png')}, format='multipart')
+        self.process_images()
+
+        self.client.patch(f'/api/profile/{self.profile.pk}/', {'file': png_upload('new.png')}, format='multipart')
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.file.name, 'profile_img/old.png')
+
+        self.process_images()
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.file.name, 'profile_img/new.png')
+        self.assertEqual(self.profile.file_variants['source'], 'profile_img/new.png')
+
+    def test_latest_upload_wins(self):
+        offer = create_offer(self.business)
+        for name in ['first.png', 'second.png']:
+            offer.image = png_upload(name)
+            offer.save()
+        self.process_images()
+
+        offer.refresh_from_db()
+        first, second = (offer.image.field.generate_filename(offer, name) for name in ['first.png', 'second.png'])
+        self.assertEqual(offer.image.name, second)
+        self.assertNotIn(first, stored_files(self.media_root))
+        self.assertEqual(stored_files(self.staging_root), [])
+        self.assertEqual(list(ImageTask.objects.values_list('status', flat=True)), ['done', 'done'])
+
+    def test_unreadable_upload_fails_and_is_discarded(self):
+        self.profile.file = SimpleUploadedFile('broken.png', b'not an image')
+        self.profile.save()
+        self.process_images()
+
+        task = ImageTask.objects.get()
+        self.assertEqual((task.status, task.attempts), ('failed', 1))
+        self.assertEqual(stored_files(self.media_root), [])
+        self.assertEqual(stored_files(self.staging_root), [])
+
+    @override_settings(IMAGE_STAGE_UPLOADS=False)
+    def test_without_staging_the_upload_is_stored_in_the_request(self):
+        self.profile.file = png_upload('me.png')
+        self.profile.save()
+
+        self.assertEqual(stored_files(self.media_root), ['profile_img/me.png'])
+        self.assertEqual(ImageTask.objects.get().source, 'profile_img/me.png')
+
+
+class OfferUpdateTests(TestCase):
+    """
+    Abgleich der Angebotsdetails über `offer_type` (`OffersSerializer.sync_details`).
+    """
+
+    def setUp(self):
+        self.business = create_user('update-business', 'business')
+        self.offer = create_offer(self.business)
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def test_patch_updates_details_in_place(self):
+        detail_ids = set(self.offer.details.values_list('id', flat=True))
+        response = self.client.patch(
+            f'/api/offers/{self.offer.pk}/',
+            {'details': [{'offer_type': 'basic', 'price': '150.00'}]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(self.offer.details.values_list('id', flat=True)), detail_ids)
+        self.assertEqual(self.offer.details.get(offer_type='basic').price, Decimal('150.00'))
+
+    def test_patch_detail_without_offer_type_is_rejected(self):
+        response = self.client.patch(
+            f'/api/offers/{self.offer.pk}/',
+            {'details': [{'price': '150.00'}]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('details', response.json())
+        self.assertEqual(self.offer.details.get(offer_type='basic').price, Decimal('100.00'))
+
+    def test_duplicate_offer_type_is_rejected(self):
+        response = self.client.patch(
+            f'/api/offers/{self.offer.pk}/',
+            {'details': [{'offer_type': 'basic', 'price': '1.00'}, {'offer_type': 'basic', 'price': '2.00'}]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+def encode_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class CursorPaginationTests(TestCase):
+    """
+    Cursor-Modus der Angebots- und Profillisten (`KeysetCursorPagination`).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('cursor-business', 'business')
+        for number in range(5):
+            create_offer(cls.business, title=f'Offer {number}', prices=(10 * (number + 1), 200, 500))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def test_next_cursor_continues_after_last_row(self):
+        first = self.client.get('/api/offers/', {'pagination': 'cursor', 'ordering': 'min_price', 'page_size': 2}).json()
+        second = self.client.get(first['next']).json()
+
+        prices = [offer['min_price'] for offer in first['results'] + second['results']]
+        self.assertEqual(prices, ['10.00', '20.00', '30.00', '40.00'])
+
+    def test_cursor_with_invalid_value_is_not_found(self):
+        cases = [
+            ('/api/offers/', 'min_price'),
+            ('/api/offers/', 'updated_at'),
+            ('/api/profiles/business/', 'average_rating'),
+        ]
+        for path, ordering in cases:
+            with self.subTest(ordering=ordering):
+                response = self.client.get(path, {'ordering': ordering, 'cursor': encode_cursor({'v': 'abc', 'id': 1})})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
+
+    def test_malformed_cursor_is_not_found(self):
+        response = self.client.get('/api/offers/', {'cursor': 'not-base64!'})
+        self.assertEqual(response.status_code, 404)
+
+
+class OrderListTests(TestCase):
+    """
+    Bestellliste (`/api/orders/`): Cursor über beide Rollen (`KeysetCursorPagination.union_page`)
+    und der `role`-Filter.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user('orders-both', 'business')
+        other = create_user('orders-other', 'business')
+        customers = [create_user(f'orders-customer-{number}', 'customer') for number in range(3)]
+        own_detail = create_offer(cls.user).details.get(offer_type='basic')
+        other_detail = create_offer(other).details.get(offer_type='basic')
+        statuses = ['in_progress', 'completed']
+        orders = []
+        for number in range(30):
+            # Abwechselnd als Anbieter, als Kunde und ohne Beteiligung
+            customer, detail = [
+                (customers[number % 3], own_detail),
+                (cls.user, other_detail),
+                (customers[number % 3], other_detail),
+            ][number % 3]
+            orders.append(Order(
+                customer_user=customer,
+                business_user=detail.offer.user,
+                offer=detail.offer,
+                offer_detail=detail,
+                title=f'Order {number}',
+                delivery_time_in_days=3,
+                price=Decimal('100.00'),
+                features=[],
+                offer_type='basic',
+                status=statuses[number % 2],
+            ))
+        Order.objects.bulk_create(orders)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def own_orders(self, **filters):
+        orders = Order.objects.filter(Q(customer_user=self.user) | Q(business_user=self.user), **filters)
+        return list(orders.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def walk(self, params):
+        ids, url = [], '/api/orders/'
+        while url:
+            with self.assertNumQueries(1):
+                page = self.client.get(url, params if url == '/api/orders/' else None).json()
+            ids += [order['id'] for order in page['results']]
+            url = page['next']
+        return ids, page
+
+    def test_pages_merge_both_roles_newest_first(self):
+        ids, _ = self.walk({'page_size': 3})
+        self.assertEqual(ids, self.own_orders())
+        self.assertEqual(len(ids), 20)
+
+    def test_previous_page_returns_the_same_rows(self):
+        first = self.client.get('/api/orders/', {'page_size': 4}).json()
+        second = self.client.get(first['next']).json()
+        previous = self.client.get(second['previous']).json()
+
+        self.assertEqual([order['id'] for order in previous['results']], [order['id'] for order in first['results']])
+
+    def test_status_filter_applies_to_both_roles(self):
+        ids, _ = self.walk({'page_size': 3, 'status': 'completed'})
+        self.assertEqual(ids, self.own_orders(status='completed'))
+
+    def test_role_filter(self):
+        for role, field in [('seller', 'business_user'), ('buyer', 'customer_user')]:
+            with self.subTest(role=role):
+                ids, _ = self.walk({'page_size': 4, 'role': role})
+                self.assertEqual(ids, self.own_orders(**{field: self.user}))
+
+    def test_unknown_role_is_rejected(self):
+        response = self.client.get('/api/orders/', {'role': 'admin'})
+        self.assertEqual(response.status_code, 400)
+
+
+class OfferFacetsTests(TestCase):
+    """
+    Facetten der Angebotsliste (`GET /api/offers/facets/`): Zählungen pro Band und Typ, dieselben
+    Filter wie die Liste, eine Aggregat-Query und Cache pro normalisierter Filterkombination.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('facets-business', 'business')
+        cls.other = create_user('facets-other', 'business')
+        cls.customer = create_user('facets-customer', 'customer')
+        create_offer(cls.business, 'Logo design', prices=(40, 60, 80), delivery_times=(2, 4, 6))
+        create_offer(cls.business, 'Website build', prices=(120, 300, 900), delivery_times=(10, 14, 20))
+        create_offer(cls.other, 'Logo animation', prices=(1500,), delivery_times=(45,))
+        Offers.objects.create(user=cls.other, title='Draft', description='Offer without details')
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def facets(self, **params):
+        response = self.client.get('/api/offers/facets/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_counts_per_band_and_type(self):
+        data = self.facets()
+
+        self.assertEqual(data['count'], 4)
+        self.assertEqual(data['min_price'], [
+            {'min': None, 'max': 50, 'count': 1},
+            {'min': 50, 'max': 100, 'count': 0},
+            {'min': 100, 'max': 250, 'count': 1},
+            {'min': 250, 'max': 500, 'count': 0},
+            {'min': 500, 'max': 1000, 'count': 0},
+            {'min': 1000, 'max': None, 'count': 1},
+        ])
+        self.assertEqual(data['max_delivery_time'], [
+            {'min': None, 'max': 1, 'count': 0},
+            {'min': 2, 'max': 3, 'count': 0},
+            {'min': 4, 'max': 7, 'count': 1},
+            {'min': 8, 'max': 14, 'count': 0},
+            {'min': 15, 'max': 30, 'count': 1},
+            {'min': 31, 'max': None, 'count': 1},
+        ])
+        self.assertEqual(data['offer_type'], {'basic': 3, 'standard': 2, 'premium': 2})
+
+    def test_band_edges_match_the_list_filters(self):
+        create_offer(self.business, 'Edge case', prices=(100,), delivery_times=(7,))
+
+        data = self.facets()
+        self.assertEqual(data['min_price'][2]['count'], 2)
+        self.assertEqual(data['max_delivery_time'][2]['count'], 2)
+
+    def test_facets_apply_the_list_filters(self):
+        for params in [{}, {'min_price': 100}, {'max_delivery_time': 7}, {'search': 'logo'},
+                       {'creator_id': self.other.pk}, {'min_price': 50, 'search': 'logo'}]:
+            with self.subTest(params=params):
+                listed = self.client.get('/api/offers/', {**params, 'page_size': 100}).json()['count']
+                self.assertEqual(self.facets(**params)['count'], listed)
+
+    def test_counts_come_from_one_aggregate_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.facets(min_price=50)
+        offer_queries = [query['sql'] for query in queries if 'coderr_app_offers' in query['sql']]
+        self.assertEqual(len(offer_queries), 1)
+
+    def test_equivalent_requests_share_a_cache_entry(self):
+        self.facets(search='Logo', page=2)
+        create_offer(self.business, 'Logo refresh')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.facets(search='  logo ', ordering='min_price')['count'], 2)
+        self.assertEqual(self.facets(search='logo', min_price=10)['count'], 3)
+
+
+class OfferSearchTests(TestCase):
+    """
+    Volltextsuche der Angebote (`?search=`) über das Backend der Datenbank: FTS5 auf SQLite,
+    `tsvector` auf PostgreSQL.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('search-business', 'business')
+        cls.logo = create_offer(cls.business, title='Logo design')
+        cls.website = Offers.objects.create(
+            user=cls.business, title='Website', description='Includes a logo and hosting',
+        )
+        cls.flyer = Offers.objects.create(user=cls.business, title='Flyer printing', description='Designs for events')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def search(self, term, **params):
+        response = self.client.get('/api/offers/', {'search': term, **params})
+        self.assertEqual(response.status_code, 200)
+        return [offer['title'] for offer in response.json()['results']]
+
+    def test_backend_matches_the_database(self):
+        expected = {'sqlite': SQLiteFTS5OfferSearch, 'postgresql': PostgresOfferSearch}.get(connection.vendor)
+        self.assertIsInstance(get_offer_search(), expected or IcontainsOfferSearch)
+
+    def test_prefix_and_stemmed_matches(self):
+        self.assertEqual(self.search('flye'), ['Flyer printing'])
+        self.assertEqual(self.search('design'), ['Logo design', 'Flyer printing'])
+
+    def test_title_matches_rank_before_description_matches(self):
+        self.assertEqual(self.search('logo'), ['Logo design', 'Website'])
+
+    def test_explicit_ordering_overrides_the_rank(self):
+        self.assertEqual(self.search('logo', ordering='-updated_at'), ['Website', 'Logo design'])
+
+    def test_all_tokens_must_match(self):
+        self.assertEqual(self.search('logo hosting'), ['Website'])
+        self.assertEqual(self.search('logo printing'), [])
+
+    def test_update_reindexes_the_offer(self):
+        Offers.objects.filter(pk=self.flyer.pk).update(title='Poster printing')
+        self.assertEqual(self.search('flyer'), [])
+        self.assertEqual(self.search('poster'), ['Poster printing'])
+
+    def test_deleted_offers_leave_the_index(self):
+        self.website.delete()
+        self.assertEqual(self.search('hosting'), [])
+
+    @skipUnless(connection.vendor == 'sqlite', 'FTS5-Tabelle nur auf SQLite')
+    def test_delete_trigger_removes_the_fts_row(self):
+        self.website.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT rowid FROM {OFFERS_FTS_TABLE} WHERE {OFFERS_FTS_TABLE} MATCH %s', ['hosting'])
+            self.assertEqual(cursor.fetchall(), [])
+
+    def test_empty_or_punctuation_only_query_returns_the_full_list(self):
+        for term in ['', '   ', '!?*"']:
+            with self.subTest(term=term):
+                self.assertEqual(len(self.search(term)), 3)
+        self.assertFalse(get_offer_search().search(Offers.objects.all(), '!?').exists())
+
+    def test_operators_are_searched_as_text(self):
+        self.assertEqual(self.search('logo OR flyer'), [])
+        self.assertEqual(self.search('"logo'), ['Logo design', 'Website'])
+
+    def test_icontains_fallback(self):
+        results = IcontainsOfferSearch().search(Offers.objects.all(), 'logo').order_by('-search_rank', 'id')
+        self.assertEqual([offer.title for offer in results], ['Logo design', 'Website'])
+
+    def test_backends_must_implement_search(self):
+        with self.assertRaises(TypeError):
+            BaseOfferSearch()
+
+
+class HotPathIndexTests(TestCase):
+    """
+    Der Query-Planer nutzt die Indizes aus `Meta.indexes` für die häufigsten Abfragen
+    (nach `ANALYZE` auf einem kleinen Datenbestand).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        businesses = [create_user(f'index-business-{number}', 'business') for number in range(10)]
+        customers = [create_user(f'index-customer-{number}', 'customer') for number in range(50)]
+        cls.business, cls.customer = businesses[0], customers[0]
+        offers = [create_offer(business, title=f'Index offer {number}') for number, business in enumerate(businesses)]
+        details = {offer.pk: offer.details.get(offer_type='basic') for offer in offers}
+        statuses = ['in_progress', 'completed', 'cancelled']
+        Order.objects.bulk_create([
+            Order(
+                customer_user=customers[number % len(customers)],
+                business_user=offer.user,
+                offer=offer,
+                offer_detail=details[offer.pk],
+                title='Order',
+                delivery_time_in_days=3,
+                price=Decimal('100.00'),
+                features=[],
+                offer_type='basic',
+                status=statuses[number % len(statuses)],
+            )
+            for number in range(5000)
+            for offer in [offers[number % len(offers)]]
+        ])
+        Review.objects.bulk_create([
+            Review(business_user=business, customer_user=customer, rating=4, description='Good')
+            for business in businesses
+            for customer in customers
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+
+    def test_open_orders_of_business(self):
+        self.assertUsesIndex(
+            Order.objects.filter(business_user=self.business, status='in_progress').order_by('-created_at'),
+            'order_business_status_idx',
+        )
+
+    def test_orders_of_business_by_date(self):
+        self.assertUsesIndex(
+            Order.objects.filter(business_user=self.business).order_by('-created_at'),
+            'order_business_created_idx',
+        )
+
+    def test_orders_of_customer_by_date(self):
+        self.assertUsesIndex(
+            Order.objects.filter(customer_user=self.customer).order_by('-created_at'),
+            'order_customer_created_idx',
+        )
+
+    def test_order_list_reads_both_roles_by_date(self):
+        client = APIClient()
+        client.force_authenticate(self.business)
+        with CaptureQueriesContext(connection) as queries:
+            client.get('/api/orders/')
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {queries[-1]["sql"]}')
+            plan = '\n'.join(row[-1] for row in cursor.fetchall())
+
+        self.assertIn('order_customer_created_idx', plan)
+        self.assertIn('order_business_created_idx', plan)
+        # Sortiert werden nur die begrenzten Zweige (höchstens 2 × (page_size + 1) Zeilen)
+        self.assertEqual(plan.count('TEMP B-TREE'), 1)
+
+    def test_reviews_of_business_by_update(self):
+        self.assertUsesIndex(
+            Review.objects.filter(business_user=self.business).order_by('-updated_at'),
+            'review_business_updated_idx',
+        )
+
+    def test_offers_of_user_by_update(self):
+        self.assertUsesIndex(
+            Offers.objects.filter(user=self.business).order_by('updated_at'),
+            'offers_user_updated_idx',
+        )
+
+    def test_profile_count_by_type(self):
+        # COUNT der Profillisten (Pagination) bzw. von `PlatformStats.rebuild`
+        self.assertUsesIndex(
+            UserProfile.objects.filter(type='business').order_by().values('pk'),
+            'userprofile_type_location_idx',
+        )
+
+
+class ConditionalGetTests(TestCase):
+    """
+    Conditional GET (`ConditionalGetMixin`): `304 Not Modified`, solange sich weder die Objekte
+    noch die eingebetteten Benutzerdaten geändert haben.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = create_user('conditional-business', 'business')
+        cls.customer = create_user('conditional-customer', 'customer')
+        cls.offer = create_offer(cls.business)
+        create_offer(cls.business, title='Flyer design')
+        Review.objects.create(business_user=cls.business, customer_user=cls.customer, rating=5, description='Great')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def assertNotModified(self, path, params=None):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        repeated = self.client.get(path, params, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(repeated.status_code, 304)
+        self.assertEqual(repeated.content, b'')
+        return response['ETag']
+
+    def test_unchanged_responses_are_not_modified(self):
+        for path, params in [
+            ('/api/offers/', None),
+            ('/api/offers/', {'pagination': 'cursor', 'page_size': 1}),
+            (f'/api/offers/{self.offer.pk}/', None),
+            (f'/api/profile/{self.business.user_profile.pk}/', None),
+            ('/api/reviews/', None),
+        ]:
+            with self.subTest(path=path, params=params):
+                self.assertNotModified(path, params)
+
+    def test_renaming_the_owner_changes_offer_and_profile_etags(self):
+        paths = ['/api/offers/', f'/api/offers/{self.offer.pk}/', f'/api/profile/{self.business.user_profile.pk}/']
+        etags = {path: self.assertNotModified(path) for path in paths}
+        self.business.first_name = 'Renamed'
+        self.business.save()
+
+        for path in paths:
+            with self.subTest(path=path):
+                response = self.client.get(path, HTTP_IF_NONE_MATCH=etags[path])
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('Renamed', response.content.decode())
+                self.assertNotIn('Last-Modified', response)
+
+    def test_updating_an_offer_changes_the_list_etag(self):
+        etag = self.assertNotModified('/api/offers/')
+        response = self.client.patch(f'/api/offers/{self.offer.pk}/', {'title': 'New title'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get('/api/offers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_deleting_an_offer_changes_the_list_etag(self):
+        etag = self.assertNotModified('/api/offers/')
+        Offers.objects.filter(title='Flyer design').delete()
+
+        response = self.client.get('/api/offers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_review_detail_sends_last_modified(self):
+        review = Review.objects.get()
+        response = self.client.get(f'/api/reviews/{review.pk}/')
+        self.assertIn('Last-Modified', response)
+
+        repeated = self.client.get(f'/api/reviews/{review.pk}/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(repeated.status_code, 304)
+
+
+class OfferQueryBudgetTests(TestCase):
+    """
+    Angebotsliste und -detail brauchen unabhängig von der Anzahl der Zeilen gleich viele Queries
+    (`select_related`/`prefetch_related` in `OffersViewSet.get_queryset`).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        businesses = [create_user(f'budget-business-{number}', 'business') for number in range(10)]
+        for number in range(100):
+            create_offer(businesses[number % len(businesses)], title=f'Budget offer {number}')
+        cls.customer = create_user('budget-customer', 'customer')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def test_list_query_budget_is_constant(self):
+        # COUNT, Seite inkl. Ersteller, Details
+        for rows in (1, 10, 100):
+            with self.subTest(rows=rows), self.assertNumQueries(3):
+                response = self.client.get('/api/offers/', {'page_size': rows})
+                self.assertEqual(len(response.json()['results']), rows)
+
+    def test_cursor_list_query_budget_is_constant(self):
+        # Seite inkl. Ersteller, Details
+        for rows in (1, 10, 100):
+            with self.subTest(rows=rows), self.assertNumQueries(2):
+                response = self.client.get('/api/offers/', {'pagination': 'cursor', 'page_size': rows})
+                self.assertEqual(len(response.json()['results']), rows)
+
+    def test_detail_query_budget(self):
+        # Validatoren (Conditional GET), Angebot inkl. Ersteller, Details
+        offer = Offers.objects.first()
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/offers/{offer.pk}/')
+        self.assertEqual(len(response.json()['details']), 3)
+
+
+class RendererParityTests(TestCase):
+    """
+    `FastJSONRenderer`/`FastJSONParser` liefern byte-identische Ergebnisse bzw. dieselben Fehler
+    wie `JSONRenderer`/`JSONParser`.
+    """
+
+    def render(self, renderer, data, media_type=None):
+        try:
+            return renderer.render(data, media_type)
+        except ValueError as exc:
+            return ('ValueError', str(exc))
+
+    def parse(self, parser, body):
+        try:
+            return parser.parse(io.BytesIO(body))
+        except ParseError as exc:
+            return ('ParseError', str(exc.detail))
+
+    def assertSameRendering(self, data, media_type=None):
+        self.assertEqual(
+            self.render(FastJSONRenderer(), data, media_type),
+            self.render(JSONRenderer(), data, media_type),
+        )
+
+    def test_parity_cases(self):
+        for data in PARITY_CASES:
+            with self.subTest(data=data):
+                self.assertSameRendering(data)
+        self.assertSameRendering({'indented': [1.5, 1e16]}, 'application/json; indent=4')
+
+    def test_random_floats(self):
+        rng = random.Random(15)
+        values = [struct.unpack('d', struct.pack('Q', rng.getrandbits(64)))[0] for _ in range(5000)]
+        values += [rng.uniform(0, 5) * 10.0 ** rng.randint(-8, 20) for _ in range(5000)]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertSameRendering({'value': value, 'nested': [value]})
+
+    def test_non_finite_floats_raise_like_drf(self):
+        for value in [float('nan'), float('inf'), float('-inf')]:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                FastJSONRenderer().render({'rating': value})
+
+    def test_decimals_rendered_as_floats(self):
+        # `encoder_class.default` macht aus Decimals Floats, z. B. bei COERCE_DECIMAL_TO_STRING = False
+        for value in [Decimal('12.50'), Decimal('1E+20'), Decimal('0.00001'), Decimal('NaN')]:
+            with self.subTest(value=value):
+                self.assertSameRendering({'price': value})
+
+    def test_parser_cases(self):
+        for body in PARSER_CASES:
+            with self.subTest(body=body):
+                self.assertEqual(self.parse(FastJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_api_response_matches_drf(self):
+        business = create_user('renderer-business', 'business')
+        create_offer(business)
+        client = APIClient()
+        client.force_authenticate(business)
+        response = client.get('/api/offers/')
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+
+class SerializerParityTests(TestCase):
+    """
+    Die schnellen Listen-Serializer (`coderr_app.api.fast_serializer`) erzeugen dasselbe JSON wie
+    ihre `ModelSerializer`.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        businesses = [create_user(f'parity-business-{number}', 'business') for number in range(3)]
+        customers = [create_user(f'parity-customer-{number}', 'customer') for number in range(3)]
+        offers = [create_offer(business, title=f'Parity offer {number}') for number, business in enumerate(businesses)]
+        # Ohne Details bleibt `min_price` leer
+        offers.append(Offers.objects.create(user=businesses[0], title='Without details', description=''))
+
+        # Bilder: keins, Original mit ausstehenden Varianten, Varianten fertig
+        for number, (model, field_name, name, pk) in enumerate(
+            [(Offers, 'image', f'offers/parity-{offer.pk}.jpg', offer.pk) for offer in offers]
+            + [(UserProfile, 'file', f'profile_img/parity-{user.pk}.png', user.user_profile.pk)
+               for user in businesses + customers]
+        ):
+            if number % 3 == 0:
+                continue
+            variants = {} if number % 3 == 1 else {
+                'source': name, **{variant: variant_path(name, variant) for variant in settings.IMAGE_VARIANTS}
+            }
+            model.objects.filter(pk=pk).update(**{field_name: name, variants_attname(field_name): variants})
+
+        for number, customer in enumerate(customers):
+            detail = offers[number].details.get(offer_type='standard')
+            Order.objects.create(
+                customer_user=customer,
+                business_user=detail.offer.user,
+                offer=detail.offer,
+                offer_detail=detail,
+                title=detail.title,
+                delivery_time_in_days=detail.delivery_time_in_days,
+                price=Decimal('199.90'),
+                features=detail.features,
+                offer_type=detail.offer_type,
+                status=['in_progress', 'completed', 'cancelled'][number],
+            )
+            # Der letzte Anbieter bleibt ohne Bewertungen (keine `BusinessRatingStats`)
+            for business in businesses[:2]:
+                Review.objects.create(business_user=business, customer_user=customer, rating=number + 3, description='Gut')
+
+    def assertSameJSON(self, serializer_class, fast_serializer_class, queryset):
+        request = Request(APIRequestFactory().get('/'))
+        objects = list(queryset)
+        expected = JSONRenderer().render(serializer_class(objects, many=True, context={'request': request}).data)
+        actual = JSONRenderer().render(fast_serializer_class(objects, many=True, context={'request': request}).data)
+        self.assertEqual(actual, expected)
+
+    def test_offers(self):
+        self.assertSameJSON(OfferListSerializer, FastOfferListSerializer, Offers.objects.select_related('user'))
+
+    def test_business_profiles(self):
+        profiles = UserProfile.objects.filter(type='business').select_related('user__rating_stats')
+        self.assertSameJSON(BusinesProfileSerializer, FastBusinessProfileSerializer, profiles)
+
+    def test_customer_profiles(self):
+        profiles = UserProfile.objects.filter(type='customer').select_related('user')
+        self.assertSameJSON(CustomerProfileSerializer, FastCustomerProfileSerializer, profiles)
+
+    def test_reviews(self):
+        self.assertSameJSON(ReviewSerializer, FastReviewSerializer, Review.objects.all())
+
+    def test_orders(self):
+        self.assertSameJSON(OrderSerializer, FastOrderSerializer, Order.objects.all())
+
+
+class ProfileQueryBudgetTests(TestCase):
+    """
+    Geschäfts- und Kundenprofil-Listen brauchen unabhängig von der Seitengröße gleich viele
+    Queries (Benutzer und Bewertungsübersicht per `select_related`).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for number in range(100):
+            create_user(f'profile-business-{number:03}', 'business')
+            create_user(f'profile-customer-{number:03}', 'customer')
+        business = User.objects.get(username='profile-business-000')
+        customer = User.objects.get(username='profile-customer-000')
+        Review.objects.create(business_user=business, customer_user=customer, rating=4, description='Good')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def assertQueryBudget(self, path, params, queries, rows):
+        # Cache-Miss: Versionen aus `CacheVersion` plus die Queries der Liste
+        caches[settings.RESPONSE_CACHE].clear()
+        with self.assertNumQueries(queries):
+            response = self.client.get(path, params)
+        self.assertEqual(len(response.json()['results']), rows)
+        # Cache-Treffer: nur die Versionen
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(path, params).json(), response.json())
+
+    def test_list_query_budget_is_constant(self):
+        # Versionen, COUNT, Seite inkl. Benutzer (und Bewertungsübersicht)
+        for path in ['/api/profiles/business/', '/api/profiles/customer/']:
+            for rows in (1, 10, 100):
+                with self.subTest(path=path, rows=rows):
+                    self.assertQueryBudget(path, {'page_size': rows}, 3, rows)
+        self.assertQueryBudget('/api/profiles/business/', {'ordering': '-average_rating', 'page_size': 100}, 3, 100)
+
+    def test_cursor_list_query_budget_is_constant(self):
+        # Versionen, Seite inkl. Benutzer (und Bewertungsübersicht)
+        for path in ['/api/profiles/business/', '/api/profiles/customer/']:
+            for rows in (1, 10, 100):
+                with self.subTest(path=path, rows=rows):
+                    self.assertQueryBudget(path, {'pagination': 'cursor', 'page_size': rows}, 2, rows)
+
+    def test_top_rated_business_comes_first(self):
+        caches[settings.RESPONSE_CACHE].clear()
+        response = self.client.get('/api/profiles/business/', {'ordering': '-average_rating'})
+        first = response.json()['results'][0]
+        self.assertEqual(first['user']['username'], 'profile-business-000')
@@ -16,7 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from user_auth_app.api.views import RegistrationView,CustomLoginView
+from user_auth_app.api.views import RegistrationView,CustomLoginView,UserImportJobView,UserImportView
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -25,7 +25,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('coderr_app.api.urls')),
     path('api/registration/', RegistrationView.as_view(), name='registration-detail'),
-    path('api/login/', CustomLoginView.as_view(), name='login')
+    path('api/login/', CustomLoginView.as_view(), name='login'),
+    path('api/users/import/', UserImportView.as_view(), name='user-import'),
+    path('api/users/import/<int:pk>/', UserImportJobView.as_view(), name='user-import-job'),
 ]
 
 
@@ -0,0 +1,14 @@
+# Gunicorn reads this file automatically when started from the project root
+# (e.g. `gunicorn coderr_project.wsgi`).
+
+# Import Django, the apps and the URLconf once in the master process; workers are forked afterwards
+# and start serving immediately instead of each paying the full import cost.
+# No database connection is opened during setup, so nothing is shared across the fork.
+preload_app = True
+
+
+def when_ready(server):
+    # The URLconf (views, serializers, DRF) is otherwise imported lazily by the first request of each worker
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
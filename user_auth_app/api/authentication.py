@@ -0,0 +1,62 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+
+def token_cache_key(key):
+    """
+    Cache-Key für ein Token. Der Token-Wert selbst wird nur gehasht abgelegt.
+    """
+    return 'auth:token:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def get_token_cache():
+    return caches[settings.AUTH_TOKEN_CACHE]
+
+
+def invalidate_tokens(*keys):
+    """
+    Entfernt die angegebenen Tokens aus dem Auth-Cache.
+    """
+    if keys:
+        get_token_cache().delete_many([token_cache_key(key) for key in keys])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token-Authentifizierung mit Cache für Token → Benutzer → Profil.
+
+    **Details**:
+    - Bei einem Cache-Miss werden Token, Benutzer und `user_profile` mit einer einzigen Query
+      geladen und für `settings.AUTH_TOKEN_CACHE_TTL` Sekunden im Cache
+      `settings.AUTH_TOKEN_CACHE` abgelegt (begrenzt über dessen `MAX_ENTRIES`).
+    - Bei einem Cache-Treffer laufen Authentifizierung und Rollenprüfung
+      (`IsBusinessUser`, `IsCustomer`) ohne Datenbankzugriff.
+    - Beim Löschen von Tokens sowie beim Ändern von Benutzern und Profilen werden nur die
+      Einträge der betroffenen Tokens gelöscht (siehe `user_auth_app.signals`).
+    - Mit dem prozesslokalen Standard-Backend sehen andere Worker eine Invalidierung erst nach
+      Ablauf der (kurzen) TTL; mit einem gemeinsamen Backend (`AUTH_TOKEN_CACHE_BACKEND`,
+      z. B. Redis oder Memcached) sofort.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = get_token_cache()
+        cache_key = token_cache_key(key)
+
+        token = cache.get(cache_key)
+        if token is None:
+            try:
+                token = Token.objects.select_related('user', 'user__user_profile').get(key=key)
+            except Token.DoesNotExist:
+                raise AuthenticationFailed(_('Invalid token.'))
+            cache.set(cache_key, token, settings.AUTH_TOKEN_CACHE_TTL)
+
+        if not token.user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
@@ -1,6 +1,7 @@
 from rest_framework import serializers
-from coderr_app.models import UserProfile
+from coderr_app.models import UserImportJob, UserProfile
 from django.contrib.auth.models import User
+from user_auth_app.provisioning import FORMATS
 
 class RegistrationSerializer(serializers.ModelSerializer):
     repeated_password = serializers.CharField(write_only=True)
@@ -40,4 +41,24 @@ class RegistrationSerializer(serializers.ModelSerializer):
         account.save()
 
         UserProfile.objects.create(user=account,email=email,type=type)
-        return account
\ No newline at end of file
+        return account
+
+
+class UserImportSerializer(serializers.Serializer):
+    """
+    Eingabe für `UserImportView`: die Importdatei, optional ihr Format (sonst aus der Dateiendung)
+    und `dry_run` für eine reine Validierung.
+    """
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=FORMATS, required=False)
+    dry_run = serializers.BooleanField(default=False)
+
+
+class UserImportJobSerializer(serializers.ModelSerializer):
+    """
+    Stand eines `UserImportJob` ohne die Datensätze selbst.
+    """
+
+    class Meta:
+        model = UserImportJob
+        fields = ['id', 'status', 'rows', 'report', 'error', 'created_at', 'updated_at']
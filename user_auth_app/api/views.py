@@ -1,8 +1,16 @@
+import codecs
+from itertools import islice
+
+from django.conf import settings
+from django.urls import reverse
 from rest_framework import generics
 from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
-from .serializers import RegistrationSerializer
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser
+from coderr_app.models import UserImportJob
+from .serializers import RegistrationSerializer, UserImportJobSerializer, UserImportSerializer
+from user_auth_app.provisioning import InvalidImportFile, format_for_name, parse_records, provision_users
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.authtoken.serializers import AuthTokenSerializer
@@ -52,3 +60,64 @@ class CustomLoginView(APIView):
             return Response(data, status=status.HTTP_200_OK)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UserImportView(APIView):
+    """
+    Staff-API für den Massenimport von Benutzern (`POST /api/users/import/`, multipart).
+
+    **Felder**:
+    - `file`: CSV- oder NDJSON-Datei wie bei `manage.py import_users`.
+    - `file_format`: `csv` oder `ndjson` (optional, sonst aus der Dateiendung).
+    - `dry_run`: Nur validieren.
+
+    **Details**:
+    - Die Datei wird im Request nur gelesen und als `UserImportJob` eingereiht (202 mit `Location`
+      auf `UserImportJobView`); Hashing und Anlegen übernimmt `manage.py process_user_imports`.
+    - `dry_run` validiert sofort (ohne Hashing) und antwortet mit dem Bericht (`ProvisioningReport`).
+    - Angenommen werden höchstens `settings.USER_IMPORT_API_MAX_ROWS` Datensätze; größere Importe
+      laufen über `manage.py import_users`.
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        serializer = UserImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        file_format = serializer.validated_data.get('file_format') or format_for_name(upload.name)
+        if file_format is None:
+            raise ValidationError({'file_format': 'Cannot infer the format from the file name.'})
+
+        max_rows = settings.USER_IMPORT_API_MAX_ROWS
+        try:
+            records = list(islice(parse_records(codecs.iterdecode(upload, 'utf-8-sig'), file_format), max_rows + 1))
+        except InvalidImportFile as exc:
+            raise ValidationError({'file': str(exc)})
+        if len(records) > max_rows:
+            raise ValidationError({'file': f'At most {max_rows} records per request; use manage.py import_users.'})
+
+        if serializer.validated_data['dry_run']:
+            report = provision_users(records, batch_size=settings.USER_IMPORT_BATCH_SIZE, dry_run=True)
+            return Response(report.as_dict(max_errors=100), status=status.HTTP_200_OK)
+
+        job = UserImportJob.objects.create(created_by=request.user, records=records, rows=len(records))
+        location = reverse('user-import-job', args=[job.pk])
+        return Response(
+            UserImportJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={'Location': request.build_absolute_uri(location)},
+        )
+
+
+class UserImportJobView(generics.RetrieveAPIView):
+    """
+    Stand eines Imports aus `UserImportView` (`GET /api/users/import/<id>/`, nur Staff).
+
+    **Felder**:
+    - `status`: `pending`, `processing`, `done` oder `failed`.
+    - `report`: Zählungen, die ersten 100 Fehler und der Durchsatz, sobald der Import erledigt ist.
+    """
+    permission_classes = [IsAdminUser]
+    queryset = UserImportJob.objects.defer('records')
+    serializer_class = UserImportJobSerializer
@@ -0,0 +1,68 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from coderr_app.api.permissions import IsBusinessUser
+from coderr_app.models import UserProfile
+from user_auth_app.api.authentication import CachedTokenAuthentication, invalidate_tokens
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Vergleicht Authentifizierung + Rollenprüfung (`IsBusinessUser`) pro Request zwischen
+    `TokenAuthentication` und `CachedTokenAuthentication` (Queries und Laufzeit).
+
+    Die Testdaten werden in einer Transaktion angelegt und anschließend zurückgerollt.
+    """
+    help = 'Benchmark per-request auth + permission cost of TokenAuthentication vs CachedTokenAuthentication.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user('benchmark-auth-user', password=None)
+                UserProfile.objects.create(user=user, type='business')
+                token = Token.objects.create(user=user)
+                for authentication_class in [TokenAuthentication, CachedTokenAuthentication]:
+                    self.run(authentication_class, token.key, options['requests'])
+                invalidate_tokens(token.key)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, authentication_class, key, count):
+        factory = APIRequestFactory()
+        permission = IsBusinessUser()
+
+        def authenticate():
+            request = Request(
+                factory.post('/', HTTP_AUTHORIZATION=f'Token {key}'),
+                authenticators=[authentication_class()],
+            )
+            assert permission.has_permission(request, None)
+
+        authenticate()  # Cache aufwärmen
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(count):
+                authenticate()
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{authentication_class.__name__:<28} '
+            f'{len(queries) / count:.2f} queries/request  '
+            f'{elapsed / count * 1e6:.1f} µs/request'
+        )
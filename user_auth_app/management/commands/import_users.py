@@ -0,0 +1,82 @@
+import os
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from user_auth_app.provisioning import FORMATS, InvalidImportFile, format_for_name, parse_records, provision_users
+
+
+class Command(BaseCommand):
+    """
+    Importiert Benutzer samt Profil und Token aus einer CSV- oder NDJSON-Datei (siehe `provision_users`).
+
+    **Felder** (Spalten bzw. JSON-Schlüssel):
+    - Pflicht: `username`, `email`, `type` (`business` oder `customer`).
+    - Optional: `password` (ohne Passwort wird ein unbenutzbares Passwort gesetzt), `first_name`,
+      `last_name`, `location`, `tel`, `description`, `working_hours`.
+
+    **Optionen**:
+    - `--format`: `csv` oder `ndjson`; standardmäßig aus der Dateiendung abgeleitet. `-` liest von stdin.
+    - `--batch-size`: Datensätze pro Batch (`settings.USER_IMPORT_BATCH_SIZE`).
+    - `--workers`: Prozesse für das Passwort-Hashing (Standard: Anzahl der CPUs).
+    - `--dry-run`: Nur validieren, nichts anlegen.
+    - `--max-errors`: Anzahl der ausgegebenen Fehlerzeilen.
+    """
+    help = 'Bulk-import users, profiles and tokens from a CSV or NDJSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or NDJSON file ("-" for stdin).')
+        parser.add_argument('--format', choices=FORMATS, help='Input format (default: from the file extension).')
+        parser.add_argument('--batch-size', type=int, default=settings.USER_IMPORT_BATCH_SIZE)
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Password hashing processes (1 hashes in this process).')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only, create nothing.')
+        parser.add_argument('--max-errors', type=int, default=50, help='Number of failed rows to print.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or format_for_name(path)
+        if file_format is None:
+            raise CommandError('Cannot infer the format from the file name; pass --format.')
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--batch-size and --workers must be at least 1.')
+
+        try:
+            if path == '-':
+                sys.stdin.reconfigure(encoding='utf-8-sig', newline='')
+                report = self.provision(sys.stdin, file_format, options)
+            else:
+                with open(path, encoding='utf-8-sig', newline='') as lines:
+                    report = self.provision(lines, file_format, options)
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+        except InvalidImportFile as exc:
+            raise CommandError(f'Invalid import file: {exc}')
+
+        for line, message in report.errors[:options['max_errors']]:
+            self.stderr.write(f'line {line}: {message}')
+        if len(report.errors) > options['max_errors']:
+            self.stderr.write(f'... {len(report.errors) - options["max_errors"]} more failed rows')
+
+        timings = ', '.join(f'{phase} {seconds:.2f} s' for phase, seconds in report.timings.items())
+        verb = 'Validated' if options['dry_run'] else 'Created'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {report.created} of {report.rows} users in {report.seconds:.2f} s '
+            f'({report.users_per_second:.0f} users/s; {timings}); {len(report.errors)} failed.'
+        ))
+
+    def provision(self, lines, file_format, options):
+        return provision_users(
+            parse_records(lines, file_format),
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            dry_run=options['dry_run'],
+            on_batch=self.progress if options['verbosity'] else None,
+        )
+
+    def progress(self, report):
+        self.stdout.write(
+            f'{report.rows} rows, {report.created} created, {len(report.errors)} failed '
+            f'({report.users_per_second:.0f} users/s)'
+        )
@@ -0,0 +1,65 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from user_auth_app.provisioning import claim_import_jobs, password_hasher, run_import_job
+
+
+class Command(BaseCommand):
+    """
+    Hintergrund-Worker für Benutzerimporte über `POST /api/users/import/` (`UserImportJob`).
+
+    **Optionen**:
+    - `--once`: Arbeitet die Warteschlange ab und beendet sich, statt auf neue Aufträge zu warten.
+    - `--workers`: Prozesse für das Passwort-Hashing (`settings.USER_IMPORT_WORKERS`).
+    - `--poll-interval`: Wartezeit in Sekunden, wenn keine Aufträge offen sind.
+
+    **Details**:
+    - Der Prozesspool für das Hashing wird einmal beim Start angelegt und für alle Aufträge genutzt.
+    - Mehrere Worker können parallel laufen (siehe `claim_import_jobs`).
+    - Beendet sich nach SIGTERM/SIGINT, sobald der laufende Auftrag abgeschlossen ist.
+    """
+    help = 'Run user imports queued through POST /api/users/import/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty.')
+        parser.add_argument('--workers', type=int, default=settings.USER_IMPORT_WORKERS,
+                            help='Password hashing processes (1 hashes in this process).')
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1:
+            raise CommandError('--workers must be at least 1.')
+
+        self.stopping = False
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+
+        counts = {'done': 0, 'failed': 0}
+        with password_hasher(options['workers']) as hash_passwords:
+            while not self.stopping:
+                close_old_connections()
+                jobs = claim_import_jobs(1)
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+                for job in jobs:
+                    run_import_job(job, hash_passwords, batch_size=settings.USER_IMPORT_BATCH_SIZE)
+                    counts[job.status] += 1
+                    if job.status == 'failed':
+                        self.stdout.write(f'{job}: {job.error}')
+                    elif options['verbosity'] >= 2:
+                        self.stdout.write(
+                            f'{job}: {job.report["created"]} created, {job.report["failed"]} failed '
+                            f'in {job.report["seconds"]:.2f} s'
+                        )
+
+        self.stdout.write(self.style.SUCCESS(f'Ran {counts["done"]} import(s), {counts["failed"]} failed.'))
+
+    def stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,326 @@
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import timedelta
+from itertools import islice
+from multiprocessing import get_context
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from coderr_app.models import CacheVersion, PlatformStats, UserImportJob, UserProfile
+
+FORMATS = ('csv', 'ndjson')
+PROVISIONED_TYPES = ('business', 'customer')
+REQUIRED_FIELDS = ('username', 'email', 'type')
+USER_FIELDS = ('first_name', 'last_name')
+PROFILE_FIELDS = ('location', 'tel', 'description', 'working_hours')
+
+
+class InvalidImportFile(ValueError):
+    """
+    Die Importdatei kann nicht gelesen werden (Kodierung, CSV-Syntax, fehlende Spalten).
+    """
+
+
+def format_for_name(name):
+    """
+    Leitet das Format aus der Dateiendung ab (`.csv`, `.ndjson`/`.jsonl`), sonst `None`.
+    """
+    suffix = name.rpartition('.')[2].lower()
+    return {'csv': 'csv', 'ndjson': 'ndjson', 'jsonl': 'ndjson'}.get(suffix)
+
+
+def parse_records(lines, file_format):
+    """
+    Liest Benutzerzeilen aus `lines` (Iterable von Textzeilen) und liefert `(zeilennummer, datensatz)`.
+
+    **Details**:
+    - CSV: Kopfzeile mit mindestens `username`, `email` und `type`; leere Zellen gelten als fehlend.
+    - NDJSON: ein JSON-Objekt pro Zeile; nicht lesbare Zeilen werden mit `None` geliefert und bei
+      der Validierung als Fehler gemeldet, der Import läuft weiter.
+    - Lese- und Kodierungsfehler der Datei lösen `InvalidImportFile` aus.
+    """
+    try:
+        if file_format == 'csv':
+            reader = csv.DictReader(lines)
+            missing = [field for field in REQUIRED_FIELDS if field not in (reader.fieldnames or [])]
+            if missing:
+                raise InvalidImportFile(f'Missing CSV columns: {", ".join(missing)}.')
+            for row in reader:
+                yield reader.line_num, {key: value.strip() for key, value in row.items() if key and value and value.strip()}
+        elif file_format == 'ndjson':
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError:
+                    yield line_number, None
+        else:
+            raise InvalidImportFile(f'Unknown format {file_format!r} (expected one of: {", ".join(FORMATS)}).')
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise InvalidImportFile(str(exc)) from exc
+
+
+def validate_record(record):
+    """
+    Prüft einen einzelnen Datensatz ohne Datenbankzugriff und liefert die Fehlermeldung oder `None`.
+    """
+    if not isinstance(record, dict):
+        return 'Not a JSON object.'
+    for field in REQUIRED_FIELDS:
+        if not isinstance(record.get(field), str) or not record[field].strip():
+            return f'{field}: This field is required.'
+    if record['type'] not in PROVISIONED_TYPES:
+        return f'type: Must be one of {", ".join(PROVISIONED_TYPES)}.'
+    try:
+        User.username_validator(record['username'])
+        validate_email(record['email'])
+    except ValidationError as exc:
+        return '; '.join(exc.messages)
+    for model, fields in ((User, ('username', 'email', *USER_FIELDS)), (UserProfile, PROFILE_FIELDS)):
+        for field in fields:
+            value = record.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                return f'{field}: Must be a string.'
+            max_length = model._meta.get_field(field).max_length
+            if max_length and len(value) > max_length:
+                return f'{field}: Ensure this field has no more than {max_length} characters.'
+    password = record.get('password')
+    if password is not None and not isinstance(password, str):
+        return 'password: Must be a string.'
+    return None
+
+
+@contextmanager
+def password_hasher(workers):
+    """
+    Liefert eine Funktion, die eine Liste von Passwörtern mit `make_password` hasht.
+
+    Mit mehr als einem Worker läuft das Hashing (PBKDF2, CPU-gebunden) in einem Prozesspool.
+    Die Prozesse werden per `spawn` gestartet, erben also weder Datenbankverbindungen noch Threads
+    des aufrufenden Prozesses. Fehlende Passwörter ergeben ein unbenutzbares Passwort ohne Hashing.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) if workers > 1 else None
+
+    def hash_passwords(passwords):
+        hashes = [make_password(None) if password is None else None for password in passwords]
+        pending = [index for index, password in enumerate(passwords) if password is not None]
+        values = [passwords[index] for index in pending]
+        if pool is None:
+            hashed = map(make_password, values)
+        else:
+            hashed = pool.map(make_password, values, chunksize=max(1, len(values) // (workers * 4)))
+        for index, value in zip(pending, hashed):
+            hashes[index] = value
+        return hashes
+
+    try:
+        yield hash_passwords
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+class ProvisioningReport:
+    """
+    Ergebnis eines Imports: angelegte Benutzer, Fehler pro Zeile und Laufzeit pro Phase.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.created = 0
+        self.errors = []
+        self.timings = {'validate': 0.0, 'hash': 0.0, 'insert': 0.0}
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @property
+    def seconds(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def users_per_second(self):
+        return self.created / self.seconds if self.seconds else 0.0
+
+    def add_error(self, line, message):
+        self.errors.append((line, message))
+
+    def as_dict(self, max_errors=None):
+        return {
+            'rows': self.rows,
+            'created': self.created,
+            'failed': len(self.errors),
+            'errors': [{'line': line, 'error': message} for line, message in self.errors[:max_errors]],
+            'seconds': round(self.seconds, 3),
+            'users_per_second': round(self.users_per_second, 1),
+            'timings': {phase: round(seconds, 3) for phase, seconds in self.timings.items()},
+        }
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def provision_users(records, batch_size=1000, workers=1, dry_run=False, on_batch=None, hash_passwords=None):
+    """
+    Legt Benutzer samt `UserProfile` und `Token` aus `records` (`(zeilennummer, datensatz)`, siehe
+    `parse_records`) in Batches an.
+
+    **Details**:
+    - Pro Batch prüfen zwei Queries die Eindeutigkeit von Benutzername und E-Mail gegen die
+      Datenbank; Duplikate innerhalb der Datei werden über Mengen erkannt (die erste Zeile gewinnt).
+    - Angelegt wird mit je einem `bulk_create` für Benutzer, Profile und Tokens in einer Transaktion;
+      schlägt ein Batch fehl (z. B. parallele Registrierung desselben Namens), werden seine Zeilen als
+      Fehler gemeldet und der Import läuft weiter.
+    - `bulk_create` löst keine Signale aus, daher werden `PlatformStats` und die Version der
+      Profillisten pro Batch in derselben Transaktion nachgezogen.
+    - `dry_run` validiert nur (inkl. Datenbankabgleich), ohne zu hashen oder zu schreiben.
+    - `on_batch(report)` wird nach jedem Batch aufgerufen, z. B. für Fortschrittsausgaben.
+    - `hash_passwords` übergibt eine bereits offene Funktion aus `password_hasher`, z. B. den Pool
+      eines langlebigen Workers; sonst wird für diesen Aufruf ein Pool mit `workers` Prozessen gestartet.
+    """
+    report = ProvisioningReport()
+    seen_usernames, seen_emails = set(), set()
+
+    hasher = nullcontext(hash_passwords) if hash_passwords is not None else password_hasher(workers)
+    with hasher as hash_passwords:
+        for batch in batched(records, batch_size):
+            report.rows += len(batch)
+            started = time.perf_counter()
+            valid = []
+            for line, record in batch:
+                error = validate_record(record)
+                if error is None and record['username'] in seen_usernames:
+                    error = 'username: Duplicate username in the import file.'
+                if error is None and record['email'] in seen_emails:
+                    error = 'email: Duplicate email in the import file.'
+                if error is not None:
+                    report.add_error(line, error)
+                    continue
+                seen_usernames.add(record['username'])
+                seen_emails.add(record['email'])
+                valid.append((line, record))
+
+            taken_usernames = set(User.objects.filter(
+                username__in=[record['username'] for _, record in valid],
+            ).values_list('username', flat=True))
+            taken_emails = set(User.objects.filter(
+                email__in=[record['email'] for _, record in valid],
+            ).values_list('email', flat=True))
+            new = []
+            for line, record in valid:
+                if record['username'] in taken_usernames:
+                    report.add_error(line, 'username: This username is already taken.')
+                elif record['email'] in taken_emails:
+                    report.add_error(line, 'email: A user with this email already exists.')
+                else:
+                    new.append((line, record))
+            report.timings['validate'] += time.perf_counter() - started
+
+            if new and not dry_run:
+                started = time.perf_counter()
+                hashes = hash_passwords([record.get('password') for _, record in new])
+                report.timings['hash'] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                try:
+                    create_users([record for _, record in new], hashes)
+                except DatabaseError as exc:
+                    for line, _ in new:
+                        report.add_error(line, f'Batch rolled back: {exc}')
+                else:
+                    report.created += len(new)
+                report.timings['insert'] += time.perf_counter() - started
+            elif dry_run:
+                report.created += len(new)
+
+            if on_batch is not None:
+                on_batch(report)
+
+    report.finished = time.perf_counter()
+    return report
+
+
+@transaction.atomic
+def create_users(records, hashes):
+    users = User.objects.bulk_create([
+        User(
+            username=record['username'],
+            email=record['email'],
+            password=password,
+            **{field: record[field] for field in USER_FIELDS if field in record},
+        )
+        for record, password in zip(records, hashes)
+    ])
+    UserProfile.objects.bulk_create([
+        UserProfile(
+            user=user,
+            email=record['email'],
+            type=record['type'],
+            **{field: record[field] for field in PROFILE_FIELDS if field in record},
+        )
+        for user, record in zip(users, records)
+    ])
+    Token.objects.bulk_create([Token(key=Token.generate_key(), user=user) for user in users])
+    PlatformStats.bump(business_profile_count=sum(record['type'] == 'business' for record in records))
+    CacheVersion.bump('profiles')
+
+
+def claim_import_jobs(limit):
+    """
+    Beansprucht bis zu `limit` offene oder hängengebliebene (älter als
+    `settings.USER_IMPORT_JOB_TIMEOUT`) `UserImportJob`s, wie `coderr_app.images.claim_tasks`.
+    """
+    stale = timezone.now() - timedelta(seconds=settings.USER_IMPORT_JOB_TIMEOUT)
+    candidates = UserImportJob.objects.filter(
+        Q(status='pending') | Q(status='processing', updated_at__lt=stale)
+    ).order_by('id').values_list('pk', 'status', 'updated_at')[:limit]
+
+    claimed = [
+        pk for pk, status, updated_at in candidates
+        if UserImportJob.objects.filter(pk=pk, status=status, updated_at=updated_at).update(
+            status='processing', updated_at=timezone.now()
+        )
+    ]
+    return list(UserImportJob.objects.filter(pk__in=claimed))
+
+
+def run_import_job(job, hash_passwords, batch_size=1000):
+    """
+    Führt einen beanspruchten `UserImportJob` aus und speichert den Bericht im Auftrag.
+
+    **Details**:
+    - Fehler einzelner Zeilen stehen im Bericht; bricht der Import selbst ab, wird der Auftrag als
+      `failed` markiert und nicht wiederholt (bereits angelegte Batches bleiben bestehen).
+    - Ein von einem abgestürzten Worker übernommener Auftrag meldet die schon angelegten Benutzer
+      als vergeben.
+    - Die Datensätze (mit Klartext-Passwörtern) werden in beiden Fällen gelöscht.
+    """
+    try:
+        report = provision_users(
+            ((line, record) for line, record in job.records),
+            batch_size=batch_size,
+            hash_passwords=hash_passwords,
+        )
+    except Exception as exc:
+        job.status, job.error = 'failed', f'{type(exc).__name__}: {exc}'
+    else:
+        job.status, job.report = 'done', report.as_dict(max_errors=100)
+    job.records = []
+    job.save(update_fields=['status', 'report', 'error', 'records', 'updated_at'])
+    return job
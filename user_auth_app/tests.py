@@ -1,3 +1,228 @@
-from django.test import TestCase
+import io
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from coderr_app.models import PlatformStats, UserImportJob, UserProfile
+from .api.authentication import CachedTokenAuthentication, get_token_cache, token_cache_key
+from .provisioning import InvalidImportFile, parse_records, provision_users
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """
+    Auth-Cache (`CachedTokenAuthentication`): Treffer ohne Query, Invalidierung nur der
+    Einträge des geänderten Benutzers.
+    """
+
+    def setUp(self):
+        get_token_cache().clear()
+        self.user = User.objects.create_user('auth-business', password=None)
+        self.profile = UserProfile.objects.create(user=self.user, type='business')
+        self.key = Token.objects.create(user=self.user).key
+        self.authentication = CachedTokenAuthentication()
+
+    def authenticate(self, key=None):
+        user, _ = self.authentication.authenticate_credentials(key or self.key)
+        return user
+
+    def test_cache_hit_runs_no_queries(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            # Rollenprüfung (`IsBusinessUser`) über das mitgeladene Profil
+            self.assertEqual(user.user_profile.type, 'business')
+
+    def test_other_users_writes_keep_the_entry(self):
+        self.authenticate()
+        other = User.objects.create_user('auth-customer', password=None)
+        UserProfile.objects.create(user=other, type='customer')
+        other_key = Token.objects.create(user=other).key
+        self.authenticate(other_key)
+        other.last_name = 'Renamed'
+        other.save()
+
+        self.assertIsNotNone(get_token_cache().get(token_cache_key(self.key)))
+        self.assertIsNone(get_token_cache().get(token_cache_key(other_key)))
+        with self.assertNumQueries(0):
+            self.authenticate()
+
+    def test_profile_change_invalidates_the_entry(self):
+        self.authenticate()
+        self.profile.type = 'customer'
+        self.profile.save()
+
+        self.assertIsNone(get_token_cache().get(token_cache_key(self.key)))
+        self.assertEqual(self.authenticate().user_profile.type, 'customer')
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleted_token_is_rejected(self):
+        self.authenticate()
+        Token.objects.get(key=self.key).delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+def ndjson(*lines):
+    return '\n'.join(lines) + '\n'
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class ProvisioningTests(TestCase):
+    """
+    Massenimport (`parse_records`, `provision_users`): Lesen, Validierung und Anlegen.
+    """
+
+    def provision(self, text, file_format='ndjson', **kwargs):
+        return provision_users(parse_records(io.StringIO(text), file_format), **kwargs)
+
+    def test_parse_csv_skips_empty_cells(self):
+        text = 'username,email,type,location\nanna,anna@example.com,business,\nben,ben@example.com,customer,Berlin\n'
+        self.assertEqual(list(parse_records(io.StringIO(text), 'csv')), [
+            (2, {'username': 'anna', 'email': 'anna@example.com', 'type': 'business'}),
+            (3, {'username': 'ben', 'email': 'ben@example.com', 'type': 'customer', 'location': 'Berlin'}),
+        ])
+
+    def test_parse_csv_without_required_columns(self):
+        with self.assertRaisesMessage(InvalidImportFile, 'Missing CSV columns: type.'):
+            list(parse_records(io.StringIO('username,email\nanna,anna@example.com\n'), 'csv'))
+
+    def test_parse_ndjson_reports_unreadable_lines(self):
+        text = ndjson('{"username": "anna"}', '', '{broken')
+        self.assertEqual(list(parse_records(io.StringIO(text), 'ndjson')), [(1, {'username': 'anna'}), (3, None)])
+
+    def test_creates_users_profiles_and_tokens(self):
+        report = self.provision(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "business", "password": "secret-123"}',
+            '{"username": "ben", "email": "ben@example.com", "type": "customer", "location": "Berlin"}',
+        ))
+
+        self.assertEqual((report.rows, report.created, report.errors), (2, 2, []))
+        anna = User.objects.get(username='anna')
+        self.assertTrue(anna.check_password('secret-123'))
+        self.assertFalse(User.objects.get(username='ben').has_usable_password())
+        self.assertEqual(UserProfile.objects.get(user__username='ben').location, 'Berlin')
+        self.assertEqual(Token.objects.filter(user__username__in=['anna', 'ben']).count(), 2)
+        self.assertEqual(PlatformStats.load().business_profile_count, 1)
+
+    def test_duplicate_rows_in_the_file(self):
+        report = self.provision(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "business"}',
+            '{"username": "anna", "email": "other@example.com", "type": "business"}',
+            '{"username": "ben", "email": "anna@example.com", "type": "customer"}',
+        ), batch_size=2)
+
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.errors, [
+            (2, 'username: Duplicate username in the import file.'),
+            (3, 'email: Duplicate email in the import file.'),
+        ])
+
+    def test_username_or_email_already_taken(self):
+        User.objects.create_user('anna', email='anna@example.com')
+        report = self.provision(ndjson(
+            '{"username": "anna", "email": "new@example.com", "type": "business"}',
+            '{"username": "ben", "email": "anna@example.com", "type": "customer"}',
+            '{"username": "carl", "email": "carl@example.com", "type": "customer"}',
+        ))
+
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.errors, [
+            (1, 'username: This username is already taken.'),
+            (2, 'email: A user with this email already exists.'),
+        ])
+        self.assertTrue(User.objects.filter(username='carl').exists())
+
+    def test_invalid_rows_are_reported(self):
+        report = self.provision(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "staff"}',
+            '{"username": "ben", "type": "customer"}',
+            'not json',
+        ))
+
+        self.assertEqual(report.created, 0)
+        self.assertEqual([line for line, _ in report.errors], [1, 2, 3])
+
+    def test_dry_run_creates_nothing(self):
+        report = self.provision(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "business"}',
+        ), dry_run=True)
+
+        self.assertEqual(report.created, 1)
+        self.assertFalse(User.objects.filter(username='anna').exists())
+        self.assertEqual(report.timings['hash'], 0.0)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, USER_IMPORT_API_MAX_ROWS=3)
+class UserImportApiTests(TestCase):
+    """
+    `POST /api/users/import/`: Einreihen als `UserImportJob`, Dry-Run und Zeilenlimit.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('staff', is_staff=True))
+
+    def upload(self, text, **data):
+        return self.client.post('/api/users/import/', {
+            'file': SimpleUploadedFile('users.ndjson', text.encode()), **data,
+        }, format='multipart')
+
+    def test_import_is_queued_and_run_by_the_worker(self):
+        response = self.upload(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "business", "password": "secret-123"}',
+            '{"username": "anna", "email": "other@example.com", "type": "customer"}',
+        ))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual((response.data['status'], response.data['rows']), ('pending', 2))
+        self.assertFalse(User.objects.filter(username='anna').exists())
+
+        call_command('process_user_imports', '--once', '--workers', '1', stdout=io.StringIO())
+
+        job = self.client.get(response['Location'])
+        self.assertEqual(job.data['status'], 'done')
+        self.assertEqual((job.data['report']['created'], job.data['report']['failed']), (1, 1))
+        self.assertTrue(User.objects.get(username='anna').check_password('secret-123'))
+        self.assertEqual(UserImportJob.objects.get(pk=response.data['id']).records, [])
+
+    def test_dry_run_reports_without_queueing(self):
+        response = self.upload(ndjson(
+            '{"username": "anna", "email": "anna@example.com", "type": "business"}',
+        ), dry_run=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['failed']), (1, 0))
+        self.assertFalse(UserImportJob.objects.exists())
+        self.assertFalse(User.objects.filter(username='anna').exists())
+
+    def test_rejects_files_over_the_row_limit(self):
+        response = self.upload(ndjson(*(
+            f'{{"username": "user{i}", "email": "user{i}@example.com", "type": "customer"}}' for i in range(4)
+        )))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('At most 3 records', str(response.data['file']))
+        self.assertFalse(UserImportJob.objects.exists())
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(User.objects.create_user('customer'))
+        response = self.upload(ndjson('{"username": "anna", "email": "anna@example.com", "type": "business"}'))
+
+        self.assertEqual(response.status_code, 403)